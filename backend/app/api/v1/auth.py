@@ -4,16 +4,16 @@
 로그인, 회원가입, 토큰 갱신 등의 인증 기능을 제공합니다.
 """
 
-from datetime import datetime, timedelta
+import asyncio
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import exists, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import security
-from app.core.config import settings
-from app.core.dependencies import get_current_user, get_db
+from app.core.dependencies import get_current_user, get_db, invalidate_user_cache
 from app.utils.logger import logger, log_audit
 from app.models.user import User
 from app.schemas.user import (
@@ -25,6 +25,9 @@ from app.schemas.user import (
 
 router = APIRouter()
 
+# 존재하지 않는 사용자 로그인 시 검증에 사용할 더미 해시
+_DUMMY_PASSWORD_HASH = security.get_password_hash("not-a-real-password")
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -44,28 +47,28 @@ async def register(
     Raises:
         HTTPException: 이메일/사용자명이 이미 존재하는 경우
     """
-    # 이메일 중복 확인
+    # 이메일/사용자명 중복 확인 (한 번의 쿼리로 두 제약을 모두 확인)
     result = await db.execute(
-        db.query(User).filter(User.email == user_data.email)
+        select(User.email, User.username)
+        .where(or_(User.email == user_data.email, User.username == user_data.username))
+        .limit(2)
     )
-    if result.scalar_one_or_none():
+    conflicts = result.all()
+    
+    if any(row.email == user_data.email for row in conflicts):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # 사용자명 중복 확인
-    result = await db.execute(
-        db.query(User).filter(User.username == user_data.username)
-    )
-    if result.scalar_one_or_none():
+    if conflicts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
     
     # 비밀번호 해싱
-    hashed_password = security.get_password_hash(user_data.password)
+    hashed_password = await asyncio.to_thread(security.get_password_hash, user_data.password)
     
     # 사용자 생성
     db_user = User(
@@ -130,7 +133,13 @@ async def login(
     user = result.scalar_one_or_none()
     
     # 사용자 확인 및 비밀번호 검증
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    # 사용자가 없어도 더미 해시로 검증하여 응답 시간으로 계정 존재 여부가 드러나지 않도록 함
+    hashed_password = user.hashed_password if user else _DUMMY_PASSWORD_HASH
+    password_ok = await asyncio.to_thread(
+        security.verify_password, form_data.password, hashed_password
+    )
+    
+    if not user or not password_ok:
         logger.warning(f"로그인 실패: {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -145,12 +154,8 @@ async def login(
             detail="Inactive user"
         )
     
-    # 액세스 토큰 생성
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = security.create_access_token(
-        subject=str(user.id),
-        expires_delta=access_token_expires
-    )
+    # 액세스 토큰 생성 (기본 만료 기간 사용)
+    access_token = security.create_access_token(subject=str(user.id))
     
     # 감사 로그
     log_audit(
@@ -207,12 +212,8 @@ async def refresh_token(
             detail="User not found or inactive"
         )
     
-    # 새 액세스 토큰 생성
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = security.create_access_token(
-        subject=str(user.id),
-        expires_delta=access_token_expires
-    )
+    # 새 액세스 토큰 생성 (기본 만료 기간 사용)
+    access_token = security.create_access_token(subject=str(user.id))
     
     logger.info(f"토큰 갱신: {user.username}")
     
@@ -263,20 +264,22 @@ async def update_user_me(
         UserResponse: 수정된 사용자 정보
     """
     # 수정 사항 적용
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
     
     # 비밀번호 변경
     if "password" in update_data:
-        hashed_password = security.get_password_hash(update_data["password"])
+        hashed_password = await asyncio.to_thread(
+            security.get_password_hash, update_data["password"]
+        )
         update_data["hashed_password"] = hashed_password
         del update_data["password"]
     
     # 이메일 변경 시 중복 확인
     if "email" in update_data and update_data["email"] != current_user.email:
         result = await db.execute(
-            db.query(User).filter(User.email == update_data["email"])
+            select(exists().where(User.email == update_data["email"]))
         )
-        if result.scalar_one_or_none():
+        if result.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
@@ -285,9 +288,9 @@ async def update_user_me(
     # 사용자명 변경 시 중복 확인
     if "username" in update_data and update_data["username"] != current_user.username:
         result = await db.execute(
-            db.query(User).filter(User.username == update_data["username"])
+            select(exists().where(User.username == update_data["username"]))
         )
-        if result.scalar_one_or_none():
+        if result.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken"
@@ -297,11 +300,12 @@ async def update_user_me(
     for field, value in update_data.items():
         setattr(current_user, field, value)
     
-    current_user.updated_at = datetime.utcnow()
-    
     await db.commit()
     await db.refresh(current_user)
     
+    # 변경 전 사용자 정보가 캐시에서 재사용되지 않도록 제거
+    invalidate_user_cache(current_user.id)
+    
     # 감사 로그
     log_audit(
         action="user_update",
@@ -340,6 +344,9 @@ async def logout(
     Returns:
         dict: 로그아웃 메시지
     """
+    # 캐시된 토큰 검증 결과 제거
+    invalidate_user_cache(current_user.id)
+    
     # 감사 로그
     log_audit(
         action="user_logout",
@@ -9,13 +9,17 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
 
+import numpy as np
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks, Query
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from redis.exceptions import RedisError
+from sqlalchemy import select, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-import io
 
 from app.utils.logger import logger
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
+from app.db.redis import redis_client
 from app.services.benchmark_service import benchmark_service
 from app.schemas.benchmark import (
     BenchmarkCreate,
@@ -26,7 +30,9 @@ from app.schemas.benchmark import (
     TestCaseUpload
 )
 from app.models.benchmark import Benchmark as BenchmarkModel
-from app.core.dependencies import get_current_user
+from app.models.test_case import TestCase as TestCaseModel
+from app.models.user import User
+from app.core.dependencies import get_current_user, now_utc
 
 # API 라우터 생성
 router = APIRouter(
@@ -38,6 +44,19 @@ router = APIRouter(
     }
 )
 
+# IN 절 하나에 담을 최대 테스트 케이스 ID 수
+_TEST_CASE_BATCH_SIZE = 1000
+
+# 완료된 벤치마크 결과 캐시 유지 시간 (초)
+_RESULT_CACHE_TTL_SECONDS = 3600
+
+# 내보내기 형식별 미디어 타입
+_EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "html": "text/html"
+}
+
 
 @router.get("/", response_model=BenchmarkListResponse)
 async def list_benchmarks(
@@ -59,46 +78,58 @@ async def list_benchmarks(
         BenchmarkListResponse: 벤치마크 목록
     """
     try:
-        # 쿼리 구성
-        query = db.query(BenchmarkModel)
+        # 쿼리 구성 (목록에 필요한 컬럼만 조회하고, 윈도우 함수로 전체 개수를 함께 조회)
+        stmt = select(
+            BenchmarkModel.id,
+            BenchmarkModel.name,
+            BenchmarkModel.description,
+            BenchmarkModel.status,
+            BenchmarkModel.pipeline_count,
+            BenchmarkModel.total_queries,
+            BenchmarkModel.created_at,
+            BenchmarkModel.completed_at,
+            BenchmarkModel.duration_seconds,
+            func.count().over().label("total")
+        )
         
         # 상태 필터 적용
         if status:
-            query = query.filter(BenchmarkModel.status == status)
-        
-        # 최신순 정렬
-        query = query.order_by(BenchmarkModel.created_at.desc())
+            stmt = stmt.where(BenchmarkModel.status == status)
         
-        # 페이지네이션 적용
-        query = query.offset(skip).limit(limit)
+        # 최신순 정렬 및 페이지네이션 적용
+        stmt = stmt.order_by(BenchmarkModel.created_at.desc()).offset(skip).limit(limit)
         
         # 쿼리 실행
-        result = await db.execute(query)
-        benchmarks = result.scalars().all()
+        result = await db.execute(stmt)
+        rows = result.all()
         
         # 전체 개수 조회
-        count_query = db.query(BenchmarkModel)
-        if status:
-            count_query = count_query.filter(BenchmarkModel.status == status)
-        
-        total_result = await db.execute(count_query.count())
-        total_count = total_result.scalar()
+        if rows:
+            total_count = rows[0].total
+        elif skip:
+            # 범위를 벗어난 페이지는 윈도우 결과가 없으므로 별도 COUNT 수행
+            count_stmt = select(func.count()).select_from(BenchmarkModel)
+            if status:
+                count_stmt = count_stmt.where(BenchmarkModel.status == status)
+            total_count = (await db.execute(count_stmt)).scalar_one()
+        else:
+            total_count = 0
         
         # 응답 구성
-        items = []
-        for benchmark in benchmarks:
-            item = {
-                "id": str(benchmark.id),
-                "name": benchmark.name,
-                "description": benchmark.description,
-                "status": benchmark.status,
-                "pipeline_count": len(benchmark.config.get("pipeline_ids", [])),
-                "total_queries": benchmark.total_queries,
-                "created_at": benchmark.created_at,
-                "completed_at": benchmark.completed_at,
-                "duration_seconds": benchmark.duration_seconds
+        items = [
+            {
+                "id": str(row.id),
+                "name": row.name,
+                "description": row.description,
+                "status": row.status,
+                "pipeline_count": row.pipeline_count or 0,
+                "total_queries": row.total_queries,
+                "created_at": row.created_at,
+                "completed_at": row.completed_at,
+                "duration_seconds": row.duration_seconds
             }
-            items.append(item)
+            for row in rows
+        ]
         
         return BenchmarkListResponse(
             items=items,
@@ -120,7 +151,7 @@ async def create_benchmark(
     benchmark_data: BenchmarkCreate,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
     새 벤치마크 생성 및 실행
@@ -135,9 +166,6 @@ async def create_benchmark(
         Dict[str, Any]: 생성된 벤치마크 정보
     """
     try:
-        # 벤치마크 ID 생성
-        benchmark_id = str(uuid.uuid4())
-        
         # 벤치마크 설정 생성
         config = BenchmarkConfig(
             pipeline_ids=benchmark_data.pipeline_ids,
@@ -165,27 +193,26 @@ async def create_benchmark(
         
         # 데이터베이스 모델 생성
         db_benchmark = BenchmarkModel(
-            id=benchmark_id,
             name=benchmark_data.name,
             description=benchmark_data.description,
             status="running",
-            config=config.dict(),
+            config=config.model_dump(),
+            pipeline_count=len(benchmark_data.pipeline_ids),
             total_queries=len(test_cases) * len(benchmark_data.pipeline_ids),
-            created_by=current_user.get("id") if current_user else None,
-            created_at=datetime.utcnow()
+            created_by=current_user.id if current_user else None
         )
         
-        # 데이터베이스 저장
+        # 데이터베이스 저장 (ID는 컬럼 기본값으로 생성)
         db.add(db_benchmark)
         await db.commit()
+        benchmark_id = str(db_benchmark.id)
         
         # 백그라운드에서 벤치마크 실행
         background_tasks.add_task(
             _run_benchmark_task,
             benchmark_id,
             config,
-            test_cases,
-            db
+            test_cases
         )
         
         logger.info(f"벤치마크 생성 및 실행 시작: {benchmark_id}")
@@ -209,7 +236,7 @@ async def create_benchmark(
 
 @router.get("/{benchmark_id}", response_model=BenchmarkResult)
 async def get_benchmark_result(
-    benchmark_id: str,
+    benchmark_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
 ) -> BenchmarkResult:
     """
@@ -223,9 +250,14 @@ async def get_benchmark_result(
         BenchmarkResult: 벤치마크 결과
     """
     try:
+        # 캐시 조회 (완료된 벤치마크는 결과가 변하지 않음)
+        cached = await _get_cached_result(str(benchmark_id))
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        
         # 데이터베이스에서 조회
         result = await db.execute(
-            db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id)
+            select(BenchmarkModel).where(BenchmarkModel.id == benchmark_id)
         )
         benchmark = result.scalar_one_or_none()
         
@@ -244,8 +276,12 @@ async def get_benchmark_result(
                 "created_at": benchmark.created_at
             }
         
-        # 결과 반환
-        return BenchmarkResult(**benchmark.result)
+        # 결과 반환 (완료된 결과만 캐싱)
+        benchmark_result = BenchmarkResult.model_validate(benchmark.result)
+        if benchmark.status == "completed":
+            await _cache_result(str(benchmark_id), benchmark.result)
+        
+        return benchmark_result
         
     except HTTPException:
         raise
@@ -259,9 +295,10 @@ async def get_benchmark_result(
 
 @router.get("/{benchmark_id}/export")
 async def export_benchmark_result(
-    benchmark_id: str,
+    benchmark_id: uuid.UUID,
     format: str = Query(default="json", enum=["json", "csv", "html"]),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    now: datetime = Depends(now_utc)
 ):
     """
     벤치마크 결과 내보내기
@@ -270,6 +307,7 @@ async def export_benchmark_result(
         benchmark_id: 벤치마크 ID
         format: 출력 형식
         db: 데이터베이스 세션
+        now: 요청 시각
         
     Returns:
         파일 응답
@@ -277,7 +315,7 @@ async def export_benchmark_result(
     try:
         # 벤치마크 조회
         result = await db.execute(
-            db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id)
+            select(BenchmarkModel).where(BenchmarkModel.id == benchmark_id)
         )
         benchmark = result.scalar_one_or_none()
         
@@ -293,32 +331,26 @@ async def export_benchmark_result(
                 detail="벤치마크 결과가 아직 생성되지 않았습니다."
             )
         
-        # 결과 객체 생성
-        benchmark_result = BenchmarkResult(**benchmark.result)
-        
-        # 결과 내보내기
-        exported_content = await benchmark_service.export_results(
-            benchmark_result,
-            format=format
-        )
-        
         # 파일명 생성
-        filename = f"benchmark_{benchmark_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{format}"
+        filename = f"benchmark_{benchmark_id}_{now.strftime('%Y%m%d_%H%M%S')}.{format}"
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
         
-        # 응답 생성
+        # JSON은 저장된 결과를 그대로 직렬화 (모델 재구성 생략)
         if format == "json":
-            media_type = "application/json"
-        elif format == "csv":
-            media_type = "text/csv"
-        elif format == "html":
-            media_type = "text/html"
+            return Response(
+                content=orjson.dumps(benchmark.result),
+                media_type=_EXPORT_MEDIA_TYPES[format],
+                headers=headers
+            )
+        
+        # 결과 객체 생성
+        benchmark_result = BenchmarkResult.model_validate(benchmark.result)
         
+        # 결과를 조각 단위로 스트리밍
         return StreamingResponse(
-            io.StringIO(exported_content),
-            media_type=media_type,
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
+            benchmark_service.export_results(benchmark_result, format=format),
+            media_type=_EXPORT_MEDIA_TYPES[format],
+            headers=headers
         )
         
     except HTTPException:
@@ -347,21 +379,35 @@ async def upload_test_cases(
         Dict[str, Any]: 업로드 결과
     """
     try:
-        # 테스트 케이스 저장
-        saved_cases = []
-        
-        for case in test_case_data.test_cases:
-            # TODO: 데이터베이스에 테스트 케이스 저장
-            saved_cases.append({
+        # 테스트 케이스 일괄 저장 (executemany로 왕복 최소화)
+        values = [
+            {
                 "query_id": case.query_id,
                 "query": case.query,
-                "query_type": case.query_type
-            })
+                "query_type": case.query_type,
+                "expected_answer": case.expected_answer,
+                "test_metadata": case.metadata or {}
+            }
+            for case in test_case_data.test_cases
+        ]
+        
+        if values:
+            await db.execute(insert(TestCaseModel), values)
+            await db.commit()
+        
+        saved_cases = [
+            {
+                "query_id": value["query_id"],
+                "query": value["query"],
+                "query_type": value["query_type"]
+            }
+            for value in values[:10]
+        ]
         
         return {
             "message": "테스트 케이스가 성공적으로 업로드되었습니다.",
-            "total_cases": len(saved_cases),
-            "cases": saved_cases[:10]  # 처음 10개만 반환
+            "total_cases": len(values),
+            "cases": saved_cases  # 처음 10개만 반환
         }
         
     except Exception as e:
@@ -406,7 +452,7 @@ async def generate_test_cases(
 
 @router.delete("/{benchmark_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_benchmark(
-    benchmark_id: str,
+    benchmark_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -419,7 +465,7 @@ async def delete_benchmark(
     try:
         # 벤치마크 조회
         result = await db.execute(
-            db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id)
+            select(BenchmarkModel).where(BenchmarkModel.id == benchmark_id)
         )
         benchmark = result.scalar_one_or_none()
         
@@ -439,6 +485,7 @@ async def delete_benchmark(
         # 데이터베이스에서 삭제
         await db.delete(benchmark)
         await db.commit()
+        await _invalidate_cached_result(str(benchmark_id))
         
         logger.info(f"벤치마크 삭제 완료: {benchmark_id}")
         
@@ -454,8 +501,8 @@ async def delete_benchmark(
 
 @router.get("/compare/{benchmark_id_1}/{benchmark_id_2}", response_model=Dict[str, Any])
 async def compare_benchmarks(
-    benchmark_id_1: str,
-    benchmark_id_2: str,
+    benchmark_id_1: uuid.UUID,
+    benchmark_id_2: uuid.UUID,
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -470,16 +517,15 @@ async def compare_benchmarks(
         Dict[str, Any]: 비교 결과
     """
     try:
-        # 두 벤치마크 조회
-        result1 = await db.execute(
-            db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id_1)
-        )
-        benchmark1 = result1.scalar_one_or_none()
-        
-        result2 = await db.execute(
-            db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id_2)
+        # 두 벤치마크를 한 번에 조회
+        result = await db.execute(
+            select(BenchmarkModel).where(
+                BenchmarkModel.id.in_([benchmark_id_1, benchmark_id_2])
+            )
         )
-        benchmark2 = result2.scalar_one_or_none()
+        benchmarks = {row.id: row for row in result.scalars()}
+        benchmark1 = benchmarks.get(benchmark_id_1)
+        benchmark2 = benchmarks.get(benchmark_id_2)
         
         if not benchmark1 or not benchmark2:
             raise HTTPException(
@@ -511,27 +557,33 @@ async def compare_benchmarks(
         }
         
         # 공통 파이프라인 찾기
-        pipelines1 = set(benchmark1.result.get("metrics", {}).keys())
-        pipelines2 = set(benchmark2.result.get("metrics", {}).keys())
-        common_pipelines = pipelines1.intersection(pipelines2)
-        
-        for pipeline_id in common_pipelines:
-            metrics1 = benchmark1.result["metrics"][pipeline_id]
-            metrics2 = benchmark2.result["metrics"][pipeline_id]
+        metrics1 = benchmark1.result.get("metrics", {})
+        metrics2 = benchmark2.result.get("metrics", {})
+        pipelines1 = set(metrics1.keys())
+        pipelines2 = set(metrics2.keys())
+        common_pipelines = list(pipelines1.intersection(pipelines2))
+        
+        if common_pipelines:
+            # 메트릭 벡터를 구성하여 한 번에 비교
+            lat1 = _metric_vector(metrics1, common_pipelines, "latency_ms", "mean")
+            lat2 = _metric_vector(metrics2, common_pipelines, "latency_ms", "mean")
+            rs1 = _metric_vector(metrics1, common_pipelines, "retrieval_score", "mean")
+            rs2 = _metric_vector(metrics2, common_pipelines, "retrieval_score", "mean")
+            sr1 = _metric_vector(metrics1, common_pipelines, "success_rate")
+            sr2 = _metric_vector(metrics2, common_pipelines, "success_rate")
             
-            comparison["pipeline_comparison"][pipeline_id] = {
-                "latency_improvement": (
-                    (metrics2["latency_ms"]["mean"] - metrics1["latency_ms"]["mean"]) 
-                    / metrics1["latency_ms"]["mean"] * 100
-                ),
-                "retrieval_score_improvement": (
-                    (metrics2["retrieval_score"]["mean"] - metrics1["retrieval_score"]["mean"]) 
-                    / metrics1["retrieval_score"]["mean"] * 100
-                ),
-                "success_rate_difference": metrics2["success_rate"] - metrics1["success_rate"]
-            }
-        
-        comparison["common_pipelines"] = list(common_pipelines)
+            latency_improvement = _percent_change(lat1, lat2)
+            retrieval_improvement = _percent_change(rs1, rs2)
+            success_rate_difference = (sr2 - sr1).tolist()
+            
+            for i, pipeline_id in enumerate(common_pipelines):
+                comparison["pipeline_comparison"][pipeline_id] = {
+                    "latency_improvement": latency_improvement[i],
+                    "retrieval_score_improvement": retrieval_improvement[i],
+                    "success_rate_difference": success_rate_difference[i]
+                }
+        
+        comparison["common_pipelines"] = common_pipelines
         comparison["unique_to_benchmark_1"] = list(pipelines1 - pipelines2)
         comparison["unique_to_benchmark_2"] = list(pipelines2 - pipelines1)
         
@@ -549,6 +601,61 @@ async def compare_benchmarks(
 
 # 헬퍼 함수들
 
+def _result_cache_key(benchmark_id: str) -> str:
+    """벤치마크 결과 캐시 키"""
+    return f"bench:{benchmark_id}"
+
+
+async def _get_cached_result(benchmark_id: str) -> Optional[bytes]:
+    """캐시된 벤치마크 결과 조회 (Redis 오류 시 캐시 미스로 처리)"""
+    try:
+        return await redis_client.get(_result_cache_key(benchmark_id))
+    except RedisError as e:
+        logger.warning(f"벤치마크 결과 캐시 조회 실패: {str(e)}")
+        return None
+
+
+async def _cache_result(benchmark_id: str, result: Dict[str, Any]) -> None:
+    """완료된 벤치마크 결과를 JSON 바이트로 캐싱"""
+    try:
+        await redis_client.set(
+            _result_cache_key(benchmark_id),
+            orjson.dumps(result),
+            ex=_RESULT_CACHE_TTL_SECONDS
+        )
+    except RedisError as e:
+        logger.warning(f"벤치마크 결과 캐시 저장 실패: {str(e)}")
+
+
+async def _invalidate_cached_result(benchmark_id: str) -> None:
+    """캐시된 벤치마크 결과 제거"""
+    try:
+        await redis_client.delete(_result_cache_key(benchmark_id))
+    except RedisError as e:
+        logger.warning(f"벤치마크 결과 캐시 삭제 실패: {str(e)}")
+
+
+def _metric_vector(
+    metrics: Dict[str, Any],
+    pipeline_ids: List[str],
+    name: str,
+    stat: Optional[str] = None
+) -> np.ndarray:
+    """파이프라인 순서대로 특정 메트릭 값을 벡터로 추출"""
+    if stat is None:
+        values = (metrics[pid][name] for pid in pipeline_ids)
+    else:
+        values = (metrics[pid][name][stat] for pid in pipeline_ids)
+    return np.fromiter(values, dtype=np.float64, count=len(pipeline_ids))
+
+
+def _percent_change(before: np.ndarray, after: np.ndarray) -> List[float]:
+    """변화율(%) 계산 (기준값이 0인 경우 0으로 처리)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.where(before != 0, (after - before) / before * 100.0, 0.0)
+    return change.tolist()
+
+
 async def _load_test_cases(
     test_case_ids: List[str],
     db: AsyncSession
@@ -556,32 +663,44 @@ async def _load_test_cases(
     """
     데이터베이스에서 테스트 케이스 로드
     
-    임시 구현 - 실제로는 DB에서 조회해야 함
+    ID 목록을 IN 절로 한 번에 조회하고(최대 1000개 단위),
+    요청된 순서를 유지하여 반환합니다. 존재하지 않는 ID는 제외됩니다.
     """
-    # TODO: 실제 데이터베이스 조회 구현
-    test_cases = []
+    if not test_case_ids:
+        return []
     
-    for i, case_id in enumerate(test_case_ids):
-        test_case = QueryTestCase(
-            query_id=case_id,
-            query=f"Sample query for test case {case_id}",
-            query_type="factual",
-            expected_answer=None,
-            metadata={"loaded_from_db": True}
+    by_id: Dict[str, TestCaseModel] = {}
+    for start in range(0, len(test_case_ids), _TEST_CASE_BATCH_SIZE):
+        batch = test_case_ids[start:start + _TEST_CASE_BATCH_SIZE]
+        result = await db.execute(
+            select(TestCaseModel).where(TestCaseModel.query_id.in_(batch))
         )
-        test_cases.append(test_case)
+        for row in result.scalars():
+            by_id[row.query_id] = row
     
-    return test_cases
+    return [
+        QueryTestCase(
+            query_id=row.query_id,
+            query=row.query,
+            query_type=row.query_type,
+            expected_answer=row.expected_answer,
+            metadata=row.test_metadata
+        )
+        for row in (by_id.get(case_id) for case_id in test_case_ids)
+        if row is not None
+    ]
 
 
 async def _run_benchmark_task(
     benchmark_id: str,
     config: BenchmarkConfig,
-    test_cases: List[QueryTestCase],
-    db: AsyncSession
+    test_cases: List[QueryTestCase]
 ):
     """
     백그라운드에서 벤치마크 실행
+    
+    요청 세션은 응답과 함께 반환되므로, 결과 저장에는 작업 전용 세션을
+    짧게 열어 사용합니다.
     """
     try:
         logger.info(f"백그라운드 벤치마크 실행 시작: {benchmark_id}")
@@ -594,34 +713,38 @@ async def _run_benchmark_task(
         )
         
         # 결과 저장
-        benchmark_query = await db.execute(
-            db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id)
-        )
-        benchmark = benchmark_query.scalar_one_or_none()
-        
-        if benchmark:
-            benchmark.result = result.dict()
-            benchmark.status = result.status
-            benchmark.completed_at = result.end_time
-            benchmark.duration_seconds = result.duration_seconds
-            
-            await db.commit()
+        async with AsyncSessionLocal() as db:
+            benchmark_query = await db.execute(
+                select(BenchmarkModel).where(BenchmarkModel.id == benchmark_id)
+            )
+            benchmark = benchmark_query.scalar_one_or_none()
             
-            logger.info(f"벤치마크 완료 및 저장: {benchmark_id}")
+            if benchmark:
+                benchmark.result = result.model_dump(mode="json")
+                benchmark.status = result.status
+                benchmark.completed_at = result.end_time
+                benchmark.duration_seconds = result.duration_seconds
+                
+                await db.commit()
+                
+                logger.info(f"벤치마크 완료 및 저장: {benchmark_id}")
+        
+        await _invalidate_cached_result(benchmark_id)
         
     except Exception as e:
         logger.error(f"벤치마크 실행 중 오류: {str(e)}")
         
         # 오류 상태 업데이트
         try:
-            benchmark_query = await db.execute(
-                db.query(BenchmarkModel).filter(BenchmarkModel.id == benchmark_id)
-            )
-            benchmark = benchmark_query.scalar_one_or_none()
-            
-            if benchmark:
-                benchmark.status = "failed"
-                benchmark.error = str(e)
-                await db.commit()
+            async with AsyncSessionLocal() as db:
+                benchmark_query = await db.execute(
+                    select(BenchmarkModel).where(BenchmarkModel.id == benchmark_id)
+                )
+                benchmark = benchmark_query.scalar_one_or_none()
+                
+                if benchmark:
+                    benchmark.status = "failed"
+                    benchmark.error = str(e)
+                    await db.commit()
         except Exception as save_error:
-            logger.error(f"벤치마크 오류 상태 저장 실패: {str(save_error)}")
\ No newline at end of file
+            logger.error(f"벤치마크 오류 상태 저장 실패: {str(save_error)}")
@@ -5,12 +5,19 @@ OpenSearch 클러스터 관리 API 엔드포인트
 클러스터 상태, 인덱스 관리, 모델 관리 등의 기능을 제공합니다.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Hashable, List, Optional, Tuple
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File, Form
-from fastapi.responses import StreamingResponse
-import aiofiles
+import orjson
+from cachetools import TTLCache
+
+from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks, UploadFile, File, Form
+from fastapi.responses import Response, StreamingResponse
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError, NotFoundError, RequestError
 
 from app.utils.logger import logger
 from app.services.opensearch_service import get_opensearch_service, OpenSearchService
@@ -28,6 +35,45 @@ from app.schemas.opensearch import (
 )
 from app.core.config import settings
 from app.utils.file_parser import parse_document_file
+from app.utils.locks import keyed_lock
+
+# 업로드 파일 복사 버퍼 크기 (1MB)
+_UPLOAD_COPY_BUFSIZE = 1024 * 1024
+
+# 재색인 완료 확인 주기 (초)
+_REINDEX_POLL_INTERVAL_SECONDS = 5
+
+# 재색인 완료 대기 및 설정 복원 재시도 제한 시간 (초)
+_REINDEX_RESTORE_TIMEOUT_SECONDS = 6 * 60 * 60
+
+# 재색인 후 복원할 설정을 기록하는 대상 인덱스 매핑 _meta 키 (프로세스 재시작 후에도 복원 가능)
+_REINDEX_RESTORE_META_KEY = "reindex_restore"
+
+# 인덱스 목록 조회 시 필요한 설정 필드만 응답받기 위한 filter_path
+_INDEX_LIST_FILTER_PATH = ",".join([
+    "*.settings.index.number_of_shards",
+    "*.settings.index.number_of_replicas",
+    "*.settings.index.creation_date",
+    "*.settings.index.blocks.read_only"
+])
+_INDEX_STATS_FILTER_PATH = ",".join([
+    "indices.*.primaries.docs.count",
+    "indices.*.primaries.store.size_in_bytes"
+])
+
+# 대시보드 폴링용 단기 응답 캐시
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=2)
+_index_list_cache: TTLCache = TTLCache(maxsize=128, ttl=5)
+_models_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
+_pipelines_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
+# 캐시 미스 단일 조회용 키별 잠금: (id(캐시), 캐시 키) -> [잠금, 사용 중인 요청 수]
+_cache_locks: Dict[Hashable, List[Any]] = {}
+
+# 태스크 상태 응답에 포함할 진행 카운터
+_TASK_STATUS_KEYS = ("total", "created", "updated", "deleted", "batches")
+
+# 크기 단위 (1024 거듭제곱 순)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 # API 라우터 생성
 router = APIRouter(
@@ -50,18 +96,10 @@ async def get_cluster_health(
         ClusterHealth: 클러스터 상태 정보
     """
     try:
-        # 연결 확인
-        connected = await opensearch.check_connection()
-        if not connected:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="OpenSearch 클러스터에 연결할 수 없습니다."
-            )
-        
-        # 클러스터 상태 조회
-        health = await opensearch.get_cluster_health()
-        
-        return health
+        # 짧은 TTL 캐시 (동시 폴링 요청은 하나의 업스트림 호출 공유)
+        return await _cached_fetch(
+            _health_cache, "health", lambda: _fetch_cluster_health(opensearch)
+        )
         
     except HTTPException:
         raise
@@ -78,7 +116,7 @@ async def list_indices(
     pattern: Optional[str] = "*",
     include_system: bool = False,
     opensearch: OpenSearchService = Depends(get_opensearch_service)
-) -> IndexListResponse:
+) -> Response:
     """
     인덱스 목록 조회
     
@@ -87,41 +125,17 @@ async def list_indices(
         include_system: 시스템 인덱스 포함 여부
         
     Returns:
-        IndexListResponse: 인덱스 목록
+        Response: 인덱스 목록 (IndexListResponse 형식의 JSON)
     """
     try:
-        # 인덱스 목록 조회
-        indices_response = await opensearch.client.indices.get(index=pattern)
-        
-        indices = []
-        for index_name, index_info in indices_response.items():
-            # 시스템 인덱스 필터링
-            if not include_system and index_name.startswith("."):
-                continue
-            
-            # 인덱스 통계 조회
-            stats = await opensearch.get_index_stats(index_name)
-            
-            # 인덱스 정보 구성
-            index_data = {
-                "name": index_name,
-                "status": "open" if index_info["settings"]["index"].get("blocks", {}).get("read_only", False) == False else "closed",
-                "document_count": stats.document_count,
-                "size_human": stats.size_human,
-                "created_at": index_info["settings"]["index"].get("creation_date"),
-                "number_of_shards": int(index_info["settings"]["index"]["number_of_shards"]),
-                "number_of_replicas": int(index_info["settings"]["index"]["number_of_replicas"])
-            }
-            
-            indices.append(index_data)
-        
-        # 응답 구성
-        response = IndexListResponse(
-            indices=indices,
-            total=len(indices)
+        # 짧은 TTL 캐시 (패턴/시스템 포함 여부별, 인코딩된 본문 저장)
+        content = await _cached_fetch(
+            _index_list_cache,
+            (pattern, include_system),
+            lambda: _fetch_index_list(opensearch, pattern, include_system)
         )
         
-        return response
+        return Response(content=content, media_type="application/json")
         
     except Exception as e:
         logger.error(f"인덱스 목록 조회 중 오류: {str(e)}")
@@ -151,18 +165,27 @@ async def create_index(
         # 인덱스 생성
         result = await opensearch.create_index(index_name, config)
         
-        return result
+        # 인덱스 목록 캐시 무효화
+        _index_list_cache.clear()
         
-    except Exception as e:
-        logger.error(f"인덱스 생성 중 오류: {str(e)}")
+        return result
         
+    except RequestError as e:
         # 이미 존재하는 인덱스인 경우
-        if "resource_already_exists_exception" in str(e):
+        if e.error == "resource_already_exists_exception":
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"인덱스 '{index_name}'가 이미 존재합니다."
             )
         
+        logger.error(f"인덱스 생성 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"인덱스 생성에 실패했습니다: {e.error}"
+        )
+        
+    except Exception as e:
+        logger.error(f"인덱스 생성 중 오류: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"인덱스 생성에 실패했습니다: {str(e)}"
@@ -189,15 +212,14 @@ async def get_index_stats(
         
         return stats
         
+    except NotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"인덱스 '{index_name}'를 찾을 수 없습니다."
+        )
+        
     except Exception as e:
         logger.error(f"인덱스 통계 조회 중 오류: {str(e)}")
-        
-        if "index_not_found_exception" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"인덱스 '{index_name}'를 찾을 수 없습니다."
-            )
-        
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="인덱스 통계 조회에 실패했습니다."
@@ -220,6 +242,8 @@ async def delete_index(
         response = await opensearch.client.indices.delete(index=index_name)
         
         if response.get("acknowledged"):
+            # 인덱스 목록 캐시 무효화
+            _index_list_cache.clear()
             logger.info(f"인덱스 '{index_name}' 삭제 완료")
         else:
             raise HTTPException(
@@ -227,15 +251,16 @@ async def delete_index(
                 detail="인덱스 삭제가 확인되지 않았습니다."
             )
         
+    except HTTPException:
+        raise
+    except NotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"인덱스 '{index_name}'를 찾을 수 없습니다."
+        )
+        
     except Exception as e:
         logger.error(f"인덱스 삭제 중 오류: {str(e)}")
-        
-        if "index_not_found_exception" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"인덱스 '{index_name}'를 찾을 수 없습니다."
-            )
-        
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="인덱스 삭제에 실패했습니다."
@@ -292,37 +317,31 @@ async def upload_documents(
     """
     try:
         # 파일 확장자 확인
-        file_extension = file.filename.split(".")[-1].lower()
+        file_extension = os.path.splitext(file.filename)[1][1:].lower()
         if file_extension not in settings.ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+                detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(sorted(settings.ALLOWED_EXTENSIONS))}"
             )
         
-        # 파일 크기 확인
-        file_size = 0
-        temp_file_path = settings.UPLOAD_DIR / f"temp_{file.filename}"
-        
-        async with aiofiles.open(temp_file_path, "wb") as f:
-            while chunk := await file.read(1024 * 1024):  # 1MB씩 읽기
-                file_size += len(chunk)
-                if file_size > settings.MAX_UPLOAD_SIZE:
-                    await f.close()
-                    temp_file_path.unlink()
-                    raise HTTPException(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail=f"파일 크기가 너무 큽니다. 최대 크기: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB"
-                    )
-                await f.write(chunk)
-        
-        # 파일 파싱
-        documents = await parse_document_file(temp_file_path, file_extension, source)
-        
-        # 임시 파일 삭제
-        temp_file_path.unlink()
+        # 임시 파일로 한 번에 복사 (크기 제한 확인 포함)
+        temp_file_path, file_size = await asyncio.to_thread(
+            _spool_and_size_check,
+            file.file,
+            settings.UPLOAD_DIR,
+            os.path.basename(file.filename),
+            settings.MAX_UPLOAD_SIZE
+        )
         
-        # 문서 색인
-        result = await opensearch.index_documents(index_name, documents)
+        try:
+            # 파싱 결과를 제너레이터로 색인기에 바로 전달
+            documents = parse_document_file(temp_file_path, file_extension, source)
+            
+            # 문서 병렬 색인
+            result = await opensearch.parallel_index_documents(index_name, documents)
+        finally:
+            # 임시 파일 페이지 캐시 해제 및 삭제
+            _discard_temp_file(temp_file_path)
         
         # 결과에 파일 정보 추가
         result["file_info"] = {
@@ -348,21 +367,26 @@ async def upload_documents(
 async def search_documents(
     query: SearchQuery,
     opensearch: OpenSearchService = Depends(get_opensearch_service)
-) -> SearchResult:
+) -> StreamingResponse:
     """
     문서 검색
     
+    검색 결과는 히트 단위로 orjson 인코딩하여 스트리밍합니다.
+    
     Args:
         query: 검색 쿼리
         
     Returns:
-        SearchResult: 검색 결과
+        StreamingResponse: 검색 결과 (SearchResult 형식의 JSON)
     """
     try:
         # 검색 실행
         result = await opensearch.search(query.index_name, query)
         
-        return result
+        return StreamingResponse(
+            _stream_search_result(result),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"문서 검색 중 오류: {str(e)}")
@@ -383,33 +407,12 @@ async def list_models(
         List[ModelInfo]: 모델 목록
     """
     try:
-        # ML 모델 목록 조회
-        response = await opensearch.client.transport.perform_request(
-            method="GET",
-            url="/_plugins/_ml/models"
+        return await _cached_fetch(
+            _models_cache, "models", lambda: _fetch_models(opensearch)
         )
         
-        models = []
-        for model_data in response.get("models", []):
-            model_info = ModelInfo(
-                id=model_data["model_id"],
-                name=model_data["name"],
-                type=model_data.get("model_type", "unknown"),
-                status="loaded" if model_data.get("model_state") == "DEPLOYED" else "unloaded",
-                version=model_data.get("model_version", "1.0"),
-                created_at=model_data.get("created_time")
-            )
-            models.append(model_info)
-        
-        return models
-        
     except Exception as e:
         logger.error(f"모델 목록 조회 중 오류: {str(e)}")
-        
-        # ML 플러그인이 설치되지 않은 경우
-        if "404" in str(e):
-            return []  # 빈 목록 반환
-        
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="모델 목록 조회에 실패했습니다."
@@ -427,35 +430,12 @@ async def list_opensearch_pipelines(
         List[PipelineInfo]: 파이프라인 목록
     """
     try:
-        # 인제스트 파이프라인 목록 조회
-        response = await opensearch.client.ingest.get_pipeline()
-        
-        pipelines = []
-        for pipeline_id, pipeline_data in response.items():
-            # 프로세서 수 계산
-            processor_count = len(pipeline_data.get("processors", []))
-            
-            # 설명 추출
-            description = pipeline_data.get("description", "No description")
-            
-            pipeline_info = PipelineInfo(
-                id=pipeline_id,
-                name=pipeline_id,  # OpenSearch는 ID를 이름으로 사용
-                description=description,
-                processor_count=processor_count,
-                processors=pipeline_data.get("processors", [])
-            )
-            pipelines.append(pipeline_info)
-        
-        return pipelines
+        return await _cached_fetch(
+            _pipelines_cache, "pipelines", lambda: _fetch_pipelines(opensearch)
+        )
         
     except Exception as e:
         logger.error(f"파이프라인 목록 조회 중 오류: {str(e)}")
-        
-        # 파이프라인이 없는 경우
-        if "404" in str(e):
-            return []  # 빈 목록 반환
-        
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="파이프라인 목록 조회에 실패했습니다."
@@ -466,6 +446,7 @@ async def list_opensearch_pipelines(
 async def reindex_data(
     source_index: str,
     target_index: str,
+    background_tasks: BackgroundTasks,
     create_target: bool = True,
     opensearch: OpenSearchService = Depends(get_opensearch_service)
 ) -> Dict[str, Any]:
@@ -481,20 +462,36 @@ async def reindex_data(
         Dict[str, Any]: 재색인 결과
     """
     try:
+        # 재색인 후 복원할 대상 인덱스 레플리카 수
+        restore_replicas = None
+        
         # 대상 인덱스 생성 (필요한 경우)
         if create_target:
-            # 원본 인덱스 매핑 조회
-            source_mapping = await opensearch.client.indices.get_mapping(index=source_index)
-            source_settings = await opensearch.client.indices.get_settings(index=source_index)
+            # 원본 인덱스 매핑/설정 동시 조회
+            source_mapping, source_settings = await asyncio.gather(
+                opensearch.client.indices.get_mapping(index=source_index),
+                opensearch.client.indices.get_settings(index=source_index)
+            )
+            
+            restore_replicas = source_settings[source_index]["settings"]["index"]["number_of_replicas"]
             
-            # 대상 인덱스 생성
+            # 복원할 설정을 대상 인덱스 _meta에 기록
+            mappings = source_mapping[source_index]["mappings"]
+            mappings["_meta"] = {
+                **mappings.get("_meta", {}),
+                _REINDEX_RESTORE_META_KEY: {"number_of_replicas": restore_replicas}
+            }
+            
+            # 대상 인덱스 생성 (재색인 동안 refresh/레플리카 비활성화로 쓰기 처리량 확보)
             await opensearch.client.indices.create(
                 index=target_index,
                 body={
-                    "mappings": source_mapping[source_index]["mappings"],
+                    "mappings": mappings,
                     "settings": {
                         "number_of_shards": source_settings[source_index]["settings"]["index"]["number_of_shards"],
-                        "number_of_replicas": source_settings[source_index]["settings"]["index"]["number_of_replicas"]
+                        "number_of_replicas": 0,
+                        "refresh_interval": "-1",
+                        "translog": {"flush_threshold_size": "1gb"}
                     }
                 }
             )
@@ -511,6 +508,15 @@ async def reindex_data(
         # 태스크 ID 반환
         task_id = response.get("task")
         
+        # 재색인 완료 후 대상 인덱스 설정 복원
+        if restore_replicas is not None:
+            background_tasks.add_task(
+                _restore_reindex_target_settings,
+                opensearch,
+                task_id,
+                target_index
+            )
+        
         result = {
             "task_id": task_id,
             "source_index": source_index,
@@ -529,6 +535,47 @@ async def reindex_data(
         )
 
 
+@router.post("/reindex/{target_index}/restore-settings", response_model=Dict[str, Any])
+async def restore_reindex_settings(
+    target_index: str,
+    opensearch: OpenSearchService = Depends(get_opensearch_service)
+) -> Dict[str, Any]:
+    """
+    재색인 대상 인덱스 설정 복원
+    
+    재색인 동안 비활성화한 refresh/레플리카/translog 설정을 되돌립니다.
+    자동 복원이 실패했거나 서버가 재시작된 경우 다시 실행할 수 있으며,
+    재색인이 끝난 뒤 호출해야 합니다.
+    
+    Args:
+        target_index: 재색인 대상 인덱스
+        
+    Returns:
+        Dict[str, Any]: 복원 결과
+    """
+    try:
+        restored = await _apply_reindex_target_settings(opensearch, target_index)
+        
+    except NotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"인덱스 '{target_index}'를 찾을 수 없습니다."
+        )
+        
+    except Exception as e:
+        logger.error(f"재색인 대상 인덱스 설정 복원 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="재색인 대상 인덱스 설정 복원에 실패했습니다."
+        )
+    
+    return {
+        "target_index": target_index,
+        "restored": restored,
+        "message": "설정이 복원되었습니다." if restored else "복원할 설정이 없습니다."
+    }
+
+
 @router.get("/tasks/{task_id}", response_model=Dict[str, Any])
 async def get_task_status(
     task_id: str,
@@ -548,7 +595,7 @@ async def get_task_status(
         response = await opensearch.client.tasks.get(task_id=task_id)
         
         task_info = response.get("task", {})
-        status = task_info.get("status", {})
+        task_status = task_info.get("status", {})
         
         result = {
             "task_id": task_id,
@@ -556,13 +603,7 @@ async def get_task_status(
             "description": task_info.get("description", ""),
             "start_time": task_info.get("start_time_in_millis"),
             "running_time": task_info.get("running_time_in_nanos"),
-            "status": {
-                "total": status.get("total", 0),
-                "created": status.get("created", 0),
-                "updated": status.get("updated", 0),
-                "deleted": status.get("deleted", 0),
-                "batches": status.get("batches", 0)
-            }
+            "status": {key: task_status.get(key, 0) for key in _TASK_STATUS_KEYS}
         }
         
         # 오류가 있는 경우
@@ -571,16 +612,379 @@ async def get_task_status(
         
         return result
         
+    except NotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"태스크 '{task_id}'를 찾을 수 없습니다."
+        )
+        
     except Exception as e:
         logger.error(f"태스크 상태 조회 중 오류: {str(e)}")
-        
-        if "404" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"태스크 '{task_id}'를 찾을 수 없습니다."
-            )
-        
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="태스크 상태 조회에 실패했습니다."
-        )
\ No newline at end of file
+        )
+
+
+def _spool_and_size_check(
+    src: BinaryIO,
+    dest_dir: Path,
+    filename: str,
+    max_size: int
+) -> Tuple[Path, int]:
+    """
+    업로드 파일을 임시 파일로 동기 복사하며 크기 제한 확인
+    
+    asyncio.to_thread에서 실행되어 청크마다 이벤트 루프를 거치지 않습니다.
+    임시 파일 이름은 tempfile로 생성하여 같은 이름의 동시 업로드가 충돌하지 않습니다.
+    
+    Args:
+        src: 업로드 파일 객체
+        dest_dir: 임시 파일 디렉토리 (tmpfs 마운트 권장)
+        filename: 원본 파일명 (임시 파일 접미사로 사용)
+        max_size: 허용 최대 크기 (바이트)
+        
+    Returns:
+        Tuple[Path, int]: 임시 파일 경로, 복사된 파일 크기 (바이트)
+    """
+    file_size = 0
+    with tempfile.NamedTemporaryFile(
+        dir=dest_dir, prefix="temp_", suffix=f"_{filename}", delete=False
+    ) as out:
+        dest_path = Path(out.name)
+        while chunk := src.read(_UPLOAD_COPY_BUFSIZE):
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
+            out.write(chunk)
+    
+    if file_size > max_size:
+        dest_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기가 너무 큽니다. 최대 크기: {max_size / 1024 / 1024}MB"
+        )
+    
+    return dest_path, file_size
+
+
+def _discard_temp_file(path: Path) -> None:
+    """
+    한 번 읽고 버리는 임시 파일의 페이지 캐시를 해제한 뒤 삭제
+    
+    Args:
+        path: 임시 파일 경로
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    
+    path.unlink(missing_ok=True)
+
+
+async def _apply_reindex_target_settings(
+    opensearch: OpenSearchService,
+    target_index: str
+) -> bool:
+    """
+    _meta에 기록된 재색인 전 설정으로 대상 인덱스 설정 복원
+    
+    복원 후 _meta 기록을 제거하므로 여러 번 호출해도 안전합니다.
+    
+    Args:
+        opensearch: OpenSearch 서비스
+        target_index: 대상 인덱스
+        
+    Returns:
+        bool: 복원 여부 (복원할 설정이 없으면 False)
+    """
+    mapping = await opensearch.client.indices.get_mapping(index=target_index)
+    meta = next(iter(mapping.values()))["mappings"].get("_meta", {})
+    pending = meta.get(_REINDEX_RESTORE_META_KEY)
+    if pending is None:
+        return False
+    
+    # refresh 주기, 레플리카 수 복원 및 translog 설정 기본값으로 초기화
+    await opensearch.client.indices.put_settings(
+        index=target_index,
+        body={
+            "index": {
+                "refresh_interval": "1s",
+                "number_of_replicas": pending["number_of_replicas"],
+                "translog.flush_threshold_size": None
+            }
+        }
+    )
+    
+    # 복원 기록 제거 (_meta는 갱신 시 통째로 교체됨)
+    await opensearch.client.indices.put_mapping(
+        index=target_index,
+        body={"_meta": {k: v for k, v in meta.items() if k != _REINDEX_RESTORE_META_KEY}}
+    )
+    
+    return True
+
+
+async def _restore_reindex_target_settings(
+    opensearch: OpenSearchService,
+    task_id: str,
+    target_index: str
+) -> None:
+    """
+    재색인 태스크 완료를 기다린 후 대상 인덱스 설정 복원
+    
+    일시적인 오류(5xx, 타임아웃 등)는 제한 시간 안에서 재시도합니다.
+    제한 시간을 넘기거나 프로세스가 재시작되면 restore-settings
+    엔드포인트로 다시 실행할 수 있습니다.
+    
+    Args:
+        opensearch: OpenSearch 서비스
+        task_id: 재색인 태스크 ID
+        target_index: 대상 인덱스
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _REINDEX_RESTORE_TIMEOUT_SECONDS
+    completed = False
+    
+    while loop.time() < deadline:
+        try:
+            # 재색인 태스크 완료 확인
+            if not completed:
+                task = await opensearch.client.tasks.get(task_id=task_id)
+                completed = task.get("completed", False)
+            
+            if completed:
+                await _apply_reindex_target_settings(opensearch, target_index)
+                logger.info(f"재색인 대상 인덱스 '{target_index}' 설정 복원 완료")
+                return
+            
+        except NotFoundError:
+            if completed:
+                logger.warning(f"재색인 대상 인덱스 '{target_index}'가 없어 설정 복원을 건너뜁니다.")
+                return
+            # 태스크 기록이 없으면 이미 끝난 것으로 보고 바로 복원
+            completed = True
+            continue
+            
+        except Exception as e:
+            logger.warning(f"재색인 대상 인덱스 설정 복원 재시도 예정: {str(e)}")
+        
+        await asyncio.sleep(_REINDEX_POLL_INTERVAL_SECONDS)
+    
+    logger.error(
+        f"재색인 대상 인덱스 '{target_index}' 설정을 제한 시간 내에 복원하지 못했습니다. "
+        f"POST /opensearch/reindex/{target_index}/restore-settings로 다시 실행하세요."
+    )
+
+
+def _humanize(n: int) -> str:
+    """
+    바이트 크기를 사람이 읽기 쉬운 문자열로 변환
+    
+    Args:
+        n: 바이트 단위 크기
+        
+    Returns:
+        str: 사람이 읽기 쉬운 크기 문자열 (예: 1.50MB)
+    """
+    if n < 1024:
+        return f"{int(n)}B"
+    
+    # 비트 길이로 1024 거듭제곱 지수 계산 (반복 나눗셈 없음)
+    unit_index = min((int(n).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{n / (1 << (10 * unit_index)):.2f}{_SIZE_UNITS[unit_index]}"
+
+
+async def _stream_search_result(result: SearchResult) -> AsyncIterator[bytes]:
+    """
+    검색 결과를 JSON 조각으로 스트리밍
+    
+    Args:
+        result: 검색 결과
+        
+    Yields:
+        bytes: JSON 인코딩된 응답 조각
+    """
+    # 응답 머리 (히트 외 필드)
+    yield b"".join((
+        b'{"query":', orjson.dumps(result.query),
+        b',"total_hits":', orjson.dumps(result.total_hits),
+        b',"took_ms":', orjson.dumps(result.took_ms),
+        b',"hits":['
+    ))
+    
+    # 히트 단위 인코딩
+    for idx, hit in enumerate(result.hits):
+        yield b"," + orjson.dumps(hit) if idx else orjson.dumps(hit)
+    
+    yield b"]}"
+
+
+async def _cached_fetch(
+    cache: TTLCache,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    TTL 캐시 조회, 없으면 단일 호출(single-flight)로 채움
+    
+    같은 캐시 키를 기다리는 동시 요청은 잠금 후 캐시를 다시 확인하므로
+    업스트림 호출은 한 번만 발생하며, 다른 키의 미스는 서로 기다리지 않습니다.
+    예외는 캐시하지 않습니다.
+    
+    Args:
+        cache: 응답 캐시
+        key: 캐시 키
+        fetch: 캐시 미스 시 호출할 코루틴 함수
+        
+    Returns:
+        Any: 캐시되었거나 새로 조회한 값
+    """
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    
+    async with keyed_lock(_cache_locks, (id(cache), key)):
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        
+        value = await fetch()
+        cache[key] = value
+        return value
+
+
+async def _fetch_cluster_health(opensearch: OpenSearchService) -> ClusterHealth:
+    """클러스터 상태 조회 (상태 조회 자체가 연결 확인 역할)"""
+    try:
+        health = await opensearch.get_cluster_health()
+    except OpenSearchConnectionError:
+        # ConnectionTimeout 포함
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="OpenSearch 클러스터에 연결할 수 없습니다."
+        )
+    
+    return health
+
+
+async def _fetch_index_list(
+    opensearch: OpenSearchService,
+    pattern: str,
+    include_system: bool
+) -> bytes:
+    """
+    인덱스 목록 및 통계 조회
+    
+    응답 모델 검증 없이 IndexListResponse 형식의 JSON으로 바로 인코딩합니다.
+    """
+    # 시스템 인덱스는 제외 패턴으로 클러스터에서 필터링
+    index_expression = pattern if include_system else f"{pattern},-.*"
+    
+    # 인덱스 목록 조회 (필요한 설정 필드만)
+    indices_response = await opensearch.client.indices.get(
+        index=index_expression,
+        expand_wildcards="open",
+        filter_path=_INDEX_LIST_FILTER_PATH
+    )
+    
+    # 인덱스 통계 일괄 조회 (인덱스별 요청 대신 단일 요청)
+    stats_response = await opensearch.client.indices.stats(
+        index=index_expression,
+        metric="docs,store",
+        filter_path=_INDEX_STATS_FILTER_PATH
+    )
+    index_stats = stats_response.get("indices", {})
+    
+    indices = []
+    for index_name, index_info in indices_response.items():
+        idx_settings = index_info["settings"]["index"]
+        
+        # 인덱스 통계 추출
+        primaries = index_stats.get(index_name, {}).get("primaries", {})
+        document_count = primaries.get("docs", {}).get("count", 0)
+        size_in_bytes = primaries.get("store", {}).get("size_in_bytes", 0)
+        
+        # 인덱스 정보 구성
+        index_data = {
+            "name": index_name,
+            "status": "closed" if idx_settings.get("blocks", {}).get("read_only") else "open",
+            "document_count": document_count,
+            "size_human": _humanize(size_in_bytes),
+            "created_at": idx_settings.get("creation_date"),
+            "number_of_shards": int(idx_settings["number_of_shards"]),
+            "number_of_replicas": int(idx_settings["number_of_replicas"])
+        }
+        
+        indices.append(index_data)
+    
+    # 응답 구성 (IndexListResponse 형식)
+    return orjson.dumps({
+        "indices": indices,
+        "total": len(indices)
+    })
+
+
+async def _fetch_models(opensearch: OpenSearchService) -> List[ModelInfo]:
+    """ML 모델 목록 조회"""
+    try:
+        # ML 모델 목록 조회
+        response = await opensearch.client.transport.perform_request(
+            method="GET",
+            url="/_plugins/_ml/models"
+        )
+        
+        models = []
+        for model_data in response.get("models", []):
+            model_info = ModelInfo(
+                id=model_data["model_id"],
+                name=model_data["name"],
+                type=model_data.get("model_type", "unknown"),
+                status="loaded" if model_data.get("model_state") == "DEPLOYED" else "unloaded",
+                version=model_data.get("model_version", "1.0"),
+                created_at=model_data.get("created_time")
+            )
+            models.append(model_info)
+        
+        return models
+        
+    except NotFoundError:
+        # ML 플러그인이 설치되지 않은 경우
+        return []  # 빈 목록 반환
+
+
+async def _fetch_pipelines(opensearch: OpenSearchService) -> List[PipelineInfo]:
+    """인제스트 파이프라인 목록 조회"""
+    try:
+        # 인제스트 파이프라인 목록 조회
+        response = await opensearch.client.ingest.get_pipeline()
+        
+        pipelines = []
+        for pipeline_id, pipeline_data in response.items():
+            # 프로세서 목록 및 수 계산
+            processors = pipeline_data.get("processors") or []
+            processor_count = len(processors)
+            
+            # 설명 추출
+            description = pipeline_data.get("description", "No description")
+            
+            pipeline_info = PipelineInfo(
+                id=pipeline_id,
+                name=pipeline_id,  # OpenSearch는 ID를 이름으로 사용
+                description=description,
+                processor_count=processor_count,
+                processors=processors
+            )
+            pipelines.append(pipeline_info)
+        
+        return pipelines
+        
+    except NotFoundError:
+        # 파이프라인이 없는 경우
+        return []  # 빈 목록 반환
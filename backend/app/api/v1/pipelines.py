@@ -5,15 +5,26 @@ RAG 파이프라인 관리 API 엔드포인트
 파이프라인 생성, 조회, 실행, 삭제 등의 기능을 제공합니다.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import base64
+import binascii
+import hashlib
 import uuid
 
-from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, case, delete, select, func, insert, update, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
+from app.core.config import settings
+from app.utils.locks import keyed_lock
 from app.utils.logger import logger
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.services.rag_executor import pipeline_manager, PipelineConfig, PipelineType
 from app.schemas.pipeline import (
     PipelineCreate,
@@ -25,13 +36,67 @@ from app.schemas.pipeline import (
     PipelineMetrics,
     PipelineStatus
 )
+from app.models.base import utcnow
 from app.models.pipeline import Pipeline as PipelineModel
+from app.models.user import User
 from app.core.dependencies import get_current_user
 
+# 목록 페이지 단기 캐시 (대시보드 폴링용, 변경 시 무효화)
+_list_cache: TTLCache = TTLCache(maxsize=256, ttl=3)
+
+# 목록 캐시 키별 잠금 (같은 키의 동시 미스만 하나로 합침): 키 -> [잠금, 사용 중인 요청 수]
+_list_cache_locks: Dict[Tuple, List[Any]] = {}
+
+# 동시 실행 쿼리 수 제한 (검색/LLM 호출 폭주로 인한 이벤트 루프 지연 방지)
+_query_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_QUERIES)
+
+# 파이프라인 설정 객체 캐시 (파이프라인 ID -> (설정 해시, PipelineConfig))
+_config_cache: Dict[str, Tuple[int, PipelineConfig]] = {}
+
+# 마지막 실행 시간 버퍼 (파이프라인 ID -> 실행 시각, 주기적으로 일괄 반영)
+_last_run_buffer: Dict[uuid.UUID, datetime] = {}
+_LAST_RUN_FLUSH_INTERVAL_SECONDS = 2
+_last_run_flusher: Optional[asyncio.Task] = None
+
+# 목록 조회에서 로드할 컬럼 (config 제외)
+_LIST_COLUMNS = (
+    PipelineModel.id,
+    PipelineModel.name,
+    PipelineModel.description,
+    PipelineModel.pipeline_type,
+    PipelineModel.status,
+    PipelineModel.index_name,
+    PipelineModel.created_at,
+    PipelineModel.updated_at,
+    PipelineModel.last_run
+)
+
+# 목록 조회 스트리밍 시 한 번에 가져올 행 수
+_LIST_YIELD_PER = 100
+
+# 단건 조회 문 (모듈 로드 시 한 번만 구성하고 pipeline_id 바인드 값만 바꿔 재사용)
+_SELECT_PIPELINE_BY_ID = (
+    select(PipelineModel)
+    .options(raiseload("*"))  # 의도치 않은 지연 로딩 방지
+    .where(PipelineModel.id == bindparam("pipeline_id"))
+)
+_SELECT_PIPELINE_ID = select(PipelineModel.id).where(
+    PipelineModel.id == bindparam("pipeline_id")
+)
+_SELECT_PIPELINE_FOR_EXECUTE = select(
+    PipelineModel.id,
+    PipelineModel.name,
+    PipelineModel.pipeline_type,
+    PipelineModel.index_name,
+    PipelineModel.config,
+    PipelineModel.status
+).where(PipelineModel.id == bindparam("pipeline_id"))
+
 # API 라우터 생성
 router = APIRouter(
     prefix="/pipelines",
     tags=["pipelines"],
+    default_response_class=ORJSONResponse,  # orjson 기반 응답 직렬화
     responses={
         404: {"description": "Pipeline not found"},
         500: {"description": "Internal server error"}
@@ -41,97 +106,77 @@ router = APIRouter(
 
 @router.get("/", response_model=PipelineListResponse)
 async def list_pipelines(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1),
+    cursor: Optional[str] = None,
     pipeline_type: Optional[PipelineType] = None,
-    status: Optional[PipelineStatus] = None,
+    pipeline_status: Optional[PipelineStatus] = Query(default=None, alias="status"),
     db: AsyncSession = Depends(get_db)
 ) -> PipelineListResponse:
     """
     파이프라인 목록 조회
     
+    최신 생성 순으로 정렬되며, next_cursor를 cursor로 넘기면
+    OFFSET 없이 다음 페이지를 조회합니다 (키셋 페이지네이션).
+    
     Args:
-        skip: 건너뛸 항목 수 (페이지네이션)
+        skip: 건너뛸 항목 수 (cursor가 없을 때만 적용)
         limit: 조회할 최대 항목 수
+        cursor: 이전 응답의 next_cursor
         pipeline_type: 필터링할 파이프라인 타입
-        status: 필터링할 파이프라인 상태
+        pipeline_status: 필터링할 파이프라인 상태
         db: 데이터베이스 세션
         
     Returns:
         PipelineListResponse: 파이프라인 목록
     """
-    try:
-        # 쿼리 구성
-        query = db.query(PipelineModel)
-        
-        # 필터 적용
-        if pipeline_type:
-            query = query.filter(PipelineModel.pipeline_type == pipeline_type)
-        if status:
-            query = query.filter(PipelineModel.status == status)
-        
-        # 페이지네이션 적용
-        query = query.offset(skip).limit(limit)
-        
-        # 쿼리 실행
-        result = await db.execute(query)
-        pipelines = result.scalars().all()
-        
-        # 응답 데이터 구성
-        pipeline_responses = []
-        for pipeline in pipelines:
-            # 메트릭 조회
-            metrics = pipeline_manager.get_metrics(str(pipeline.id))
-            
-            # 파이프라인 응답 객체 생성
-            response = PipelineResponse(
-                id=str(pipeline.id),
-                name=pipeline.name,
-                description=pipeline.description,
-                pipeline_type=pipeline.pipeline_type,
-                status=pipeline.status,
-                index_name=pipeline.index_name,
-                config=pipeline.config,
-                metrics=metrics,
-                created_at=pipeline.created_at,
-                updated_at=pipeline.updated_at,
-                last_run=pipeline.last_run
-            )
-            pipeline_responses.append(response)
-        
-        # 전체 개수 조회
-        count_query = db.query(PipelineModel)
-        if pipeline_type:
-            count_query = count_query.filter(PipelineModel.pipeline_type == pipeline_type)
-        if status:
-            count_query = count_query.filter(PipelineModel.status == status)
-        
-        total_result = await db.execute(count_query.count())
-        total_count = total_result.scalar()
+    # 캐시 조회 (동시 요청은 잠금 후 재확인하여 한 번만 조회)
+    cache_key = (skip, limit, cursor, pipeline_type, pipeline_status)
+    cached_response = _list_cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    async with keyed_lock(_list_cache_locks, cache_key):
+        cached_response = _list_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
         
-        # 목록 응답 생성
-        list_response = PipelineListResponse(
-            items=pipeline_responses,
-            total=total_count,
-            skip=skip,
-            limit=limit
+        list_response = await _load_pipeline_page(
+            db, skip, limit, cursor, pipeline_type, pipeline_status
         )
+        _list_cache[cache_key] = list_response
+    
+    return list_response
+
+
+@router.get("/count", response_model=Dict[str, int])
+async def count_pipelines(
+    pipeline_type: Optional[PipelineType] = None,
+    pipeline_status: Optional[PipelineStatus] = Query(default=None, alias="status"),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, int]:
+    """
+    파이프라인 개수 조회
+    
+    Args:
+        pipeline_type: 필터링할 파이프라인 타입
+        pipeline_status: 필터링할 파이프라인 상태
+        db: 데이터베이스 세션
         
-        return list_response
-        
-    except Exception as e:
-        logger.error(f"파이프라인 목록 조회 중 오류: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 목록 조회에 실패했습니다."
-        )
+    Returns:
+        Dict[str, int]: 전체 개수
+    """
+    filters = _pipeline_filters(pipeline_type, pipeline_status)
+    total_count = await _count_pipelines(db, filters)
+    
+    return {"total": total_count}
 
 
 @router.post("/", response_model=PipelineResponse, status_code=status.HTTP_201_CREATED)
 async def create_pipeline(
     pipeline_data: PipelineCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user)  # 인증 사용 시
+    current_user: User = Depends(get_current_user)  # 인증 사용 시
 ) -> PipelineResponse:
     """
     새로운 파이프라인 생성
@@ -144,123 +189,92 @@ async def create_pipeline(
     Returns:
         PipelineResponse: 생성된 파이프라인 정보
     """
-    try:
-        # 파이프라인 ID 생성
-        pipeline_id = str(uuid.uuid4())
-        
-        # 데이터베이스 모델 생성
-        db_pipeline = PipelineModel(
-            id=pipeline_id,
-            name=pipeline_data.name,
-            description=pipeline_data.description,
-            pipeline_type=pipeline_data.pipeline_type,
-            status=PipelineStatus.INACTIVE,
-            index_name=pipeline_data.index_name,
-            config=pipeline_data.config.dict() if pipeline_data.config else {},
-            created_by=current_user.get("id") if current_user else None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        
-        # 데이터베이스에 저장
-        db.add(db_pipeline)
-        await db.commit()
-        await db.refresh(db_pipeline)
-        
-        # 파이프라인 설정 객체 생성
-        config = PipelineConfig(
-            name=db_pipeline.name,
-            pipeline_type=db_pipeline.pipeline_type,
-            index_name=db_pipeline.index_name,
-            **db_pipeline.config
-        )
-        
-        # 파이프라인 인스턴스 생성 (캐싱)
-        await pipeline_manager.get_pipeline(pipeline_id, config)
-        
-        # 응답 생성
-        created_pipeline = PipelineResponse(
-            id=pipeline_id,
-            name=db_pipeline.name,
-            description=db_pipeline.description,
-            pipeline_type=db_pipeline.pipeline_type,
-            status=db_pipeline.status,
-            index_name=db_pipeline.index_name,
-            config=db_pipeline.config,
-            metrics=None,  # 새로 생성된 파이프라인은 메트릭이 없음
-            created_at=db_pipeline.created_at,
-            updated_at=db_pipeline.updated_at,
-            last_run=None
-        )
-        
-        logger.info(f"파이프라인 생성 완료: {pipeline_id} - {db_pipeline.name}")
-        
-        return created_pipeline
-        
-    except Exception as e:
-        logger.error(f"파이프라인 생성 중 오류: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"파이프라인 생성에 실패했습니다: {str(e)}"
-        )
+    # INSERT ... RETURNING으로 저장과 생성된 행 조회를 한 번에 수행
+    # (ID는 컬럼 기본값으로 생성되어 RETURNING으로 돌려받음)
+    stmt = insert(PipelineModel).values(
+        name=pipeline_data.name,
+        description=pipeline_data.description,
+        pipeline_type=pipeline_data.pipeline_type,
+        status=PipelineStatus.INACTIVE,
+        index_name=pipeline_data.index_name,
+        config=pipeline_data.config.model_dump() if pipeline_data.config else {},
+        created_by=current_user.id if current_user else None
+    ).returning(PipelineModel)
+    
+    result = await db.execute(stmt)
+    db_pipeline = result.scalar_one()
+    await db.commit()
+    _invalidate_list_cache()
+    pipeline_id = str(db_pipeline.id)
+    
+    # 파이프라인 설정 객체 생성
+    config = PipelineConfig(
+        name=db_pipeline.name,
+        pipeline_type=db_pipeline.pipeline_type,
+        index_name=db_pipeline.index_name,
+        **db_pipeline.config
+    )
+    
+    # 파이프라인 인스턴스 생성 (캐싱)
+    await pipeline_manager.get_pipeline(pipeline_id, config)
+    
+    # 응답 생성
+    created_pipeline = _to_pipeline_response(db_pipeline, None)
+    
+    logger.info(f"파이프라인 생성 완료: {pipeline_id} - {db_pipeline.name}")
+    
+    return created_pipeline
 
 
 @router.get("/{pipeline_id}", response_model=PipelineResponse)
 async def get_pipeline(
     pipeline_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ) -> PipelineResponse:
     """
     특정 파이프라인 조회
     
+    클라이언트의 If-None-Match가 현재 ETag와 같으면 304를 반환합니다.
+    
     Args:
         pipeline_id: 파이프라인 ID
+        request: 요청 객체 (If-None-Match 확인용)
+        response: 응답 객체 (ETag 헤더 설정용)
         db: 데이터베이스 세션
         
     Returns:
         PipelineResponse: 파이프라인 정보
     """
-    try:
-        # 데이터베이스에서 조회
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
-        )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
-            )
-        
-        # 메트릭 조회
-        metrics = pipeline_manager.get_metrics(pipeline_id)
-        
-        # 응답 생성
-        pipeline_response = PipelineResponse(
-            id=str(pipeline.id),
-            name=pipeline.name,
-            description=pipeline.description,
-            pipeline_type=pipeline.pipeline_type,
-            status=pipeline.status,
-            index_name=pipeline.index_name,
-            config=pipeline.config,
-            metrics=metrics,
-            created_at=pipeline.created_at,
-            updated_at=pipeline.updated_at,
-            last_run=pipeline.last_run
-        )
-        
-        return pipeline_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파이프라인 조회 중 오류: {str(e)}")
+    # 데이터베이스에서 조회
+    result = await db.execute(_SELECT_PIPELINE_BY_ID, {"pipeline_id": pipeline_id})
+    pipeline = result.scalar_one_or_none()
+    
+    if not pipeline:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 조회에 실패했습니다."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
         )
+    
+    # 메트릭 조회
+    metrics = pipeline_manager.get_metrics(pipeline_id)
+    
+    # 변경 시각/마지막 실행/메트릭 기준 ETag 비교
+    etag = _make_etag(
+        pipeline.id,
+        pipeline.updated_at.isoformat(),
+        pipeline.last_run.isoformat() if pipeline.last_run else "",
+        *(metrics.model_dump().values() if metrics else ())
+    )
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    # 응답 생성
+    pipeline_response = _to_pipeline_response(pipeline, metrics)
+    
+    return pipeline_response
 
 
 @router.put("/{pipeline_id}", response_model=PipelineResponse)
@@ -280,64 +294,39 @@ async def update_pipeline(
     Returns:
         PipelineResponse: 업데이트된 파이프라인 정보
     """
-    try:
-        # 기존 파이프라인 조회
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
-        )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
-            )
-        
-        # 업데이트 적용
-        update_dict = update_data.dict(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(pipeline, field, value)
-        
-        pipeline.updated_at = datetime.utcnow()
-        
-        # 데이터베이스 저장
-        await db.commit()
-        await db.refresh(pipeline)
-        
-        # 파이프라인 인스턴스가 캐시에 있으면 제거 (재생성 유도)
-        if pipeline.status == PipelineStatus.INACTIVE:
-            await pipeline_manager.remove_pipeline(pipeline_id)
-        
-        # 메트릭 조회
-        metrics = pipeline_manager.get_metrics(pipeline_id)
-        
-        # 응답 생성
-        updated_pipeline = PipelineResponse(
-            id=str(pipeline.id),
-            name=pipeline.name,
-            description=pipeline.description,
-            pipeline_type=pipeline.pipeline_type,
-            status=pipeline.status,
-            index_name=pipeline.index_name,
-            config=pipeline.config,
-            metrics=metrics,
-            created_at=pipeline.created_at,
-            updated_at=pipeline.updated_at,
-            last_run=pipeline.last_run
-        )
-        
-        logger.info(f"파이프라인 업데이트 완료: {pipeline_id}")
-        
-        return updated_pipeline
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파이프라인 업데이트 중 오류: {str(e)}")
+    # 단일 UPDATE ... RETURNING으로 변경 적용과 결과 조회를 함께 수행
+    result = await db.execute(
+        update(PipelineModel)
+        .where(PipelineModel.id == pipeline_id)
+        .values(**update_data.model_dump(exclude_unset=True), updated_at=utcnow())
+        .returning(PipelineModel)
+    )
+    pipeline = result.scalar_one_or_none()
+    
+    if not pipeline:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 업데이트에 실패했습니다."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
         )
+    
+    # 데이터베이스 저장
+    await db.commit()
+    _invalidate_list_cache()
+    _config_cache.pop(pipeline_id, None)
+    
+    # 파이프라인 인스턴스가 캐시에 있으면 제거 (재생성 유도)
+    if pipeline.status == PipelineStatus.INACTIVE:
+        await pipeline_manager.remove_pipeline(pipeline_id)
+    
+    # 메트릭 조회
+    metrics = pipeline_manager.get_metrics(pipeline_id)
+    
+    # 응답 생성
+    updated_pipeline = _to_pipeline_response(pipeline, metrics)
+    
+    logger.info(f"파이프라인 업데이트 완료: {pipeline_id}")
+    
+    return updated_pipeline
 
 
 @router.delete("/{pipeline_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -352,50 +341,46 @@ async def delete_pipeline(
         pipeline_id: 파이프라인 ID
         db: 데이터베이스 세션
     """
-    try:
-        # 파이프라인 조회
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
+    # 활성 상태가 아닌 경우에만 단일 DELETE ... RETURNING으로 삭제
+    result = await db.execute(
+        delete(PipelineModel)
+        .where(
+            PipelineModel.id == pipeline_id,
+            PipelineModel.status != PipelineStatus.ACTIVE
         )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
+        .returning(PipelineModel.id)
+    )
+    deleted_id = result.scalar_one_or_none()
+    
+    if deleted_id is None:
+        # 삭제되지 않은 원인 구분 (존재하지 않음 / 실행 중)
+        exists = await db.scalar(_SELECT_PIPELINE_ID, {"pipeline_id": pipeline_id})
+        if exists is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
             )
         
         # 실행 중인 파이프라인은 삭제 불가
-        if pipeline.status == PipelineStatus.ACTIVE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="실행 중인 파이프라인은 삭제할 수 없습니다."
-            )
-        
-        # 캐시에서 제거
-        await pipeline_manager.remove_pipeline(pipeline_id)
-        
-        # 데이터베이스에서 삭제
-        await db.delete(pipeline)
-        await db.commit()
-        
-        logger.info(f"파이프라인 삭제 완료: {pipeline_id}")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파이프라인 삭제 중 오류: {str(e)}")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 삭제에 실패했습니다."
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="실행 중인 파이프라인은 삭제할 수 없습니다."
         )
+    
+    await db.commit()
+    _invalidate_list_cache()
+    
+    # 삭제가 확정된 경우에만 캐시에서 제거
+    await pipeline_manager.remove_pipeline(pipeline_id)
+    _config_cache.pop(pipeline_id, None)
+    
+    logger.info(f"파이프라인 삭제 완료: {pipeline_id}")
 
 
 @router.post("/{pipeline_id}/execute", response_model=QueryResult)
 async def execute_pipeline(
     pipeline_id: str,
     query: QueryInput,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> QueryResult:
     """
@@ -404,126 +389,101 @@ async def execute_pipeline(
     Args:
         pipeline_id: 파이프라인 ID
         query: 실행할 쿼리
-        background_tasks: 백그라운드 작업 관리자
         db: 데이터베이스 세션
         
     Returns:
         QueryResult: 쿼리 실행 결과
     """
-    try:
-        # 파이프라인 조회
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
+    # 실행에 필요한 컬럼만 조회 (ORM 엔티티 로드 생략)
+    result = await db.execute(_SELECT_PIPELINE_FOR_EXECUTE, {"pipeline_id": pipeline_id})
+    pipeline = result.one_or_none()
+    
+    if not pipeline:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
         )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
+    
+    # 비활성 상태면 활성화 (이미 활성 상태면 UPDATE/커밋 생략)
+    if pipeline.status != PipelineStatus.ACTIVE:
+        activated = await db.execute(
+            update(PipelineModel)
+            .where(
+                PipelineModel.id == pipeline_id,
+                PipelineModel.status != PipelineStatus.ACTIVE
             )
-        
-        # 파이프라인 상태 확인
-        if pipeline.status != PipelineStatus.ACTIVE:
-            # 비활성 상태면 활성화
-            pipeline.status = PipelineStatus.ACTIVE
-            await db.commit()
-        
-        # 파이프라인 설정 생성
-        config = PipelineConfig(
-            name=pipeline.name,
-            pipeline_type=pipeline.pipeline_type,
-            index_name=pipeline.index_name,
-            **pipeline.config
+            .values(status=PipelineStatus.ACTIVE)
         )
-        
-        # 파이프라인 인스턴스 가져오기 (캐시됨)
-        pipeline_instance = await pipeline_manager.get_pipeline(pipeline_id, config)
-        
-        # 쿼리 ID 생성 (없는 경우)
-        if not query.query_id:
-            query.query_id = str(uuid.uuid4())
-        
-        # 쿼리 실행
+        await db.commit()
+        if activated.rowcount:
+            _invalidate_list_cache()
+    
+    # 파이프라인 설정 생성 (설정이 바뀌지 않았으면 캐시 재사용)
+    config = _get_pipeline_config(pipeline_id, pipeline)
+    
+    # 파이프라인 인스턴스 가져오기 (캐시됨)
+    pipeline_instance = await pipeline_manager.get_pipeline(pipeline_id, config)
+    
+    # 쿼리 ID 생성 (없는 경우)
+    if not query.query_id:
+        query.query_id = str(uuid.uuid4())
+    
+    # 쿼리 실행 (동시 실행 수 제한)
+    async with _query_semaphore:
         query_result = await pipeline_instance.process_query(query)
-        
-        # 백그라운드 작업: 마지막 실행 시간 업데이트
-        async def update_last_run():
-            pipeline.last_run = datetime.utcnow()
-            await db.commit()
-        
-        background_tasks.add_task(update_last_run)
-        
-        logger.info(
-            f"파이프라인 실행 완료: {pipeline_id} - "
-            f"쿼리: {query.query_text[:50]}... - "
-            f"지연시간: {query_result.latency_ms}ms"
-        )
-        
-        return query_result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파이프라인 실행 중 오류: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"파이프라인 실행에 실패했습니다: {str(e)}"
-        )
+    
+    # 마지막 실행 시간 기록 (버퍼에 적재, 플러셔가 일괄 UPDATE)
+    _last_run_buffer[pipeline.id] = datetime.utcnow()
+    
+    logger.info(
+        f"파이프라인 실행 완료: {pipeline_id} - "
+        f"쿼리: {query.query_text[:50]}... - "
+        f"지연시간: {query_result.latency_ms}ms"
+    )
+    
+    return query_result
 
 
 @router.get("/{pipeline_id}/metrics", response_model=PipelineMetrics)
 async def get_pipeline_metrics(
     pipeline_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ) -> PipelineMetrics:
     """
     파이프라인 메트릭 조회
     
+    클라이언트의 If-None-Match가 현재 ETag와 같으면 304를 반환합니다.
+    
     Args:
         pipeline_id: 파이프라인 ID
+        request: 요청 객체 (If-None-Match 확인용)
+        response: 응답 객체 (ETag 헤더 설정용)
         db: 데이터베이스 세션
         
     Returns:
         PipelineMetrics: 파이프라인 성능 메트릭
     """
-    try:
-        # 파이프라인 존재 여부 확인
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
-        )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
-            )
-        
-        # 메트릭 조회
-        metrics = pipeline_manager.get_metrics(pipeline_id)
-        
-        if not metrics:
-            # 메트릭이 없는 경우 기본값 반환
-            default_metrics = PipelineMetrics(
-                total_queries=0,
-                successful_queries=0,
-                failed_queries=0,
-                average_latency=0.0,
-                average_retrieval_score=0.0
-            )
-            return default_metrics
-        
-        return metrics
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파이프라인 메트릭 조회 중 오류: {str(e)}")
+    # 파이프라인 존재 여부 확인 (ID 컬럼만 조회)
+    exists = await db.scalar(_SELECT_PIPELINE_ID, {"pipeline_id": pipeline_id})
+    
+    if exists is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 메트릭 조회에 실패했습니다."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
         )
+    
+    # 메트릭 조회 (없는 경우 기본값)
+    metrics = pipeline_manager.get_metrics(pipeline_id) or PipelineMetrics()
+    
+    # 메트릭 값 기준 ETag 비교
+    etag = _make_etag(pipeline_id, *metrics.model_dump().values())
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    return metrics
 
 
 @router.post("/{pipeline_id}/activate", response_model=PipelineResponse)
@@ -541,58 +501,26 @@ async def activate_pipeline(
     Returns:
         PipelineResponse: 활성화된 파이프라인 정보
     """
-    try:
-        # 파이프라인 조회
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
-        )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
-            )
-        
-        # 이미 활성화된 경우
-        if pipeline.status == PipelineStatus.ACTIVE:
-            logger.info(f"파이프라인이 이미 활성화되어 있습니다: {pipeline_id}")
-        else:
-            # 상태 변경
-            pipeline.status = PipelineStatus.ACTIVE
-            pipeline.updated_at = datetime.utcnow()
-            await db.commit()
-            
-            logger.info(f"파이프라인 활성화 완료: {pipeline_id}")
-        
-        # 메트릭 조회
-        metrics = pipeline_manager.get_metrics(pipeline_id)
-        
-        # 응답 생성
-        activated_pipeline = PipelineResponse(
-            id=str(pipeline.id),
-            name=pipeline.name,
-            description=pipeline.description,
-            pipeline_type=pipeline.pipeline_type,
-            status=pipeline.status,
-            index_name=pipeline.index_name,
-            config=pipeline.config,
-            metrics=metrics,
-            created_at=pipeline.created_at,
-            updated_at=pipeline.updated_at,
-            last_run=pipeline.last_run
-        )
-        
-        return activated_pipeline
+    # 상태가 바뀌는 경우에만 단일 UPDATE ... RETURNING으로 변경
+    pipeline = await _set_pipeline_status(db, pipeline_id, PipelineStatus.ACTIVE)
+    
+    if pipeline is not None:
+        await db.commit()
+        _invalidate_list_cache()
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파이프라인 활성화 중 오류: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 활성화에 실패했습니다."
-        )
+        logger.info(f"파이프라인 활성화 완료: {pipeline_id}")
+    else:
+        # 변경된 행이 없으면 존재 여부 확인 (이미 활성화된 경우)
+        pipeline = await _get_pipeline_or_404(db, pipeline_id)
+        logger.info(f"파이프라인이 이미 활성화되어 있습니다: {pipeline_id}")
+    
+    # 메트릭 조회
+    metrics = pipeline_manager.get_metrics(pipeline_id)
+    
+    # 응답 생성
+    activated_pipeline = _to_pipeline_response(pipeline, metrics)
+    
+    return activated_pipeline
 
 
 @router.post("/{pipeline_id}/deactivate", response_model=PipelineResponse)
@@ -610,55 +538,290 @@ async def deactivate_pipeline(
     Returns:
         PipelineResponse: 비활성화된 파이프라인 정보
     """
-    try:
-        # 파이프라인 조회
-        result = await db.execute(
-            db.query(PipelineModel).filter(PipelineModel.id == pipeline_id)
-        )
-        pipeline = result.scalar_one_or_none()
-        
-        if not pipeline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
-            )
+    # 상태가 바뀌는 경우에만 단일 UPDATE ... RETURNING으로 변경
+    pipeline = await _set_pipeline_status(db, pipeline_id, PipelineStatus.INACTIVE)
+    
+    if pipeline is not None:
+        await db.commit()
+        _invalidate_list_cache()
         
-        # 이미 비활성화된 경우
-        if pipeline.status == PipelineStatus.INACTIVE:
-            logger.info(f"파이프라인이 이미 비활성화되어 있습니다: {pipeline_id}")
-        else:
-            # 상태 변경
-            pipeline.status = PipelineStatus.INACTIVE
-            pipeline.updated_at = datetime.utcnow()
-            await db.commit()
-            
-            # 캐시에서 제거 (리소스 절약)
-            await pipeline_manager.remove_pipeline(pipeline_id)
-            
-            logger.info(f"파이프라인 비활성화 완료: {pipeline_id}")
+        # 캐시에서 제거 (리소스 절약)
+        await pipeline_manager.remove_pipeline(pipeline_id)
         
-        # 응답 생성
-        deactivated_pipeline = PipelineResponse(
-            id=str(pipeline.id),
-            name=pipeline.name,
-            description=pipeline.description,
-            pipeline_type=pipeline.pipeline_type,
-            status=pipeline.status,
-            index_name=pipeline.index_name,
-            config=pipeline.config,
-            metrics=None,  # 비활성화된 파이프라인은 메트릭이 없음
-            created_at=pipeline.created_at,
-            updated_at=pipeline.updated_at,
-            last_run=pipeline.last_run
+        logger.info(f"파이프라인 비활성화 완료: {pipeline_id}")
+    else:
+        # 변경된 행이 없으면 존재 여부 확인 (이미 비활성화된 경우)
+        pipeline = await _get_pipeline_or_404(db, pipeline_id)
+        logger.info(f"파이프라인이 이미 비활성화되어 있습니다: {pipeline_id}")
+    
+    # 응답 생성
+    deactivated_pipeline = _to_pipeline_response(pipeline, None)
+    
+    return deactivated_pipeline
+
+
+async def _load_pipeline_page(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    pipeline_type: Optional[PipelineType],
+    pipeline_status: Optional[PipelineStatus]
+) -> PipelineListResponse:
+    """파이프라인 목록 페이지 조회 (DB + 메트릭)"""
+    # 필터 조건 구성
+    filters = _pipeline_filters(pipeline_type, pipeline_status)
+    
+    # 페이지 쿼리 구성 (다음 페이지 존재 확인용으로 1건 더 조회)
+    stmt = (
+        select(PipelineModel)
+        .options(
+            load_only(*_LIST_COLUMNS, raiseload=True),  # config JSON 컬럼 제외
+            raiseload("*")  # 의도치 않은 지연 로딩 방지
         )
-        
-        return deactivated_pipeline
-        
-    except HTTPException:
-        raise
+        .where(*filters)
+        .order_by(PipelineModel.created_at.desc(), PipelineModel.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(PipelineModel.created_at, PipelineModel.id) < (cursor_created_at, cursor_id)
+        )
+    elif skip:
+        stmt = stmt.offset(skip)
+    
+    # 페이지 쿼리 스트리밍 실행 (ORM 객체를 한꺼번에 들고 있지 않고 행 단위로 응답 변환)
+    pipeline_ids: List[str] = []
+    pipeline_responses: List[PipelineResponse] = []
+    next_cursor = None
+    last_pipeline = None
+    
+    rows = await db.stream_scalars(stmt.execution_options(yield_per=_LIST_YIELD_PER))
+    try:
+        async for pipeline in rows:
+            if len(pipeline_responses) == limit:
+                # limit + 1번째 행이 있으면 다음 페이지 커서 생성
+                next_cursor = _encode_cursor(last_pipeline)
+                break
+            pipeline_ids.append(str(pipeline.id))
+            # config는 로드하지 않았으므로 생략됨, 메트릭은 아래에서 일괄 설정
+            pipeline_responses.append(_to_pipeline_response(pipeline, None))
+            last_pipeline = pipeline
+    finally:
+        await rows.close()
+    
+    # 메트릭 일괄 조회 후 응답에 반영
+    metrics_map = pipeline_manager.get_metrics_bulk(pipeline_ids)
+    for pipeline_id, response in zip(pipeline_ids, pipeline_responses):
+        response.metrics = metrics_map.get(pipeline_id)
+    
+    # 전체 개수는 첫 페이지에서만 조회 (이후 페이지는 /count 사용)
+    total_count = None
+    if cursor is None:
+        total_count = await _count_pipelines(db, filters)
+    
+    # 목록 응답 생성
+    list_response = PipelineListResponse(
+        items=pipeline_responses,
+        total=total_count,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor
+    )
+    
+    return list_response
+
+
+def _get_pipeline_config(pipeline_id: str, pipeline: Any) -> PipelineConfig:
+    """
+    파이프라인 행으로부터 PipelineConfig 생성 (메모이제이션)
+
+    이름/타입/인덱스/설정 값의 해시가 같으면 이전에 만든 객체를 재사용합니다.
+    """
+    config_hash = hash(orjson.dumps(
+        [pipeline.name, pipeline.pipeline_type, pipeline.index_name, pipeline.config],
+        option=orjson.OPT_SORT_KEYS
+    ))
+    
+    cached = _config_cache.get(pipeline_id)
+    if cached is not None and cached[0] == config_hash:
+        return cached[1]
+    
+    config = PipelineConfig(
+        name=pipeline.name,
+        pipeline_type=pipeline.pipeline_type,
+        index_name=pipeline.index_name,
+        **pipeline.config
+    )
+    _config_cache[pipeline_id] = (config_hash, config)
+    return config
+
+
+async def flush_last_run_buffer() -> None:
+    """
+    버퍼링된 마지막 실행 시간을 단일 UPDATE ... CASE 문으로 반영
+    """
+    global _last_run_buffer
+    if not _last_run_buffer:
+        return
+    
+    # 플러시 중 들어오는 기록은 새 버퍼에 쌓이도록 교체
+    pending, _last_run_buffer = _last_run_buffer, {}
+    
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(PipelineModel)
+                .where(PipelineModel.id.in_(list(pending)))
+                .values(last_run=case(pending, value=PipelineModel.id))
+            )
+            await session.commit()
+        _invalidate_list_cache()
     except Exception as e:
-        logger.error(f"파이프라인 비활성화 중 오류: {str(e)}")
+        logger.error(f"마지막 실행 시간 일괄 업데이트 중 오류: {str(e)}")
+        # 실패한 항목은 더 최신 기록이 없을 때만 되돌려 다음 주기에 재시도
+        for pipeline_id, timestamp in pending.items():
+            _last_run_buffer.setdefault(pipeline_id, timestamp)
+
+
+async def _run_last_run_flusher() -> None:
+    """마지막 실행 시간 버퍼를 주기적으로 플러시"""
+    try:
+        while True:
+            await asyncio.sleep(_LAST_RUN_FLUSH_INTERVAL_SECONDS)
+            await flush_last_run_buffer()
+    except asyncio.CancelledError:
+        # 종료 시 남은 기록 반영
+        await flush_last_run_buffer()
+        raise
+
+
+def start_last_run_flusher() -> None:
+    """마지막 실행 시간 플러셔 시작 (애플리케이션 시작 시 호출)"""
+    global _last_run_flusher
+    if _last_run_flusher is None or _last_run_flusher.done():
+        _last_run_flusher = asyncio.create_task(_run_last_run_flusher())
+
+
+async def stop_last_run_flusher() -> None:
+    """마지막 실행 시간 플러셔 종료 (애플리케이션 종료 시 호출)"""
+    global _last_run_flusher
+    if _last_run_flusher is None:
+        return
+    _last_run_flusher.cancel()
+    try:
+        await _last_run_flusher
+    except asyncio.CancelledError:
+        pass
+    _last_run_flusher = None
+
+
+async def _set_pipeline_status(
+    db: AsyncSession,
+    pipeline_id: str,
+    new_status: PipelineStatus
+) -> Optional[PipelineModel]:
+    """
+    파이프라인 상태를 단일 UPDATE ... RETURNING으로 변경
+
+    이미 같은 상태이거나 존재하지 않으면 None을 반환합니다.
+    """
+    result = await db.execute(
+        update(PipelineModel)
+        .where(PipelineModel.id == pipeline_id, PipelineModel.status != new_status)
+        .values(status=new_status, updated_at=utcnow())
+        .returning(PipelineModel)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _get_pipeline_or_404(db: AsyncSession, pipeline_id: str) -> PipelineModel:
+    """파이프라인 조회 (없으면 404)"""
+    pipeline = await db.scalar(_SELECT_PIPELINE_BY_ID, {"pipeline_id": pipeline_id})
+    if not pipeline:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="파이프라인 비활성화에 실패했습니다."
-        )
\ No newline at end of file
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"파이프라인을 찾을 수 없습니다: {pipeline_id}"
+        )
+    return pipeline
+
+
+def _make_etag(*parts: Any) -> str:
+    """응답 구성 요소로부터 강한 ETag 생성"""
+    digest = hashlib.blake2b(
+        ":".join(map(str, parts)).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더에 현재 ETag가 포함되어 있는지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _to_pipeline_response(
+    pipeline: PipelineModel,
+    metrics: Optional[PipelineMetrics]
+) -> PipelineResponse:
+    """
+    ORM 행을 PipelineResponse로 변환
+
+    계측된 속성 접근 대신 로드된 값(__dict__)을 그대로 검증에 사용합니다.
+    로드되지 않은 컬럼(목록 조회의 config 등)은 기본값으로 채워집니다.
+    """
+    return PipelineResponse.model_validate(
+        {**pipeline.__dict__, "id": str(pipeline.id), "metrics": metrics}
+    )
+
+
+def _invalidate_list_cache() -> None:
+    """파이프라인 변경 시 목록 캐시 무효화"""
+    _list_cache.clear()
+
+
+def _pipeline_filters(
+    pipeline_type: Optional[PipelineType],
+    pipeline_status: Optional[PipelineStatus]
+) -> list:
+    """목록/개수 조회 공통 필터 조건 구성"""
+    filters = []
+    if pipeline_type:
+        filters.append(PipelineModel.pipeline_type == pipeline_type)
+    if pipeline_status:
+        filters.append(PipelineModel.status == pipeline_status)
+    return filters
+
+
+async def _count_pipelines(db: AsyncSession, filters: list) -> int:
+    """동일 필터의 COUNT 쿼리 실행"""
+    count_stmt = select(func.count()).select_from(PipelineModel).where(*filters)
+    total_result = await db.execute(count_stmt)
+    return total_result.scalar_one()
+
+
+def _encode_cursor(pipeline: PipelineModel) -> str:
+    """마지막 항목의 (created_at, id)를 페이지 커서로 인코딩"""
+    raw = f"{pipeline.created_at.isoformat()},{pipeline.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    페이지 커서를 (created_at, id)로 디코딩
+    
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        created_at, pipeline_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(",", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(pipeline_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 페이지 커서입니다."
+        )
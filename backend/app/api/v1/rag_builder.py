@@ -5,21 +5,45 @@ RAG Builder API 엔드포인트
 LangGraph 컴포넌트를 사용한 시각적 RAG 파이프라인 구성을 지원합니다.
 """
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Type, TypeVar
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timezone
+import copy
+import hashlib
+import os
+import time
 import uuid
-import json
 
-from fastapi import APIRouter, HTTPException, Depends, status, Body
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Depends, status, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from app.utils.logger import logger
 from app.db.session import get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)  # orjson 기반 응답 직렬화
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# 미리 직렬화된 정적 응답 (본문, ETag)
+StaticPayload = Tuple[bytes, str]
+
+# 정적 응답(컴포넌트/템플릿) 브라우저 캐시 정책
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+# 컴파일 결과 캐시 (UI에서 동일 그래프를 반복 컴파일하는 경우 재사용)
+_compile_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+# 컴파일 결과 ID별 생성 코드 (코드 조회 엔드포인트용)
+_compiled_code_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
 
 
 # RAG Builder 스키마 정의
@@ -85,17 +109,93 @@ class PipelineTemplate(BaseModel):
     updated_at: datetime
 
 
+@dataclass(slots=True)
+class GraphAnalysis:
+    """그래프 분석 결과 (검증/컴파일 공용)"""
+    errors: List[str]
+    warnings: List[str]
+    order: Optional[List[GraphNode]]  # 구조 오류나 사이클이 있으면 None
+    by_id: Dict[str, GraphNode]
+
+
+class CompileRequest(BaseModel):
+    """컴파일 요청 본문"""
+    graph: GraphState
+    pipeline_name: str
+
+
+def _validate_body(model: Type[ModelT], raw: bytes) -> ModelT:
+    """
+    요청 본문을 pydantic-core에서 바로 파싱/검증
+    
+    json.loads로 중간 dict를 만든 뒤 다시 검증하는 기본 경로를 건너뜁니다.
+    오류는 FastAPI 기본 형식과 같은 422 응답으로 변환합니다.
+    """
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
+def _json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Depends로 직접 파싱하는 본문의 OpenAPI requestBody 정의
+    
+    본문을 request.body()로 읽으면 FastAPI가 requestBody를 생성하지 않으므로
+    스키마를 명시합니다. 중첩 모델(GraphState 등)은 clone_template 응답
+    모델로 components에 등록되어 있어 참조만 남깁니다.
+    """
+    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}}
+        }
+    }
+
+
+async def _parse_graph_body(request: Request) -> GraphState:
+    """그래프 검증 요청 본문 파싱"""
+    return _validate_body(GraphState, await request.body())
+
+
+async def _parse_compile_body(request: Request) -> CompileRequest:
+    """컴파일 요청 본문 파싱"""
+    return _validate_body(CompileRequest, await request.body())
+
+
+def _make_etag(payload: bytes) -> str:
+    """응답 본문으로부터 강한 ETag 생성"""
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def _static_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """
+    정적 JSON 응답 생성 (ETag/Cache-Control 포함)
+    
+    If-None-Match가 현재 ETag와 일치하면 본문 없이 304를 반환합니다.
+    """
+    headers = {"ETag": etag, "Cache-Control": _STATIC_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 # 사용 가능한 컴포넌트 정의
-AVAILABLE_COMPONENTS = [
-    ComponentDefinition(
-        id="data_loader",
-        name="Data Loader",
-        category="Input",
-        description="Load documents from various sources",
-        icon="📄",
-        inputs=[],
-        outputs=[{"name": "documents", "type": "Document[]"}],
-        config_schema={
+AVAILABLE_COMPONENTS: List[Dict[str, Any]] = [
+    {
+        "id": "data_loader",
+        "name": "Data Loader",
+        "category": "Input",
+        "description": "Load documents from various sources",
+        "icon": "📄",
+        "inputs": [],
+        "outputs": [{"name": "documents", "type": "Document[]"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "source_type": {
@@ -109,16 +209,16 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    ),
-    ComponentDefinition(
-        id="text_splitter",
-        name="Text Splitter",
-        category="Processing",
-        description="Split documents into chunks",
-        icon="✂️",
-        inputs=[{"name": "documents", "type": "Document[]"}],
-        outputs=[{"name": "chunks", "type": "Chunk[]"}],
-        config_schema={
+    },
+    {
+        "id": "text_splitter",
+        "name": "Text Splitter",
+        "category": "Processing",
+        "description": "Split documents into chunks",
+        "icon": "✂️",
+        "inputs": [{"name": "documents", "type": "Document[]"}],
+        "outputs": [{"name": "chunks", "type": "Chunk[]"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "chunk_size": {
@@ -138,16 +238,16 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    ),
-    ComponentDefinition(
-        id="embedding_model",
-        name="Embedding Model",
-        category="Embedding",
-        description="Generate embeddings for text chunks",
-        icon="🧠",
-        inputs=[{"name": "chunks", "type": "Chunk[]"}],
-        outputs=[{"name": "embeddings", "type": "Embedding[]"}],
-        config_schema={
+    },
+    {
+        "id": "embedding_model",
+        "name": "Embedding Model",
+        "category": "Embedding",
+        "description": "Generate embeddings for text chunks",
+        "icon": "🧠",
+        "inputs": [{"name": "chunks", "type": "Chunk[]"}],
+        "outputs": [{"name": "embeddings", "type": "Embedding[]"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "model": {
@@ -163,16 +263,16 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    ),
-    ComponentDefinition(
-        id="vector_store",
-        name="Vector Store",
-        category="Storage",
-        description="Store and retrieve vector embeddings",
-        icon="📦",
-        inputs=[{"name": "embeddings", "type": "Embedding[]"}],
-        outputs=[{"name": "retriever", "type": "Retriever"}],
-        config_schema={
+    },
+    {
+        "id": "vector_store",
+        "name": "Vector Store",
+        "category": "Storage",
+        "description": "Store and retrieve vector embeddings",
+        "icon": "📦",
+        "inputs": [{"name": "embeddings", "type": "Embedding[]"}],
+        "outputs": [{"name": "retriever", "type": "Retriever"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "index_name": {
@@ -187,16 +287,16 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    ),
-    ComponentDefinition(
-        id="retriever",
-        name="Retriever",
-        category="Retrieval",
-        description="Retrieve relevant documents",
-        icon="🔍",
-        inputs=[{"name": "query", "type": "string"}],
-        outputs=[{"name": "documents", "type": "Document[]"}],
-        config_schema={
+    },
+    {
+        "id": "retriever",
+        "name": "Retriever",
+        "category": "Retrieval",
+        "description": "Retrieve relevant documents",
+        "icon": "🔍",
+        "inputs": [{"name": "query", "type": "string"}],
+        "outputs": [{"name": "documents", "type": "Document[]"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "top_k": {
@@ -210,19 +310,19 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    ),
-    ComponentDefinition(
-        id="llm_chain",
-        name="LLM Chain",
-        category="Generation",
-        description="Generate answers using LLM",
-        icon="🔗",
-        inputs=[
+    },
+    {
+        "id": "llm_chain",
+        "name": "LLM Chain",
+        "category": "Generation",
+        "description": "Generate answers using LLM",
+        "icon": "🔗",
+        "inputs": [
             {"name": "query", "type": "string"},
             {"name": "context", "type": "Document[]"}
         ],
-        outputs=[{"name": "answer", "type": "string"}],
-        config_schema={
+        "outputs": [{"name": "answer", "type": "string"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "model": {
@@ -248,16 +348,16 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    ),
-    ComponentDefinition(
-        id="output_parser",
-        name="Output Parser",
-        category="Output",
-        description="Parse and format the output",
-        icon="💡",
-        inputs=[{"name": "answer", "type": "string"}],
-        outputs=[{"name": "formatted_output", "type": "any"}],
-        config_schema={
+    },
+    {
+        "id": "output_parser",
+        "name": "Output Parser",
+        "category": "Output",
+        "description": "Parse and format the output",
+        "icon": "💡",
+        "inputs": [{"name": "answer", "type": "string"}],
+        "outputs": [{"name": "formatted_output", "type": "any"}],
+        "config_schema": {
             "type": "object",
             "properties": {
                 "format": {
@@ -268,49 +368,165 @@ AVAILABLE_COMPONENTS = [
                 }
             }
         }
-    )
+    }
+]
+
+# 개발 환경(최적화 플래그 없이 실행)에서만 컴포넌트 정의 형식 검증
+if __debug__:
+    TypeAdapter(List[ComponentDefinition]).validate_python(AVAILABLE_COMPONENTS)
+
+
+# 사전 정의된 파이프라인 템플릿 (생성/수정 시각은 모듈 로드 시각으로 고정)
+_TEMPLATES_LOADED_AT = datetime.utcnow()
+
+PIPELINE_TEMPLATES: List[Dict[str, Any]] = [
+    {
+        "id": "basic-rag",
+        "name": "Basic RAG Pipeline",
+        "description": "Simple retrieval-augmented generation pipeline",
+        "category": "starter",
+        "graph": {
+            "nodes": [
+                {
+                    "id": "loader",
+                    "type": "input",
+                    "position": {"x": 100, "y": 100},
+                    "data": {
+                        "label": "Document Loader",
+                        "type": "data_loader",
+                        "config": {"source_type": "file"}
+                    }
+                },
+                {
+                    "id": "splitter",
+                    "type": "process",
+                    "position": {"x": 300, "y": 100},
+                    "data": {
+                        "label": "Text Splitter",
+                        "type": "text_splitter",
+                        "config": {"chunk_size": 1000}
+                    }
+                },
+                {
+                    "id": "embedder",
+                    "type": "process",
+                    "position": {"x": 500, "y": 100},
+                    "data": {
+                        "label": "Embedding Model",
+                        "type": "embedding_model",
+                        "config": {"model": "openai"}
+                    }
+                },
+                {
+                    "id": "output",
+                    "type": "output",
+                    "position": {"x": 700, "y": 100},
+                    "data": {
+                        "label": "Output",
+                        "type": "output_parser",
+                        "config": {"format": "text"}
+                    }
+                }
+            ],
+            "edges": [
+                {"id": "e1", "source": "loader", "target": "splitter"},
+                {"id": "e2", "source": "splitter", "target": "embedder"},
+                {"id": "e3", "source": "embedder", "target": "output"}
+            ]
+        },
+        "created_at": _TEMPLATES_LOADED_AT,
+        "updated_at": _TEMPLATES_LOADED_AT
+    }
 ]
 
 
-@router.get("/components", response_model=List[ComponentDefinition])
-async def get_available_components() -> List[ComponentDefinition]:
+def _build_static_indices() -> Tuple[
+    StaticPayload, Dict[str, StaticPayload], Dict[str, Dict[str, Any]], StaticPayload
+]:
+    """
+    컴포넌트/템플릿 정적 응답 본문과 ID별 인덱스 구성 (모듈 로드 시 1회)
+    
+    Returns:
+        컴포넌트 목록 본문, 컴포넌트 ID별 본문, 템플릿 ID별 dict, 템플릿 목록 본문
+    """
+    def payload(data: Any) -> StaticPayload:
+        content = orjson.dumps(data)
+        return content, _make_etag(content)
+    
+    components = payload(AVAILABLE_COMPONENTS)
+    component_by_id = {c["id"]: payload(c) for c in AVAILABLE_COMPONENTS}
+    
+    # 템플릿은 복제 시 수정해야 하므로 바이트가 아닌 dict로 보관 (기본값까지 채워 검증)
+    template_by_id = {
+        t["id"]: PipelineTemplate.model_validate(t).model_dump() for t in PIPELINE_TEMPLATES
+    }
+    templates = payload(list(template_by_id.values()))
+    
+    return components, component_by_id, template_by_id, templates
+
+
+(
+    _COMPONENTS_PAYLOAD,
+    _COMPONENT_PAYLOAD_BY_ID,
+    _TEMPLATE_BY_ID,
+    _TEMPLATES_PAYLOAD
+) = _build_static_indices()
+
+
+# 정적 응답 엔드포인트는 I/O가 없어도 async def로 유지
+# (sync def는 FastAPI가 매 요청 스레드풀로 디스패치하므로 이벤트 루프에서 바로 반환하는 편이 빠름)
+@router.get(
+    "/components",
+    response_class=Response,
+    responses={200: {"model": List[ComponentDefinition]}}
+)
+async def get_available_components(request: Request) -> Response:
     """
     사용 가능한 RAG 컴포넌트 목록 조회
     
+    Args:
+        request: 요청 객체 (If-None-Match 확인용)
+        
     Returns:
-        List[ComponentDefinition]: 컴포넌트 정의 목록
+        Response: 컴포넌트 정의 목록 (미리 직렬화된 JSON, 변경 없으면 304)
     """
-    return AVAILABLE_COMPONENTS
+    return _static_json_response(request, *_COMPONENTS_PAYLOAD)
 
 
-@router.get("/components/{component_id}", response_model=ComponentDefinition)
-async def get_component_details(component_id: str) -> ComponentDefinition:
+@router.get(
+    "/components/{component_id}",
+    response_class=Response,
+    responses={200: {"model": ComponentDefinition}}
+)
+async def get_component_details(component_id: str, request: Request) -> Response:
     """
     특정 컴포넌트 상세 정보 조회
     
     Args:
         component_id: 컴포넌트 ID
+        request: 요청 객체 (If-None-Match 확인용)
         
     Returns:
-        ComponentDefinition: 컴포넌트 정의
+        Response: 컴포넌트 정의 (미리 직렬화된 JSON, 변경 없으면 304)
     """
-    component = next(
-        (c for c in AVAILABLE_COMPONENTS if c.id == component_id),
-        None
-    )
+    component_payload = _COMPONENT_PAYLOAD_BY_ID.get(component_id)
     
-    if not component:
+    if component_payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Component not found: {component_id}"
         )
     
-    return component
+    return _static_json_response(request, *component_payload)
 
 
-@router.post("/validate", response_model=Dict[str, Any])
+@router.post(
+    "/validate",
+    response_model=Dict[str, Any],
+    openapi_extra=_json_body_openapi(GraphState)
+)
 async def validate_pipeline_graph(
-    graph: GraphState,
+    graph: GraphState = Depends(_parse_graph_body),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
@@ -323,39 +539,10 @@ async def validate_pipeline_graph(
     Returns:
         Dict[str, Any]: 검증 결과
     """
-    errors = []
-    warnings = []
-    
-    # 노드 ID 중복 확인
-    node_ids = [node.id for node in graph.nodes]
-    if len(node_ids) != len(set(node_ids)):
-        errors.append("Duplicate node IDs found")
-    
-    # 엣지 유효성 확인
-    for edge in graph.edges:
-        if edge.source not in node_ids:
-            errors.append(f"Edge source '{edge.source}' not found in nodes")
-        if edge.target not in node_ids:
-            errors.append(f"Edge target '{edge.target}' not found in nodes")
-    
-    # 입력/출력 노드 확인
-    input_nodes = [n for n in graph.nodes if n.type == "input"]
-    output_nodes = [n for n in graph.nodes if n.type == "output"]
-    
-    if not input_nodes:
-        warnings.append("No input nodes found")
-    if not output_nodes:
-        warnings.append("No output nodes found")
-    
-    # 연결성 확인 (간단한 버전)
-    connected_nodes = set()
-    for edge in graph.edges:
-        connected_nodes.add(edge.source)
-        connected_nodes.add(edge.target)
-    
-    isolated_nodes = set(node_ids) - connected_nodes
-    if isolated_nodes:
-        warnings.append(f"Isolated nodes found: {list(isolated_nodes)}")
+    # 그래프 분석 (구조 오류/경고를 한 번의 순회로 수집, 컴파일과 공유)
+    analysis = _analyze_graph(graph)
+    errors = analysis.errors
+    warnings = analysis.warnings
     
     # 결과 구성
     is_valid = len(errors) == 0
@@ -373,103 +560,83 @@ async def validate_pipeline_graph(
     return result
 
 
-@router.post("/compile", response_model=Dict[str, Any])
+@router.post(
+    "/compile",
+    response_model=Dict[str, Any],
+    openapi_extra=_json_body_openapi(CompileRequest)
+)
 async def compile_pipeline_graph(
-    graph: GraphState,
-    pipeline_name: str = Body(...),
+    request: Request,
+    compile_request: CompileRequest = Depends(_parse_compile_body),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
     파이프라인 그래프를 실행 가능한 코드로 컴파일
     
+    생성된 코드는 응답에 포함하지 않고 code_url(GET)로 따로 제공합니다.
+    
     Args:
-        graph: 컴파일할 그래프
-        pipeline_name: 파이프라인 이름
+        request: 요청 객체 (code_url 생성용)
+        compile_request: 컴파일할 그래프와 파이프라인 이름
         current_user: 현재 사용자
         
     Returns:
-        Dict[str, Any]: 컴파일 결과
+        Dict[str, Any]: 컴파일 결과 메타데이터
     """
+    graph = compile_request.graph
+    pipeline_name = compile_request.pipeline_name
+    
     try:
-        # 그래프 검증
-        validation = await validate_pipeline_graph(graph, current_user)
-        if not validation["is_valid"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid graph: {validation['errors']}"
-            )
-        
-        # 노드를 컴포넌트 타입별로 그룹화
-        nodes_by_type = {}
-        for node in graph.nodes:
-            node_type = node.data.type
-            if node_type not in nodes_by_type:
-                nodes_by_type[node_type] = []
-            nodes_by_type[node_type].append(node)
-        
-        # 실행 순서 결정 (간단한 토폴로지 정렬)
-        execution_order = _topological_sort(graph.nodes, graph.edges)
-        
-        # LangGraph 코드 생성 (의사 코드)
-        code_snippet = f"""
-# Auto-generated RAG Pipeline: {pipeline_name}
-# Generated at: {datetime.utcnow().isoformat()}
-
-from langchain.schema import Document
-from langgraph.graph import StateGraph, END
-
-# Define the graph state
-class PipelineState(TypedDict):
-    query: str
-    documents: List[Document]
-    embeddings: List[List[float]]
-    retrieved_docs: List[Document]
-    answer: str
-
-# Create the graph
-workflow = StateGraph(PipelineState)
-
-# Add nodes based on components
-"""
+        # 동일한 그래프의 재컴파일은 캐시된 결과 재사용
+        cache_key = _compile_cache_key(graph, pipeline_name)
+        compiled = _compile_cache.get(cache_key)
         
-        for node in execution_order:
-            component_type = node.data.type
-            config = node.data.config or {}
+        if compiled is None:
+            # 그래프 분석 (구조 검증과 실행 순서 결정을 한 번에 수행)
+            analysis = _analyze_graph(graph)
+            if analysis.errors:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid graph: {analysis.errors}"
+                )
+            if analysis.order is None:
+                raise ValueError("Graph contains a cycle")
             
-            code_snippet += f"""
-# Node: {node.data.label} ({component_type})
-async def {node.id}_node(state: PipelineState) -> PipelineState:
-    # Component configuration: {json.dumps(config, indent=2)}
-    # TODO: Implement {component_type} logic
-    return state
-
-workflow.add_node("{node.id}", {node.id}_node)
-"""
+            execution_order = analysis.order
+            
+            # (생성 코드 바이트, 메타데이터)
+            compiled = (
+                _generate_code_snippet(pipeline_name, execution_order, graph.edges).encode(),
+                {
+                    "execution_order": [node.id for node in execution_order],
+                    "component_count": len(graph.nodes),
+                    "connection_count": len(graph.edges),
+                    "estimated_latency_ms": len(graph.nodes) * 100  # 예상 지연시간
+                }
+            )
+            _compile_cache[cache_key] = compiled
         
-        # 엣지 추가
-        code_snippet += "\n# Add edges\n"
-        for edge in graph.edges:
-            code_snippet += f'workflow.add_edge("{edge.source}", "{edge.target}")\n'
+        code, metadata = compiled
         
-        # 파이프라인 ID 생성
+        # 파이프라인 ID 생성 (캐시 적중 시에도 요청마다 새로 발급)
         pipeline_id = str(uuid.uuid4())
+        _compiled_code_cache[pipeline_id] = code
         
-        # 결과 반환
+        # 결과 반환 (코드는 code_url에서 조회)
         result = {
             "pipeline_id": pipeline_id,
             "pipeline_name": pipeline_name,
-            "code_snippet": code_snippet,
-            "execution_order": [node.id for node in execution_order],
-            "component_count": len(graph.nodes),
-            "connection_count": len(graph.edges),
-            "estimated_latency_ms": len(graph.nodes) * 100,  # 예상 지연시간
-            "compiled_at": datetime.utcnow().isoformat()
+            "code_url": request.app.url_path_for("get_compiled_code", pipeline_id=pipeline_id),
+            **metadata,
+            "compiled_at": _utc_now_iso()
         }
         
         logger.info(f"파이프라인 컴파일 완료: {pipeline_name}, user={current_user.username}")
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"파이프라인 컴파일 실패: {str(e)}")
         raise HTTPException(
@@ -478,83 +645,61 @@ workflow.add_node("{node.id}", {node.id}_node)
         )
 
 
-@router.get("/templates", response_model=List[PipelineTemplate])
-async def get_pipeline_templates() -> List[PipelineTemplate]:
+@router.get("/pipelines/{pipeline_id}/code", response_class=PlainTextResponse)
+async def get_compiled_code(
+    pipeline_id: str,
+    current_user: User = Depends(get_current_user)
+) -> PlainTextResponse:
     """
-    사전 정의된 파이프라인 템플릿 목록 조회
+    컴파일된 파이프라인 코드 조회
+    
+    JSON 이스케이프 없이 생성된 코드를 그대로 반환합니다.
     
+    Args:
+        pipeline_id: 컴파일 결과의 파이프라인 ID
+        current_user: 현재 사용자
+        
     Returns:
-        List[PipelineTemplate]: 템플릿 목록
+        PlainTextResponse: 생성된 코드 (text/x-python)
     """
-    # 샘플 템플릿들
-    templates = [
-        {
-            "id": "basic-rag",
-            "name": "Basic RAG Pipeline",
-            "description": "Simple retrieval-augmented generation pipeline",
-            "category": "starter",
-            "graph": {
-                "nodes": [
-                    {
-                        "id": "loader",
-                        "type": "input",
-                        "position": {"x": 100, "y": 100},
-                        "data": {
-                            "label": "Document Loader",
-                            "type": "data_loader",
-                            "config": {"source_type": "file"}
-                        }
-                    },
-                    {
-                        "id": "splitter",
-                        "type": "process",
-                        "position": {"x": 300, "y": 100},
-                        "data": {
-                            "label": "Text Splitter",
-                            "type": "text_splitter",
-                            "config": {"chunk_size": 1000}
-                        }
-                    },
-                    {
-                        "id": "embedder",
-                        "type": "process",
-                        "position": {"x": 500, "y": 100},
-                        "data": {
-                            "label": "Embedding Model",
-                            "type": "embedding_model",
-                            "config": {"model": "openai"}
-                        }
-                    },
-                    {
-                        "id": "output",
-                        "type": "output",
-                        "position": {"x": 700, "y": 100},
-                        "data": {
-                            "label": "Output",
-                            "type": "output_parser",
-                            "config": {"format": "text"}
-                        }
-                    }
-                ],
-                "edges": [
-                    {"id": "e1", "source": "loader", "target": "splitter"},
-                    {"id": "e2", "source": "splitter", "target": "embedder"},
-                    {"id": "e3", "source": "embedder", "target": "output"}
-                ]
-            },
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
-    ]
+    code = _compiled_code_cache.get(pipeline_id)
     
-    return templates
+    if code is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Compiled code not found or expired: {pipeline_id}"
+        )
+    
+    return PlainTextResponse(content=code, media_type="text/x-python")
+
+
+@router.get(
+    "/templates",
+    response_class=Response,
+    responses={200: {"model": List[PipelineTemplate]}}
+)
+async def get_pipeline_templates(request: Request) -> Response:
+    """
+    사전 정의된 파이프라인 템플릿 목록 조회
+    
+    Args:
+        request: 요청 객체 (If-None-Match 확인용)
+        
+    Returns:
+        Response: 템플릿 목록 (미리 직렬화된 JSON, 변경 없으면 304)
+    """
+    return _static_json_response(request, *_TEMPLATES_PAYLOAD)
 
 
-@router.post("/templates/{template_id}/clone", response_model=GraphState)
+@router.post(
+    "/templates/{template_id}/clone",
+    response_class=Response,
+    responses={200: {"model": GraphState}}
+)
 async def clone_template(
     template_id: str,
     current_user: User = Depends(get_current_user)
-) -> GraphState:
+) -> Response:
     """
     템플릿을 복제하여 새 파이프라인 생성
     
@@ -563,11 +708,10 @@ async def clone_template(
         current_user: 현재 사용자
         
     Returns:
-        GraphState: 복제된 그래프
+        Response: 복제된 그래프 (JSON)
     """
     # 템플릿 조회 (실제로는 DB에서)
-    templates = await get_pipeline_templates()
-    template = next((t for t in templates if t["id"] == template_id), None)
+    template = _TEMPLATE_BY_ID.get(template_id)
     
     if not template:
         raise HTTPException(
@@ -575,64 +719,244 @@ async def clone_template(
             detail=f"Template not found: {template_id}"
         )
     
-    # 새 ID로 노드 복제
-    cloned_graph = template["graph"].copy()
+    # 새 ID로 노드 복제 (공유 템플릿이 변경되지 않도록 깊은 복사)
+    cloned_graph = copy.deepcopy(template["graph"])
+    
+    nodes = cloned_graph["nodes"]
+    edges = cloned_graph["edges"]
+    
+    # 노드/엣지 수만큼 새 ID 접미사(8자리 16진수)를 난수 한 번으로 생성
+    id_count = len(nodes) + len(edges)
+    random_hex = os.urandom(4 * id_count).hex()
+    suffixes = [random_hex[i:i + 8] for i in range(0, 8 * id_count, 8)]
     
     # 노드 ID 재생성
     id_mapping = {}
-    for node in cloned_graph["nodes"]:
+    for node, suffix in zip(nodes, suffixes):
         old_id = node["id"]
-        new_id = f"{old_id}_{uuid.uuid4().hex[:8]}"
+        new_id = f"{old_id}_{suffix}"
         id_mapping[old_id] = new_id
         node["id"] = new_id
     
     # 엣지 ID 및 참조 업데이트
-    for edge in cloned_graph["edges"]:
-        edge["id"] = f"e_{uuid.uuid4().hex[:8]}"
+    for edge, suffix in zip(edges, suffixes[len(nodes):]):
+        edge["id"] = f"e_{suffix}"
         edge["source"] = id_mapping.get(edge["source"], edge["source"])
         edge["target"] = id_mapping.get(edge["target"], edge["target"])
     
     logger.info(f"템플릿 복제 완료: {template_id}, user={current_user.username}")
     
-    return GraphState(**cloned_graph)
+    # 서버 데이터이므로 재검증 없이 바로 직렬화
+    return Response(content=orjson.dumps(cloned_graph), media_type="application/json")
+
+
+# 초 단위로 캐시한 현재 시각 ISO 문자열 (epoch 초, 문자열)
+_now_cache: Tuple[int, str] = (0, "")
+
+
+def _utc_now_iso() -> str:
+    """
+    현재 UTC 시각의 ISO 8601 문자열 (초 단위 해상도)
+    
+    같은 초 안의 호출은 datetime 객체 생성 없이 캐시된 문자열을 반환합니다.
+    """
+    global _now_cache
+    now = int(time.time())
+    if now != _now_cache[0]:
+        _now_cache = (now, datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+    return _now_cache[1]
+
+
+# 코드 생성 템플릿 (요청마다 f-string을 다시 구성하지 않도록 모듈 상수로 유지)
+_HEADER_TEMPLATE = """
+# Auto-generated RAG Pipeline: {pipeline_name}
+# Generated at: {generated_at}
+
+from langchain.schema import Document
+from langgraph.graph import StateGraph, END
+
+# Define the graph state
+class PipelineState(TypedDict):
+    query: str
+    documents: List[Document]
+    embeddings: List[List[float]]
+    retrieved_docs: List[Document]
+    answer: str
+
+# Create the graph
+workflow = StateGraph(PipelineState)
+
+# Add nodes based on components
+"""
+
+_NODE_TEMPLATE = """
+# Node: {label} ({type})
+async def {id}_node(state: PipelineState) -> PipelineState:
+    # Component configuration: {config}
+    # TODO: Implement {type} logic
+    return state
+
+workflow.add_node("{id}", {id}_node)
+"""
+
+_EDGE_TEMPLATE = 'workflow.add_edge("{source}", "{target}")\n'
 
 
-def _topological_sort(nodes: List[GraphNode], edges: List[GraphEdge]) -> List[GraphNode]:
+def _generate_code_snippet(
+    pipeline_name: str,
+    execution_order: List[GraphNode],
+    edges: List[GraphEdge]
+) -> str:
     """
-    토폴로지 정렬을 사용한 노드 실행 순서 결정
+    실행 순서에 따른 LangGraph 코드 스니펫 생성
     
     Args:
-        nodes: 노드 리스트
+        pipeline_name: 파이프라인 이름
+        execution_order: 정렬된 노드 리스트
         edges: 엣지 리스트
         
     Returns:
-        List[GraphNode]: 정렬된 노드 리스트
+        str: 생성된 코드 (의사 코드)
+    """
+    # LangGraph 코드 생성 (의사 코드, 조각을 모아 한 번에 결합)
+    parts = [_HEADER_TEMPLATE.format(
+        pipeline_name=pipeline_name,
+        generated_at=_utc_now_iso()
+    )]
+    
+    for node in execution_order:
+        config = node.data.config or {}
+        parts.append(_NODE_TEMPLATE.format(
+            id=node.id,
+            label=node.data.label,
+            type=node.data.type,
+            config=orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+        ))
+    
+    # 엣지 추가
+    parts.append("\n# Add edges\n")
+    parts.extend(_EDGE_TEMPLATE.format(source=edge.source, target=edge.target) for edge in edges)
+    
+    return "".join(parts)
+
+
+def _compile_cache_key(graph: GraphState, pipeline_name: str) -> str:
+    """코드 생성에 영향을 주는 그래프 구조와 이름으로 컴파일 캐시 키 생성"""
+    payload = orjson.dumps(
+        [
+            pipeline_name,
+            [(n.id, n.type, n.data.label, n.data.type, n.data.config) for n in graph.nodes],
+            [(e.source, e.target) for e in graph.edges]
+        ],
+        option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _analyze_graph(graph: GraphState) -> GraphAnalysis:
+    """
+    그래프 구조 분석 (검증과 컴파일이 공유하는 단일 패스)
+    
+    노드/엣지를 각각 한 번씩 순회하며 오류, 경고, ID 인덱스, 인접 리스트를
+    함께 구성하고, 구조 오류가 없으면 실행 순서까지 계산합니다.
+    
+    Args:
+        graph: 분석할 그래프
+        
+    Returns:
+        GraphAnalysis: 분석 결과
+    """
+    errors = []
+    warnings = []
+    
+    # 노드 순회: ID 인덱스, 중복 여부, 입력/출력 노드 확인
+    by_id: Dict[str, GraphNode] = {}
+    has_duplicates = has_input = has_output = False
+    for node in graph.nodes:
+        if node.id in by_id:
+            has_duplicates = True
+        by_id[node.id] = node
+        if node.type == "input":
+            has_input = True
+        elif node.type == "output":
+            has_output = True
+    
+    if has_duplicates:
+        errors.append("Duplicate node IDs found")
+    
+    # 엣지 순회: 유효성 확인, 연결된 노드 수집
+    connected_nodes = set()
+    for edge in graph.edges:
+        source_exists = edge.source in by_id
+        target_exists = edge.target in by_id
+        if not source_exists:
+            errors.append(f"Edge source '{edge.source}' not found in nodes")
+        if not target_exists:
+            errors.append(f"Edge target '{edge.target}' not found in nodes")
+        connected_nodes.add(edge.source)
+        connected_nodes.add(edge.target)
+    
+    if not has_input:
+        warnings.append("No input nodes found")
+    if not has_output:
+        warnings.append("No output nodes found")
+    
+    # 연결성 확인 (간단한 버전)
+    isolated_nodes = by_id.keys() - connected_nodes
+    if isolated_nodes:
+        warnings.append(f"Isolated nodes found: {list(isolated_nodes)}")
+    
+    # 구조 오류가 없을 때만 실행 순서 결정 (동일 구조는 메모이제이션된 결과 재사용)
+    order = None
+    if not errors:
+        order_ids = _topological_sort_ids(
+            tuple(node.id for node in graph.nodes),
+            tuple((edge.source, edge.target) for edge in graph.edges)
+        )
+        if order_ids is not None:
+            order = [by_id[node_id] for node_id in order_ids]
+    
+    return GraphAnalysis(errors=errors, warnings=warnings, order=order, by_id=by_id)
+
+
+@lru_cache(maxsize=512)
+def _topological_sort_ids(
+    node_ids: Tuple[str, ...],
+    edges: Tuple[Tuple[str, str], ...]
+) -> Optional[Tuple[str, ...]]:
     """
-    # 인접 리스트 구성
-    adj_list = {node.id: [] for node in nodes}
-    in_degree = {node.id: 0 for node in nodes}
+    토폴로지 정렬을 사용한 노드 실행 순서 결정 (ID 기반 순수 함수, 결과 캐시)
     
-    for edge in edges:
-        adj_list[edge.source].append(edge.target)
-        in_degree[edge.target] += 1
+    Args:
+        node_ids: 노드 ID 튜플 (입력 순서 유지)
+        edges: (source, target) 엣지 튜플
+        
+    Returns:
+        Optional[Tuple[str, ...]]: 정렬된 노드 ID (사이클이 있으면 None)
+    """
+    # 인접 리스트 및 진입 차수 구성
+    adj = defaultdict(list)
+    in_degree = dict.fromkeys(node_ids, 0)
+    for source, target in edges:
+        adj[source].append(target)
+        in_degree[target] += 1
     
     # 진입 차수가 0인 노드로 시작
-    queue = [node for node in nodes if in_degree[node.id] == 0]
+    queue = deque(node_id for node_id in node_ids if in_degree[node_id] == 0)
     result = []
     
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
         result.append(current)
         
         # 인접 노드의 진입 차수 감소
-        for neighbor_id in adj_list[current.id]:
+        for neighbor_id in adj[current]:
             in_degree[neighbor_id] -= 1
             if in_degree[neighbor_id] == 0:
-                neighbor = next(n for n in nodes if n.id == neighbor_id)
-                queue.append(neighbor)
+                queue.append(neighbor_id)
     
     # 사이클 확인
-    if len(result) != len(nodes):
-        raise ValueError("Graph contains a cycle")
+    if len(result) != len(node_ids):
+        return None
     
-    return result
\ No newline at end of file
+    return tuple(result)
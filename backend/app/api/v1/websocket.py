@@ -7,41 +7,120 @@ WebSocket API 엔드포인트
 
 import json
 import asyncio
-from typing import Dict, Set, Optional
+import itertools
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
+import orjson
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
 from fastapi.exceptions import WebSocketException
 
+from app.core.config import settings
 from app.utils.logger import logger
 from app.core.security import verify_token
 
 router = APIRouter()
 
+
+@dataclass(slots=True)
+class ClientConnection:
+    """
+    개별 WebSocket 연결 상태
+    
+    전송은 연결마다 하나인 writer 태스크가 queue 를 소비하며 수행합니다.
+    queue 항목은 (메시지 타입, 직렬화된 텍스트) 튜플입니다.
+    """
+    websocket: WebSocket
+    queue: asyncio.Queue
+    writer: asyncio.Task
+
+
 # 연결된 WebSocket 클라이언트 관리
 class ConnectionManager:
     """WebSocket 연결 관리자"""
     
+    # 연결당 대기 가능한 최대 메시지 수 (느린 클라이언트의 메모리 사용 상한)
+    QUEUE_MAXSIZE = 256
+    # 최신 값만 의미 있는 진행률 메시지 타입 (큐 초과 시 오래된 것부터 폐기 가능)
+    COALESCE_TYPES = frozenset({"pipeline_progress", "benchmark_progress"})
+    # 폐기할 수 없는 메시지가 큐 초과일 때 사용하는 종료 코드 (Try Again Later)
+    OVERLOADED_CLOSE_CODE = 1013
+    # 캐시된 타임스탬프 갱신 주기 (초)
+    CLOCK_INTERVAL_SECONDS = 0.025
+    
     def __init__(self):
-        # 활성 연결: {user_id: {connection_id: websocket}}
-        self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
+        # 활성 연결: {user_id: {connection_id: ClientConnection}}
+        self.active_connections: Dict[str, Dict[int, ClientConnection]] = {}
         # 구독 관리: {topic: set(user_ids)}
         self.subscriptions: Dict[str, Set[str]] = {}
+        # 브로드캐스트 메시지 순번 (클라이언트가 유실 구간을 감지할 수 있도록)
+        self._seq = itertools.count(1)
+        # 과부하로 종료 중인 소켓 close 태스크 (GC 방지용 참조 보관)
+        self._closing: Set[asyncio.Task] = set()
+        # 메시지 timestamp 용 ISO 문자열 (clock 태스크가 주기적으로 갱신)
+        self.now_iso: str = datetime.utcnow().isoformat()
+        self._clock_task: Optional[asyncio.Task] = None
+        # 병합 대기 중인 진행률 메시지: {(topic, type): 최신 message}
+        self._pending: Dict[Tuple[str, str], Dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._coalesce_seconds = settings.WS_COALESCE_MS / 1000
         
-    async def connect(self, websocket: WebSocket, user_id: str, connection_id: str):
+    async def connect(self, websocket: WebSocket, user_id: str, connection_id: int):
         """새 WebSocket 연결 수락"""
         await websocket.accept()
+        self._ensure_clock()
         
         if user_id not in self.active_connections:
             self.active_connections[user_id] = {}
         
-        self.active_connections[user_id][connection_id] = websocket
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        writer = asyncio.create_task(self._writer(websocket, queue, user_id, connection_id))
+        self.active_connections[user_id][connection_id] = ClientConnection(
+            websocket=websocket, queue=queue, writer=writer
+        )
         logger.info(f"WebSocket 연결 수립: user={user_id}, conn={connection_id}")
+    
+    def _ensure_clock(self):
+        """타임스탬프 갱신 태스크를 필요할 때 시작"""
+        if self._clock_task is None or self._clock_task.done():
+            self.now_iso = datetime.utcnow().isoformat()
+            self._clock_task = asyncio.create_task(self._clock())
+    
+    async def _clock(self):
+        """
+        now_iso 주기적 갱신
         
-    def disconnect(self, user_id: str, connection_id: str):
+        브로드캐스트마다 datetime 을 생성/포맷하지 않도록 CLOCK_INTERVAL_SECONDS
+        단위로 갱신한 문자열을 공유합니다. 연결이 모두 끊기면 종료되며,
+        다음 connect 에서 다시 시작됩니다.
+        """
+        while self.active_connections:
+            await asyncio.sleep(self.CLOCK_INTERVAL_SECONDS)
+            self.now_iso = datetime.utcnow().isoformat()
+    
+    @staticmethod
+    async def _writer(
+        websocket: WebSocket, queue: asyncio.Queue, user_id: str, connection_id: int
+    ):
+        """연결별 전송 루프 (큐에 쌓인 메시지를 순서대로 전송)"""
+        try:
+            while True:
+                _, text = await queue.get()
+                await websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 태스크가 종료되면 다음 전송 시 끊긴 연결로 판단되어 정리됨
+            logger.error(f"메시지 전송 실패: user={user_id}, conn={connection_id}, {e}")
+        
+    def disconnect(self, user_id: str, connection_id: int):
         """WebSocket 연결 종료"""
         if user_id in self.active_connections:
-            self.active_connections[user_id].pop(connection_id, None)
+            conn = self.active_connections[user_id].pop(connection_id, None)
+            if conn is not None:
+                conn.writer.cancel()
             
             # 사용자의 모든 연결이 종료되면 딕셔너리에서 제거
             if not self.active_connections[user_id]:
@@ -72,37 +151,180 @@ class ConnectionManager:
         
         logger.info(f"토픽 구독 해제: user={user_id}, topic={topic}")
     
-    async def send_personal_message(self, message: Dict, user_id: str):
-        """특정 사용자에게 메시지 전송"""
-        if user_id in self.active_connections:
-            disconnected = []
-            
-            for conn_id, websocket in self.active_connections[user_id].items():
-                try:
-                    await websocket.send_json(message)
-                except Exception as e:
-                    logger.error(f"메시지 전송 실패: {e}")
-                    disconnected.append(conn_id)
-            
-            # 연결이 끊긴 클라이언트 정리
-            for conn_id in disconnected:
-                self.disconnect(user_id, conn_id)
+    def _enqueue(
+        self,
+        text: str,
+        user_id: str,
+        connection_id: Optional[int] = None,
+        msg_type: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        사용자(또는 특정 연결)의 전송 큐에 메시지 적재
+        
+        writer 가 종료되었거나 과부하로 닫힌 (user_id, connection_id)
+        목록을 반환합니다. 큐가 가득 차면 오래된 진행률 메시지를 먼저
+        폐기하고, 그래도 자리가 없으면 msg_type 에 따라 새 메시지를
+        버리거나 연결을 닫습니다.
+        """
+        connections = self.active_connections.get(user_id)
+        if not connections:
+            return []
+        
+        if connection_id is not None:
+            conn = connections.get(connection_id)
+            targets = [(connection_id, conn)] if conn is not None else []
+        else:
+            targets = list(connections.items())
+        
+        item = (msg_type, text)
+        disconnected = []
+        for conn_id, conn in targets:
+            if conn.writer.done():
+                disconnected.append((user_id, conn_id))
+                continue
+            try:
+                conn.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if self._make_room(conn.queue, msg_type):
+                    conn.queue.put_nowait(item)
+                elif msg_type in self.COALESCE_TYPES:
+                    # 새 진행률 메시지는 다음 진행률로 대체되므로 버려도 무방
+                    logger.warning(f"전송 큐 초과로 진행률 메시지 폐기: user={user_id}, conn={conn_id}")
+                else:
+                    # 종료 상태 메시지는 유실시킬 수 없으므로 연결을 닫아 재연결 유도
+                    logger.warning(f"전송 큐 초과로 연결 종료: user={user_id}, conn={conn_id}")
+                    self._close_overloaded(conn.websocket)
+                    disconnected.append((user_id, conn_id))
+        
+        return disconnected
+    
+    def _make_room(self, queue: asyncio.Queue, msg_type: Optional[str]) -> bool:
+        """
+        가득 찬 큐에서 가장 오래된 진행률 메시지 하나를 제거
+        
+        진행률 메시지는 최신 값만 의미가 있으므로 제거해도 되지만,
+        pipeline_status / benchmark_result 등은 보존합니다.
+        제거에 성공하면 True 를 반환합니다.
+        """
+        # asyncio.Queue 는 중간 항목 제거 API 가 없어 내부 deque 를 직접 다룸
+        pending = queue._queue
+        for index, (queued_type, _) in enumerate(pending):
+            if queued_type in self.COALESCE_TYPES:
+                del pending[index]
+                return True
+        return False
+    
+    def _close_overloaded(self, websocket: WebSocket):
+        """과부하 연결을 1013 코드로 종료 (대기하지 않고 예약)"""
+        task = asyncio.create_task(
+            websocket.close(code=self.OVERLOADED_CLOSE_CODE, reason="Client too slow")
+        )
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+    
+    async def send_personal_message(
+        self, message: Union[Dict, bytes], user_id: str
+    ) -> List[Tuple[str, int]]:
+        """
+        특정 사용자에게 메시지 전송
+        
+        message 는 dict 또는 orjson 으로 미리 직렬화한 bytes 를 받습니다.
+        실제 전송은 연결별 writer 가 담당하며, 끊긴
+        (user_id, connection_id) 목록을 반환합니다. 정리는 호출자가
+        cleanup_connections 로 한 번에 수행합니다.
+        """
+        if isinstance(message, bytes):
+            return self._enqueue(message.decode(), user_id)
+        return self._enqueue(orjson.dumps(message).decode(), user_id, msg_type=message.get("type"))
+    
+    async def send_to_connection(
+        self, message: Dict, user_id: str, connection_id: int
+    ) -> bool:
+        """
+        특정 연결에만 메시지 전송
+        
+        브로드캐스트와 같은 큐를 거치므로 전송 순서가 섞이지 않습니다.
+        연결이 이미 끊겼으면 정리 후 False 를 반환합니다.
+        """
+        if connection_id not in self.active_connections.get(user_id, {}):
+            return False
+        
+        disconnected = self._enqueue(
+            orjson.dumps(message).decode(), user_id, connection_id, message.get("type")
+        )
+        self.cleanup_connections(disconnected)
+        return not disconnected
+    
+    def cleanup_connections(self, disconnected: Iterable[Tuple[str, int]]):
+        """전송 실패한 연결 일괄 정리"""
+        for user_id, conn_id in disconnected:
+            self.disconnect(user_id, conn_id)
+    
+    def _fan_out(self, message: Dict, user_ids: List[str]):
+        """
+        여러 사용자의 전송 큐에 메시지 적재
+        
+        큐 적재는 대기하지 않으므로 느린 클라이언트가 다른 구독자를
+        막지 않으며, 끊긴 연결은 적재가 끝난 뒤 한 번에 정리합니다.
+        """
+        # 구독자 수만큼 반복 직렬화하지 않도록 한 번만 인코딩
+        text = orjson.dumps({**message, "seq": next(self._seq)}).decode()
+        msg_type = message.get("type")
+        disconnected = []
+        for user_id in user_ids:
+            disconnected.extend(self._enqueue(text, user_id, msg_type=msg_type))
+        
+        self.cleanup_connections(disconnected)
     
     async def broadcast_to_topic(self, message: Dict, topic: str):
-        """토픽 구독자들에게 브로드캐스트"""
-        if topic in self.subscriptions:
-            for user_id in self.subscriptions[topic]:
-                await self.send_personal_message(message, user_id)
+        """
+        토픽 구독자들에게 브로드캐스트
+        
+        진행률 메시지는 WS_COALESCE_MS 동안 (topic, type) 별 최신 값만 남겨
+        한 번에 전송합니다. 그 외 메시지는 즉시 전송하되, 같은 토픽에
+        대기 중인 진행률을 먼저 내보내 순서(seq)가 뒤바뀌지 않도록 합니다.
+        """
+        msg_type = message.get("type")
+        if self._coalesce_seconds > 0 and msg_type in self.COALESCE_TYPES:
+            self._pending[(topic, msg_type)] = message
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_pending())
+            return
+        
+        if self._pending:
+            for key in [key for key in self._pending if key[0] == topic]:
+                self._send_to_topic(self._pending.pop(key), topic)
+        
+        self._send_to_topic(message, topic)
+    
+    async def _flush_pending(self):
+        """병합된 진행률 메시지를 주기적으로 전송 (대기 메시지가 없으면 종료)"""
+        while self._pending:
+            await asyncio.sleep(self._coalesce_seconds)
+            pending, self._pending = self._pending, {}
+            for (topic, _), message in pending.items():
+                self._send_to_topic(message, topic)
+    
+    def _send_to_topic(self, message: Dict, topic: str):
+        """토픽 구독자들에게 즉시 전송"""
+        # 구독자 스냅샷 확보 (정리 과정에서 집합이 변경될 수 있음)
+        user_ids = list(self.subscriptions.get(topic, ()))
+        if user_ids:
+            self._fan_out(message, user_ids)
     
     async def broadcast_to_all(self, message: Dict):
         """모든 연결된 클라이언트에게 브로드캐스트"""
-        for user_id in list(self.active_connections.keys()):
-            await self.send_personal_message(message, user_id)
+        user_ids = list(self.active_connections.keys())
+        if user_ids:
+            self._fan_out(message, user_ids)
 
 
 # 전역 연결 관리자
 manager = ConnectionManager()
 
+# 프로세스 내 고유 연결 ID 발급기
+_connection_ids = itertools.count(1)
+
 
 @router.websocket("/pipeline/{pipeline_id}")
 async def websocket_pipeline_endpoint(
@@ -126,7 +348,7 @@ async def websocket_pipeline_endpoint(
         return
     
     # 연결 ID 생성
-    connection_id = f"{pipeline_id}_{datetime.utcnow().timestamp()}"
+    connection_id = next(_connection_ids)
     
     # 연결 수락
     await manager.connect(websocket, user_id, connection_id)
@@ -137,12 +359,12 @@ async def websocket_pipeline_endpoint(
     
     try:
         # 초기 상태 전송
-        await websocket.send_json({
+        await manager.send_to_connection({
             "type": "connection",
             "status": "connected",
             "pipeline_id": pipeline_id,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": manager.now_iso
+        }, user_id, connection_id)
         
         # 클라이언트 메시지 처리
         while True:
@@ -153,48 +375,51 @@ async def websocket_pipeline_endpoint(
                 # 메시지 타입에 따른 처리
                 if data.get("type") == "ping":
                     # 핑퐁 처리
-                    await websocket.send_json({
+                    await manager.send_to_connection({
                         "type": "pong",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
+                        "timestamp": manager.now_iso
+                    }, user_id, connection_id)
                 
                 elif data.get("type") == "subscribe":
                     # 추가 토픽 구독
                     new_topic = data.get("topic")
                     if new_topic:
                         manager.subscribe(user_id, new_topic)
-                        await websocket.send_json({
+                        await manager.send_to_connection({
                             "type": "subscribed",
                             "topic": new_topic,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
+                            "timestamp": manager.now_iso
+                        }, user_id, connection_id)
                 
                 elif data.get("type") == "unsubscribe":
                     # 토픽 구독 해제
                     old_topic = data.get("topic")
                     if old_topic:
                         manager.unsubscribe(user_id, old_topic)
-                        await websocket.send_json({
+                        await manager.send_to_connection({
                             "type": "unsubscribed",
                             "topic": old_topic,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
+                            "timestamp": manager.now_iso
+                        }, user_id, connection_id)
                         
             except WebSocketDisconnect:
                 break
             except json.JSONDecodeError:
-                await websocket.send_json({
+                await manager.send_to_connection({
                     "type": "error",
                     "message": "Invalid JSON format",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                    "timestamp": manager.now_iso
+                }, user_id, connection_id)
             except Exception as e:
                 logger.error(f"WebSocket 오류: {str(e)}")
-                await websocket.send_json({
+                sent = await manager.send_to_connection({
                     "type": "error",
                     "message": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                    "timestamp": manager.now_iso
+                }, user_id, connection_id)
+                # 전송 큐 writer 가 종료되었으면 더 이상 수신하지 않음
+                if not sent:
+                    break
                 
     finally:
         # 연결 종료 처리
@@ -224,7 +449,7 @@ async def websocket_benchmark_endpoint(
         return
     
     # 연결 ID 생성
-    connection_id = f"{benchmark_id}_{datetime.utcnow().timestamp()}"
+    connection_id = next(_connection_ids)
     
     # 연결 수락
     await manager.connect(websocket, user_id, connection_id)
@@ -235,12 +460,12 @@ async def websocket_benchmark_endpoint(
     
     try:
         # 초기 상태 전송
-        await websocket.send_json({
+        await manager.send_to_connection({
             "type": "connection",
             "status": "connected",
             "benchmark_id": benchmark_id,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": manager.now_iso
+        }, user_id, connection_id)
         
         # 연결 유지
         while True:
@@ -250,10 +475,10 @@ async def websocket_benchmark_endpoint(
                 
                 # 핑퐁 처리
                 if data.get("type") == "ping":
-                    await websocket.send_json({
+                    await manager.send_to_connection({
                         "type": "pong",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
+                        "timestamp": manager.now_iso
+                    }, user_id, connection_id)
                     
             except WebSocketDisconnect:
                 break
@@ -277,7 +502,7 @@ async def notify_pipeline_status(pipeline_id: str, status: str, message: str = N
             "pipeline_id": pipeline_id,
             "status": status,
             "message": message,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": manager.now_iso
         },
         f"pipeline_{pipeline_id}"
     )
@@ -291,7 +516,7 @@ async def notify_pipeline_progress(pipeline_id: str, progress: float, stage: str
             "pipeline_id": pipeline_id,
             "progress": progress,
             "stage": stage,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": manager.now_iso
         },
         f"pipeline_{pipeline_id}"
     )
@@ -312,7 +537,7 @@ async def notify_benchmark_progress(
             "total": total,
             "progress": (current / total) * 100 if total > 0 else 0,
             "pipeline_id": pipeline_id,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": manager.now_iso
         },
         f"benchmark_{benchmark_id}"
     )
@@ -330,7 +555,7 @@ async def notify_benchmark_result(
             "benchmark_id": benchmark_id,
             "pipeline_id": pipeline_id,
             "metrics": metrics,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": manager.now_iso
         },
         f"benchmark_{benchmark_id}"
     )
\ No newline at end of file
@@ -6,7 +6,8 @@
 애플리케이션 전체에서 사용할 설정값을 제공합니다.
 """
 
-from typing import List, Optional, Union
+import os
+from typing import FrozenSet, List, Optional, Union
 from pathlib import Path
 from functools import lru_cache
 
@@ -58,6 +59,10 @@ class Settings(BaseSettings):
     OPENSEARCH_USER: Optional[str] = Field(default="admin", description="OpenSearch 사용자명")
     OPENSEARCH_PASSWORD: Optional[str] = Field(default="admin", description="OpenSearch 비밀번호")
     OPENSEARCH_USE_SSL: bool = Field(default=False, description="SSL 사용 여부")
+    OPENSEARCH_POOL_MAXSIZE: int = Field(
+        default=32,
+        description="OpenSearch 노드당 최대 HTTP 연결 수 (동시 요청 수 이상으로 설정)"
+    )
     
     # OpenAI 설정
     OPENAI_API_KEY: str = Field(description="OpenAI API 키")
@@ -77,6 +82,14 @@ class Settings(BaseSettings):
         default=30, 
         description="액세스 토큰 만료 시간 (분)"
     )
+    AUTH_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        description="검증된 액세스 토큰 캐시 유지 시간 (초)"
+    )
+    AUTH_CACHE_MAXSIZE: int = Field(
+        default=10000,
+        description="검증된 액세스 토큰 캐시 최대 항목 수"
+    )
     
     # Celery 설정
     CELERY_BROKER_URL: str = Field(
@@ -93,13 +106,13 @@ class Settings(BaseSettings):
         default=104857600,  # 100MB
         description="최대 업로드 파일 크기 (바이트)"
     )
-    ALLOWED_EXTENSIONS: List[str] = Field(
-        default=["pdf", "txt", "docx", "csv", "json"],
+    ALLOWED_EXTENSIONS: FrozenSet[str] = Field(
+        default=frozenset({"pdf", "txt", "docx", "csv", "json"}),
         description="허용된 파일 확장자 목록"
     )
     UPLOAD_DIR: Path = Field(
         default=Path("uploads"),
-        description="업로드 파일 저장 디렉토리"
+        description="업로드 파일 저장 디렉토리 (운영 환경에서는 /dev/shm 등 tmpfs 경로 권장)"
     )
     
     # 벤치마킹 설정
@@ -111,11 +124,26 @@ class Settings(BaseSettings):
         default=1000,
         description="벤치마크 최대 쿼리 수"
     )
+    BENCHMARK_WORKERS: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        description="벤치마크 메트릭 집계 워커 프로세스 수"
+    )
+    
+    # 대용량 색인 설정
+    BULK_THREADS: int = Field(default=4, description="parallel_bulk 워커 스레드 수")
+    BULK_CHUNK_SIZE: int = Field(default=500, description="parallel_bulk 요청당 문서 수")
     
     # RAG 파이프라인 설정
     CHUNK_SIZE: int = Field(default=1000, description="텍스트 청크 크기")
     CHUNK_OVERLAP: int = Field(default=200, description="청크 오버랩 크기")
     TOP_K_RETRIEVAL: int = Field(default=5, description="검색 결과 상위 K개")
+    MAX_CONCURRENT_QUERIES: int = Field(default=32, description="워커당 동시 실행 파이프라인 쿼리 수")
+    
+    # WebSocket 설정
+    WS_COALESCE_MS: int = Field(
+        default=50,
+        description="진행률 WebSocket 메시지 병합 주기 (밀리초, 0이면 병합하지 않음)"
+    )
     
     # 모델 설정
     DEFAULT_TEMPERATURE: float = Field(
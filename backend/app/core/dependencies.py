@@ -5,16 +5,27 @@
 FastAPI의 의존성 주입 시스템을 위한 공통 의존성들을 정의합니다.
 """
 
-from typing import Optional, Annotated
+import asyncio
+import hashlib
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional, Annotated, Tuple
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import security
 from app.core.config import settings
 from app.utils.logger import logger
+from app.db.redis import get_redis
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.user import TokenPayload
@@ -31,6 +42,50 @@ optional_oauth2_scheme = OAuth2PasswordBearer(
     auto_error=False
 )
 
+# 검증된 토큰 캐시: sha256(token)[:16] -> (분리된 User 객체, 토큰 만료 시각)
+_user_cache: TTLCache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+
+# 동일 토큰에 대한 동시 캐시 미스를 하나로 합치기 위한 샤드 락
+_user_cache_locks = [asyncio.Lock() for _ in range(16)]
+
+
+def _token_cache_key(token: str) -> bytes:
+    """토큰 캐시 키 생성 (토큰 원문은 메모리에 보관하지 않음)"""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _get_cached_user(key: bytes) -> Optional[User]:
+    """캐시된 사용자 조회 (토큰 만료 시각이 지난 항목은 제거)"""
+    entry: Optional[Tuple[User, float]] = _user_cache.get(key)
+    if entry is None:
+        return None
+    
+    user, expires_at = entry
+    if expires_at <= time.time():
+        _user_cache.pop(key, None)
+        return None
+    
+    return user
+
+
+def invalidate_user_cache(user_id) -> None:
+    """
+    특정 사용자의 캐시된 토큰 검증 결과 제거
+    
+    로그아웃, 사용자 정보 변경 시 호출하여 오래된 사용자 정보가
+    재사용되지 않도록 합니다.
+    
+    Args:
+        user_id: 사용자 ID
+    """
+    user_id = str(user_id)
+    for key, (user, _) in list(_user_cache.items()):
+        if str(user.id) == user_id:
+            _user_cache.pop(key, None)
+
 
 async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -39,6 +94,9 @@ async def get_current_user(
     """
     현재 인증된 사용자 조회
     
+    검증된 토큰은 짧은 TTL 동안 캐싱하여 반복 요청 시
+    JWT 검증과 사용자 조회를 생략합니다.
+    
     Args:
         db: 데이터베이스 세션
         token: JWT 액세스 토큰
@@ -56,6 +114,33 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    key = _token_cache_key(token)
+    
+    # 캐시 적중 시 JWT 검증과 DB 조회 생략
+    cached_user = _get_cached_user(key)
+    if cached_user is None:
+        async with _user_cache_locks[key[0] % len(_user_cache_locks)]:
+            # 락 대기 중 다른 요청이 캐시를 채웠는지 재확인
+            cached_user = _get_cached_user(key)
+            if cached_user is None:
+                cached_user = await _load_user_from_token(db, token, credentials_exception)
+                _user_cache[key] = (cached_user, _token_expires_at(token))
+    
+    # 캐시된 객체는 세션에서 분리되어 있으므로 현재 세션에 DB 조회 없이 연결
+    return await db.merge(cached_user, load=False)
+
+
+async def _load_user_from_token(
+    db: AsyncSession,
+    token: str,
+    credentials_exception: HTTPException
+) -> User:
+    """
+    토큰을 검증하고 사용자를 조회한 뒤 세션에서 분리하여 반환
+    
+    Raises:
+        HTTPException: 인증 실패 시
+    """
     try:
         # 토큰 검증
         user_id = security.verify_token(token, token_type="access")
@@ -65,12 +150,12 @@ async def get_current_user(
         # 토큰 페이로드 생성
         token_data = TokenPayload(sub=user_id)
         
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
     
     # 데이터베이스에서 사용자 조회
     result = await db.execute(
-        db.query(User).filter(User.id == token_data.sub)
+        select(User).where(User.id == token_data.sub)
     )
     user = result.scalar_one_or_none()
     
@@ -78,9 +163,18 @@ async def get_current_user(
         logger.warning(f"토큰에 있는 사용자를 찾을 수 없음: {token_data.sub}")
         raise credentials_exception
     
+    db.expunge(user)
     return user
 
 
+def _token_expires_at(token: str) -> float:
+    """검증이 끝난 토큰의 만료 시각 (exp 클레임이 없으면 캐시 TTL 기준)"""
+    exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    if exp is None:
+        return time.time() + settings.AUTH_CACHE_TTL_SECONDS
+    return float(exp)
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
@@ -156,7 +250,7 @@ async def get_optional_current_user(
         
         # 데이터베이스에서 사용자 조회
         result = await db.execute(
-            db.query(User).filter(User.id == user_id)
+            select(User).where(User.id == user_id)
         )
         user = result.scalar_one_or_none()
         
@@ -167,6 +261,19 @@ async def get_optional_current_user(
         return None
 
 
+def now_utc() -> datetime:
+    """
+    요청 시점의 UTC 시각
+    
+    요청당 한 번만 계산되며, DB 컬럼(timezone 없는 DateTime)과 맞도록
+    tzinfo를 제거한 UTC 시각을 반환합니다.
+    
+    Returns:
+        datetime: 현재 UTC 시각
+    """
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).replace(tzinfo=None)
+
+
 class PermissionChecker:
     """
     권한 확인 의존성 클래스
@@ -217,11 +324,28 @@ require_pipeline_delete = PermissionChecker(["pipeline:delete"])
 require_benchmark_create = PermissionChecker(["benchmark:create"])
 
 
+# 슬라이딩 윈도우 rate limit 스크립트 (정리/카운트/기록을 한 번의 왕복으로 원자적으로 수행)
+# KEYS[1]: 식별자 키 / ARGV: 현재 시각(ms), 기간(ms), 허용 횟수, 요청 고유값
+_RATE_LIMIT_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - period)
+if redis.call('ZCARD', key) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, period)
+return 1
+"""
+
+
 class RateLimiter:
     """
     Rate Limiting 의존성 클래스
     
-    API 요청 빈도를 제한합니다.
+    API 요청 빈도를 제한합니다. 요청 기록은 Redis sorted set 에 저장되어
+    여러 워커 프로세스가 같은 한도를 공유합니다.
     """
     
     def __init__(self, calls: int = 10, period: int = 60):
@@ -232,17 +356,22 @@ class RateLimiter:
         """
         self.calls = calls
         self.period = period
-        self.cache = {}  # 실제로는 Redis 사용 권장
+        self._period_ms = period * 1000
+        self._script: Optional[AsyncScript] = None
     
     async def __call__(
         self,
-        current_user: Annotated[Optional[User], Depends(get_optional_current_user)]
+        current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
+        redis: Annotated[Redis, Depends(get_redis)]
     ):
         """
         Rate limit 확인
         
+        Redis 오류 시에는 요청을 막지 않고 경고만 남깁니다.
+        
         Args:
             current_user: 현재 사용자 (선택적)
+            redis: Redis 클라이언트
             
         Raises:
             HTTPException: Rate limit 초과 시
@@ -254,26 +383,25 @@ class RateLimiter:
             # TODO: IP 주소 기반 식별
             identifier = "anonymous"
         
-        # 현재 시간
-        now = datetime.utcnow()
-        
-        # 사용자의 요청 기록 조회
-        user_calls = self.cache.get(identifier, [])
+        if self._script is None:
+            self._script = redis.register_script(_RATE_LIMIT_SCRIPT)
         
-        # 만료된 기록 제거
-        cutoff_time = now - timedelta(seconds=self.period)
-        user_calls = [call_time for call_time in user_calls if call_time > cutoff_time]
+        try:
+            allowed = await self._script(
+                keys=[f"ratelimit:{self.calls}:{self.period}:{identifier}"],
+                args=[int(time.time() * 1000), self._period_ms, self.calls, uuid.uuid4().hex],
+                client=redis
+            )
+        except RedisError as e:
+            logger.warning(f"Rate limit 확인 실패: {str(e)}")
+            return
         
         # Rate limit 확인
-        if len(user_calls) >= self.calls:
+        if not allowed:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded. Maximum {self.calls} calls per {self.period} seconds."
             )
-        
-        # 새 요청 기록
-        user_calls.append(now)
-        self.cache[identifier] = user_calls
 
 
 # Rate limiter 인스턴스들
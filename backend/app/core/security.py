@@ -5,10 +5,14 @@
 JWT 토큰 생성/검증, 비밀번호 해싱 등의 보안 기능을 제공합니다.
 """
 
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Optional, Tuple, Union
 
-from jose import jwt, JWTError
+import jwt
+from cachetools import TTLCache
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -17,6 +21,21 @@ from app.utils.logger import logger
 # 비밀번호 해싱 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 토큰 만료 기간 (모듈 로드 시 한 번만 계산)
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_EXPIRES = timedelta(days=7)
+
+# 서명/검증 키 (요청마다 문자열을 다시 인코딩하지 않도록 미리 구성)
+_JWT_KEY = settings.SECRET_KEY.encode()
+
+# 검증 성공한 토큰 캐시: sha256(token_type:token)[:16] -> (subject, 토큰 만료 시각)
+# 검증 결과는 토큰과 현재 시각만으로 결정되므로 만료 시각만 확인하면 재사용 가능
+_verified_token_cache: TTLCache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+_verified_token_lock = threading.Lock()
+
 
 def create_access_token(
     subject: Union[str, Any], 
@@ -36,9 +55,7 @@ def create_access_token(
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = datetime.utcnow() + _ACCESS_TOKEN_EXPIRES
     
     # 토큰 페이로드 구성
     to_encode = {
@@ -51,7 +68,7 @@ def create_access_token(
     # JWT 토큰 생성
     encoded_jwt = jwt.encode(
         to_encode, 
-        settings.SECRET_KEY, 
+        _JWT_KEY, 
         algorithm=settings.ALGORITHM
     )
     
@@ -76,7 +93,7 @@ def create_refresh_token(
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(days=7)  # 7일
+        expire = datetime.utcnow() + _REFRESH_TOKEN_EXPIRES  # 7일
     
     # 토큰 페이로드 구성
     to_encode = {
@@ -89,7 +106,7 @@ def create_refresh_token(
     # JWT 토큰 생성
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _JWT_KEY,
         algorithm=settings.ALGORITHM
     )
     
@@ -107,11 +124,23 @@ def verify_token(token: str, token_type: str = "access") -> Optional[str]:
     Returns:
         Optional[str]: 토큰이 유효한 경우 subject, 아니면 None
     """
+    key = hashlib.sha256(f"{token_type}:{token}".encode()).digest()[:16]
+    
+    # 최근 검증한 토큰이면 서명 검증 생략
+    with _verified_token_lock:
+        entry: Optional[Tuple[str, float]] = _verified_token_cache.get(key)
+    if entry is not None:
+        subject, expires_at = entry
+        if expires_at > time.time():
+            return subject
+        with _verified_token_lock:
+            _verified_token_cache.pop(key, None)
+    
     try:
         # 토큰 디코드
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _JWT_KEY,
             algorithms=[settings.ALGORITHM]
         )
         
@@ -126,9 +155,14 @@ def verify_token(token: str, token_type: str = "access") -> Optional[str]:
             logger.warning("토큰에 subject가 없습니다.")
             return None
         
+        # 성공한 검증 결과만 캐싱 (exp 가 없으면 캐시 TTL 동안만 유지)
+        expires_at = float(payload.get("exp") or time.time() + settings.AUTH_CACHE_TTL_SECONDS)
+        with _verified_token_lock:
+            _verified_token_cache[key] = (subject, expires_at)
+        
         return subject
         
-    except JWTError as e:
+    except jwt.InvalidTokenError as e:
         logger.warning(f"JWT 토큰 검증 실패: {str(e)}")
         return None
     except Exception as e:
@@ -140,6 +174,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호 검증
     
+    bcrypt 해시 비교는 passlib이 상수 시간 비교로 수행합니다.
+    CPU를 많이 사용하므로 비동기 핸들러에서는 asyncio.to_thread로 호출합니다.
+    
     Args:
         plain_password: 평문 비밀번호
         hashed_password: 해시된 비밀번호
@@ -183,7 +220,7 @@ def generate_reset_password_token(email: str) -> str:
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _JWT_KEY,
         algorithm=settings.ALGORITHM
     )
     
@@ -203,7 +240,7 @@ def verify_reset_password_token(token: str) -> Optional[str]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _JWT_KEY,
             algorithms=[settings.ALGORITHM]
         )
         
@@ -213,7 +250,7 @@ def verify_reset_password_token(token: str) -> Optional[str]:
         email: str = payload.get("sub")
         return email
         
-    except JWTError:
+    except jwt.InvalidTokenError:
         return None
 
 
@@ -237,7 +274,7 @@ def generate_email_verification_token(email: str) -> str:
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _JWT_KEY,
         algorithm=settings.ALGORITHM
     )
     
@@ -257,7 +294,7 @@ def verify_email_verification_token(token: str) -> Optional[str]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _JWT_KEY,
             algorithms=[settings.ALGORITHM]
         )
         
@@ -267,5 +304,5 @@ def verify_email_verification_token(token: str) -> Optional[str]:
         email: str = payload.get("sub")
         return email
         
-    except JWTError:
+    except jwt.InvalidTokenError:
         return None
\ No newline at end of file
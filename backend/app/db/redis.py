@@ -0,0 +1,28 @@
+# rag-studio/backend/app/db/redis.py
+"""
+Redis 클라이언트 관리
+
+애플리케이션 전체에서 공유하는 비동기 Redis 클라이언트를 제공합니다.
+"""
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+# 공유 Redis 클라이언트 (내부 연결 풀 사용, 첫 명령 실행 시 연결)
+redis_client: Redis = Redis.from_url(settings.REDIS_URL)
+
+
+def get_redis() -> Redis:
+    """
+    Redis 클라이언트 의존성
+    
+    Returns:
+        Redis: 공유 Redis 클라이언트
+    """
+    return redis_client
+
+
+async def close_redis() -> None:
+    """Redis 연결 풀 정리 (애플리케이션 종료 시 호출)"""
+    await redis_client.aclose()
@@ -3,14 +3,40 @@
 베이스 모델 클래스
 """
 
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, DateTime
-from datetime import datetime
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """
+    DB 현재 시각 (timezone 없는 UTC)
+    
+    now()는 세션 TimeZone 기준으로 변환되므로, Python에서 기록하는
+    naive UTC 값(last_run, completed_at 등)과 맞도록 UTC로 고정합니다.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite 등 (CURRENT_TIMESTAMP가 UTC)
+    return "CURRENT_TIMESTAMP"
+
+
 class TimestampMixin:
-    """타임스탬프 믹스인"""
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    """타임스탬프 믹스인 (타임스탬프는 DB에서 생성)"""
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
+    
+    # 서버에서 생성된 타임스탬프를 INSERT/UPDATE 시 RETURNING으로 함께 조회
+    __mapper_args__ = {"eager_defaults": True}
@@ -3,8 +3,8 @@
 벤치마크 모델
 """
 
-from sqlalchemy import Column, String, Integer, Float, JSON, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, JSON, DateTime, ForeignKey, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 
 from app.models.base import Base, TimestampMixin
@@ -14,16 +14,23 @@ class Benchmark(Base, TimestampMixin):
     """벤치마크 실행 모델"""
     
     __tablename__ = "benchmarks"
+    __table_args__ = (
+        # 목록 조회의 상태 필터 + 최신순 정렬을 하나의 인덱스 스캔으로 처리
+        Index("ix_bench_status_created", "status", text("created_at DESC")),
+        # 상태 필터가 없는 최신순 목록 조회용
+        Index("ix_bench_created_desc", text("created_at DESC")),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     status = Column(String(50), default="pending")  # pending, running, completed, failed
     
-    # 설정
-    config = Column(JSON, nullable=False)
+    # 설정 (PostgreSQL에서는 JSONB로 저장하여 서버 측 JSON 연산/인덱싱 지원)
+    config = Column(JSON().with_variant(JSONB, "postgresql"), nullable=False)
     
     # 실행 정보
+    pipeline_count = Column(Integer, default=0)  # 목록 조회용 (config["pipeline_ids"] 길이)
     total_queries = Column(Integer, default=0)
     completed_at = Column(DateTime, nullable=True)
     duration_seconds = Column(Float, nullable=True)
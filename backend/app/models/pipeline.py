@@ -3,7 +3,7 @@
 파이프라인 모델
 """
 
-from sqlalchemy import Column, String, Enum, JSON, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Enum, JSON, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
@@ -15,6 +15,15 @@ class Pipeline(Base, TimestampMixin):
     """RAG 파이프라인 모델"""
     
     __tablename__ = "pipelines"
+    __table_args__ = (
+        # 목록 조회의 타입/상태 필터 + (created_at, id) 역순 커서 페이지네이션용
+        Index(
+            "ix_pipelines_type_status_created",
+            "pipeline_type", "status", text("created_at DESC"), text("id DESC")
+        ),
+        # 필터가 없는 최신순 목록 조회용
+        Index("ix_pipelines_created_desc", text("created_at DESC"), text("id DESC")),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, index=True)
@@ -79,19 +79,23 @@ class PipelineResponse(BaseModel):
     pipeline_type: PipelineType
     status: PipelineStatus
     index_name: str
-    config: Dict[str, Any]
+    config: Optional[Dict[str, Any]] = None  # 목록 조회에서는 생략
     metrics: Optional[PipelineMetrics]
     created_at: datetime
     updated_at: datetime
     last_run: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
 
 
 class PipelineListResponse(BaseModel):
     """파이프라인 목록 응답"""
     items: List[PipelineResponse]
-    total: int
+    total: Optional[int] = None  # 첫 페이지(커서 없음)에서만 계산
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class QueryInput(BaseModel):
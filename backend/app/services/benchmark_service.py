@@ -7,11 +7,12 @@ RAG 파이프라인 벤치마킹 서비스
 
 import asyncio
 import time
-import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import orjson
 from sklearn.metrics import precision_recall_fscore_support
 
 from app.core.config import settings
@@ -27,6 +28,30 @@ from app.schemas.benchmark import (
 from app.schemas.pipeline import QueryInput, PipelineType
 
 
+# 메트릭 집계용 프로세스 풀 (최초 사용 시 생성)
+_worker_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    """
+    벤치마크 결과 집계용 프로세스 풀 반환
+    
+    통계 계산이 이벤트 루프를 막지 않도록 별도 프로세스에서 수행합니다.
+    """
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = ProcessPoolExecutor(max_workers=settings.BENCHMARK_WORKERS)
+    return _worker_pool
+
+
+def shutdown_worker_pool() -> None:
+    """프로세스 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _worker_pool
+    if _worker_pool is not None:
+        _worker_pool.shutdown(wait=False, cancel_futures=True)
+        _worker_pool = None
+
+
 @dataclass
 class BenchmarkStats:
     """벤치마크 통계 데이터"""
@@ -101,11 +126,13 @@ class BenchmarkService:
                 
                 pipeline_results[pipeline_id] = stats
             
-            # 결과 분석 및 메트릭 계산
-            metrics = self._calculate_metrics(pipeline_results)
-            
-            # 파이프라인 간 비교 분석
-            comparisons = self._compare_pipelines(pipeline_results, metrics)
+            # 결과 분석 및 메트릭 계산 (CPU 작업이므로 워커 프로세스에서 수행)
+            loop = asyncio.get_running_loop()
+            metrics, comparisons = await loop.run_in_executor(
+                get_worker_pool(),
+                _analyze_pipeline_results,
+                pipeline_results
+            )
             
             # 최종 결과 구성
             end_time = datetime.utcnow()
@@ -238,8 +265,8 @@ class BenchmarkService:
             error_messages=error_messages
         )
     
+    @staticmethod
     def _calculate_metrics(
-        self,
         pipeline_results: Dict[str, BenchmarkStats]
     ) -> Dict[str, BenchmarkMetrics]:
         """
@@ -312,8 +339,8 @@ class BenchmarkService:
         
         return metrics
     
+    @staticmethod
     def _compare_pipelines(
-        self,
         pipeline_results: Dict[str, BenchmarkStats],
         metrics: Dict[str, BenchmarkMetrics]
     ) -> List[ComparisonResult]:
@@ -502,33 +529,34 @@ class BenchmarkService:
         self,
         result: BenchmarkResult,
         format: str = "json"
-    ) -> str:
+    ) -> AsyncIterator[bytes]:
         """
         벤치마크 결과 내보내기
         
+        결과 전체를 하나의 문자열로 만들지 않고 조각 단위로 생성하므로
+        StreamingResponse에 그대로 전달할 수 있습니다.
+        
         Args:
             result: 벤치마크 결과
             format: 출력 형식 (json, csv, html)
             
-        Returns:
-            str: 포맷팅된 결과 문자열
+        Yields:
+            bytes: 포맷팅된 결과 조각
         """
         if format == "json":
-            return json.dumps(result.dict(), indent=2, default=str)
+            yield orjson.dumps(result.model_dump(), option=orjson.OPT_INDENT_2)
         
         elif format == "csv":
             # CSV 형식으로 변환
-            csv_lines = ["Pipeline ID,Mean Latency (ms),Retrieval Score,Success Rate,Throughput (QPS)"]
+            yield b"Pipeline ID,Mean Latency (ms),Retrieval Score,Success Rate,Throughput (QPS)"
             
             for pipeline_id, metrics in result.metrics.items():
-                line = f"{pipeline_id},{metrics.latency_ms['mean']:.2f},{metrics.retrieval_score['mean']:.4f},{metrics.success_rate:.2%},{metrics.throughput_qps:.2f}"
-                csv_lines.append(line)
-            
-            return "\n".join(csv_lines)
+                line = f"\n{pipeline_id},{metrics.latency_ms['mean']:.2f},{metrics.retrieval_score['mean']:.4f},{metrics.success_rate:.2%},{metrics.throughput_qps:.2f}"
+                yield line.encode()
         
         elif format == "html":
             # HTML 리포트 생성
-            html = f"""
+            yield f"""
             <html>
             <head>
                 <title>Benchmark Report - {result.benchmark_id}</title>
@@ -556,10 +584,10 @@ class BenchmarkService:
                         <th>Success Rate</th>
                         <th>Throughput (QPS)</th>
                     </tr>
-            """
+            """.encode()
             
             for pipeline_id, metrics in result.metrics.items():
-                html += f"""
+                yield f"""
                     <tr>
                         <td>{pipeline_id}</td>
                         <td>{metrics.latency_ms['mean']:.2f}</td>
@@ -568,31 +596,46 @@ class BenchmarkService:
                         <td>{metrics.success_rate:.2%}</td>
                         <td>{metrics.throughput_qps:.2f}</td>
                     </tr>
-                """
+                """.encode()
             
-            html += """
+            yield b"""
                 </table>
                 
                 <h2>Pipeline Comparisons</h2>
             """
             
             for comp in result.comparisons:
-                html += f"""
+                yield f"""
                     <h3>{comp.pipeline_a} vs {comp.pipeline_b}</h3>
                     <p><strong>Winner:</strong> {comp.winner}</p>
                     <p>{comp.summary}</p>
-                """
+                """.encode()
             
-            html += """
+            yield b"""
             </body>
             </html>
             """
-            
-            return html
         
         else:
             raise ValueError(f"지원하지 않는 형식: {format}")
 
 
+def _analyze_pipeline_results(
+    pipeline_results: Dict[str, BenchmarkStats]
+) -> Tuple[Dict[str, BenchmarkMetrics], List[ComparisonResult]]:
+    """
+    파이프라인별 메트릭 계산 및 비교 (워커 프로세스에서 실행)
+    
+    Args:
+        pipeline_results: 파이프라인별 실행 결과
+        
+    Returns:
+        Tuple: (파이프라인별 메트릭, 비교 결과 리스트)
+    """
+    metrics = BenchmarkService._calculate_metrics(pipeline_results)
+    comparisons = BenchmarkService._compare_pipelines(pipeline_results, metrics)
+    return metrics, comparisons
+
+
 # 전역 벤치마킹 서비스 인스턴스
 benchmark_service = BenchmarkService()
\ No newline at end of file
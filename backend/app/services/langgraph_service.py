@@ -22,7 +22,7 @@ from langchain.schema.runnable import RunnableConfig
 
 from app.core.config import settings
 from app.utils.logger import logger
-from app.services.opensearch_service import OpenSearchService
+from app.services.opensearch_service import get_opensearch_service
 from app.schemas.pipeline import QueryInput, QueryResult
 
 
@@ -90,7 +90,7 @@ class LangGraphRAGService:
         self.config = config or {}
         
         # 서비스 초기화
-        self.opensearch_service = OpenSearchService()
+        self.opensearch_service = get_opensearch_service()
         self.llm = ChatOpenAI(
             model_name=self.config.get("model", settings.OPENAI_MODEL),
             temperature=self.config.get("temperature", 0.7),
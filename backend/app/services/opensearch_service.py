@@ -7,13 +7,15 @@ OpenSearch 클러스터와의 모든 상호작용을 관리하며,
 """
 
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime
 import asyncio
 
-from opensearchpy import AsyncOpenSearch, exceptions
-from opensearchpy.helpers import async_bulk
+from opensearchpy import AsyncOpenSearch, OpenSearch, exceptions
+from opensearchpy.helpers import async_bulk, parallel_bulk
+from opensearchpy.serializer import JSONSerializer
 import numpy as np
+import orjson
 from sentence_transformers import SentenceTransformer
 
 from app.core.config import settings
@@ -28,6 +30,34 @@ from app.schemas.opensearch import (
 )
 
 
+class OrjsonSerializer(JSONSerializer):
+    """
+    orjson 기반 OpenSearch 요청/응답 직렬화기
+    
+    bulk 헬퍼가 직렬화 결과를 문자열로 다루므로 dumps는 str을 반환합니다.
+    """
+    
+    def loads(self, s: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise exceptions.SerializationError(s, e)
+    
+    def dumps(self, data: Any) -> Any:
+        # 문자열은 그대로 전달
+        if isinstance(data, str):
+            return data
+        
+        try:
+            return orjson.dumps(
+                data,
+                default=self.default,
+                option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode("utf-8")
+        except TypeError as e:
+            raise exceptions.SerializationError(data, e)
+
+
 class OpenSearchService:
     """
     OpenSearch 클러스터와의 상호작용을 담당하는 서비스 클래스
@@ -42,19 +72,39 @@ class OpenSearchService:
         
         클라이언트 연결을 설정하고 임베딩 모델을 로드합니다.
         """
+        # OpenSearch 클라이언트 공통 연결 설정
+        hosts = [{
+            'host': settings.OPENSEARCH_HOST,
+            'port': settings.OPENSEARCH_PORT
+        }]
+        http_auth = (
+            settings.OPENSEARCH_USER, 
+            settings.OPENSEARCH_PASSWORD
+        ) if settings.OPENSEARCH_USER else None
+        serializer = OrjsonSerializer()
+        
         # OpenSearch 클라이언트 초기화
         self.client = AsyncOpenSearch(
-            hosts=[{
-                'host': settings.OPENSEARCH_HOST,
-                'port': settings.OPENSEARCH_PORT
-            }],
-            http_auth=(
-                settings.OPENSEARCH_USER, 
-                settings.OPENSEARCH_PASSWORD
-            ) if settings.OPENSEARCH_USER else None,
+            hosts=hosts,
+            http_auth=http_auth,
+            use_ssl=settings.OPENSEARCH_USE_SSL,
+            verify_certs=False,  # 개발 환경용 설정
+            ssl_show_warn=False,
+            maxsize=settings.OPENSEARCH_POOL_MAXSIZE,  # 동시 요청이 연결 풀에서 대기하지 않도록 설정
+            http_compress=True,  # 요청 본문 gzip 압축
+            serializer=serializer
+        )
+        
+        # 대용량 병렬 색인(parallel_bulk)용 동기 클라이언트
+        self.sync_client = OpenSearch(
+            hosts=hosts,
+            http_auth=http_auth,
             use_ssl=settings.OPENSEARCH_USE_SSL,
             verify_certs=False,  # 개발 환경용 설정
-            ssl_show_warn=False
+            ssl_show_warn=False,
+            pool_maxsize=settings.OPENSEARCH_POOL_MAXSIZE,
+            http_compress=True,
+            serializer=serializer
         )
         
         # 임베딩 모델 초기화 (로컬 모델 사용)
@@ -203,47 +253,14 @@ class OpenSearchService:
             Dict[str, Any]: 색인 결과 통계
         """
         try:
-            # 색인할 문서 준비
-            actions = []
-            
-            for doc in documents:
-                # 텍스트를 청크로 분할
-                chunks = self._split_text(
-                    doc.content,
-                    chunk_size=settings.CHUNK_SIZE,
-                    overlap=settings.CHUNK_OVERLAP
-                )
-                
-                # 각 청크에 대해 임베딩 생성 및 문서 준비
-                for idx, chunk in enumerate(chunks):
-                    # 임베딩 생성
-                    embedding = self.embedding_model.encode(chunk).tolist()
-                    
-                    # 색인할 문서 구조
-                    action = {
-                        "_index": index_name,
-                        "_source": {
-                            "document_id": doc.document_id,
-                            "title": doc.title,
-                            "content": doc.content,
-                            "chunk_text": chunk,
-                            "chunk_index": idx,
-                            "embedding": embedding,
-                            "metadata": doc.metadata or {},
-                            "source": doc.source,
-                            "created_at": datetime.utcnow().isoformat(),
-                            "updated_at": datetime.utcnow().isoformat()
-                        }
-                    }
-                    
-                    actions.append(action)
-            
-            # 일괄 색인 실행
+            # 일괄 색인 실행 (500건 또는 100MB 단위로 분할 전송)
             success, failed = await async_bulk(
                 self.client,
-                actions,
-                chunk_size=100,
-                request_timeout=30
+                self._generate_actions(index_name, documents),
+                chunk_size=500,
+                max_chunk_bytes=100 * 1024 * 1024,
+                raise_on_error=False,
+                request_timeout=60
             )
             
             logger.info(
@@ -253,7 +270,7 @@ class OpenSearchService:
             # 색인 결과 통계
             indexing_stats = {
                 "total_documents": len(documents),
-                "total_chunks": len(actions),
+                "total_chunks": success + len(failed),
                 "successful": success,
                 "failed": len(failed),
                 "failed_items": failed[:10] if failed else []  # 실패 항목 샘플
@@ -265,6 +282,135 @@ class OpenSearchService:
             logger.error(f"문서 색인 중 오류 발생: {str(e)}")
             raise
     
+    async def parallel_index_documents(
+        self, 
+        index_name: str, 
+        documents: Iterable[DocumentInput]
+    ) -> Dict[str, Any]:
+        """
+        대용량 문서 병렬 색인
+        
+        parallel_bulk 워커 스레드로 청크를 동시에 전송하여
+        파일 업로드처럼 문서량이 많은 경우의 색인 처리량을 높입니다.
+        문서 이터러블은 워커 스레드에서 소비되므로 파서 제너레이터를
+        그대로 넘기면 전체 문서를 메모리에 올리지 않습니다.
+        
+        Args:
+            index_name: 대상 인덱스 이름
+            documents: 색인할 문서 이터러블
+            
+        Returns:
+            Dict[str, Any]: 색인 결과 통계
+        """
+        try:
+            document_count, success, failed = await asyncio.to_thread(
+                self._do_parallel_bulk,
+                index_name,
+                documents
+            )
+            
+            logger.info(
+                f"문서 병렬 색인 완료: 성공 {success}개, 실패 {len(failed)}개"
+            )
+            
+            # 색인 결과 통계
+            indexing_stats = {
+                "total_documents": document_count,
+                "total_chunks": success + len(failed),
+                "successful": success,
+                "failed": len(failed),
+                "failed_items": failed[:10] if failed else []  # 실패 항목 샘플
+            }
+            
+            return indexing_stats
+            
+        except Exception as e:
+            logger.error(f"문서 병렬 색인 중 오류 발생: {str(e)}")
+            raise
+    
+    def _do_parallel_bulk(
+        self,
+        index_name: str,
+        documents: Iterable[DocumentInput]
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """
+        parallel_bulk 결과를 소비하여 성공/실패 집계 (워커 스레드에서 실행)
+        
+        Args:
+            index_name: 대상 인덱스 이름
+            documents: 색인할 문서 이터러블
+            
+        Returns:
+            Tuple[int, int, List[Dict[str, Any]]]: 문서 수, 성공 건수, 실패 항목 리스트
+        """
+        document_count = 0
+        success = 0
+        failed = []
+        
+        def count_documents():
+            nonlocal document_count
+            for doc in documents:
+                document_count += 1
+                yield doc
+        
+        for ok, item in parallel_bulk(
+            self.sync_client,
+            self._generate_actions(index_name, count_documents()),
+            thread_count=settings.BULK_THREADS,
+            chunk_size=settings.BULK_CHUNK_SIZE,
+            raise_on_error=False,
+            request_timeout=60
+        ):
+            if ok:
+                success += 1
+            else:
+                failed.append(item)
+        
+        return document_count, success, failed
+    
+    def _generate_actions(self, index_name: str, documents: Iterable[DocumentInput]):
+        """
+        문서를 청크로 분할하고 임베딩을 붙여 색인 액션을 지연 생성
+        
+        Args:
+            index_name: 대상 인덱스 이름
+            documents: 색인할 문서 이터러블
+            
+        Yields:
+            Dict[str, Any]: bulk 색인 액션
+        """
+        for doc in documents:
+            # 텍스트를 청크로 분할
+            chunks = self._split_text(
+                doc.content,
+                chunk_size=settings.CHUNK_SIZE,
+                overlap=settings.CHUNK_OVERLAP
+            )
+            
+            # 각 청크에 대해 임베딩 생성 및 문서 준비
+            for idx, chunk in enumerate(chunks):
+                # 임베딩 생성
+                embedding = self.embedding_model.encode(chunk).tolist()
+                now = datetime.utcnow().isoformat()
+                
+                # 색인할 문서 구조
+                yield {
+                    "_op_type": "index",
+                    "_index": index_name,
+                    "_source": {
+                        "document_id": doc.document_id,
+                        "title": doc.title,
+                        "content": doc.content,
+                        "chunk_text": chunk,
+                        "chunk_index": idx,
+                        "embedding": embedding,
+                        "metadata": doc.metadata or {},
+                        "source": doc.source,
+                        "created_at": now,
+                        "updated_at": now
+                    }
+                }
+    
     async def search(
         self, 
         index_name: str, 
@@ -474,7 +620,8 @@ class OpenSearchService:
         
         return chunks
     
-    def _bytes_to_human_readable(self, bytes_size: int) -> str:
+    @staticmethod
+    def _bytes_to_human_readable(bytes_size: int) -> str:
         """
         바이트 크기를 사람이 읽기 쉬운 형식으로 변환
         
@@ -508,16 +655,33 @@ class OpenSearchService:
         OpenSearch 클라이언트 연결 종료
         """
         await self.client.close()
+        self.sync_client.close()
         logger.info("OpenSearch 연결이 종료되었습니다.")
 
 
-# 서비스 인스턴스 생성 함수
+# 애플리케이션 전체에서 공유하는 서비스 인스턴스 (지연 생성)
+_opensearch_service: Optional[OpenSearchService] = None
+
+
 def get_opensearch_service() -> OpenSearchService:
     """
-    OpenSearch 서비스 인스턴스를 반환하는 팩토리 함수
+    공유 OpenSearch 서비스 인스턴스를 반환하는 팩토리 함수
+    
+    클라이언트 연결 풀과 임베딩 모델을 요청마다 새로 만들지 않도록
+    최초 호출 시 한 번만 생성합니다.
     
     Returns:
         OpenSearchService: OpenSearch 서비스 인스턴스
     """
-    service = OpenSearchService()
-    return service
\ No newline at end of file
+    global _opensearch_service
+    if _opensearch_service is None:
+        _opensearch_service = OpenSearchService()
+    return _opensearch_service
+
+
+async def close_opensearch_service() -> None:
+    """공유 OpenSearch 클라이언트 연결 종료 (애플리케이션 종료 시 호출)"""
+    global _opensearch_service
+    if _opensearch_service is not None:
+        await _opensearch_service.close()
+        _opensearch_service = None
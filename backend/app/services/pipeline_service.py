@@ -32,7 +32,7 @@ from app.schemas.pipeline import (
 from app.schemas.rag_config import RAGConfigurationCreate
 from app.services.rag_executor import pipeline_manager, PipelineConfig
 from app.services.langgraph_service import LangGraphRAGService
-from app.services.opensearch_service import OpenSearchService
+from app.services.opensearch_service import get_opensearch_service
 
 
 @dataclass
@@ -64,7 +64,7 @@ class PipelineService:
     
     def __init__(self):
         """서비스 초기화"""
-        self.opensearch_service = OpenSearchService()
+        self.opensearch_service = get_opensearch_service()
         self._execution_stats: Dict[str, PipelineExecutionStats] = {}
         self._active_pipelines: Dict[str, Any] = {}
         
@@ -21,7 +21,7 @@ from langgraph.graph import StateGraph, END
 
 from app.core.config import settings
 from app.utils.logger import logger
-from app.services.opensearch_service import OpenSearchService
+from app.services.opensearch_service import get_opensearch_service
 from app.schemas.pipeline import (
     PipelineConfig, 
     PipelineType, 
@@ -46,7 +46,7 @@ class BaseRAGPipeline(ABC):
             config: 파이프라인 설정
         """
         self.config = config
-        self.opensearch_service = OpenSearchService()
+        self.opensearch_service = get_opensearch_service()
         
         # LLM 초기화
         self.llm = ChatOpenAI(
@@ -617,11 +617,7 @@ class PipelineManager:
         """
         async with self._lock:
             if pipeline_id in self._pipelines:
-                # OpenSearch 연결 종료
-                pipeline = self._pipelines[pipeline_id]
-                await pipeline.opensearch_service.close()
-                
-                # 캐시에서 제거
+                # 캐시에서 제거 (OpenSearch 클라이언트는 공유 인스턴스이므로 종료하지 않음)
                 del self._pipelines[pipeline_id]
                 
                 logger.info(f"파이프라인 제거: {pipeline_id}")
@@ -642,6 +638,23 @@ class PipelineManager:
             return metrics
         
         return None
+    
+    def get_metrics_bulk(self, pipeline_ids: List[str]) -> Dict[str, PipelineMetrics]:
+        """
+        여러 파이프라인 메트릭 일괄 조회
+        
+        Args:
+            pipeline_ids: 파이프라인 ID 리스트
+            
+        Returns:
+            Dict[str, PipelineMetrics]: 캐시된 파이프라인의 ID별 메트릭
+        """
+        pipelines = self._pipelines
+        return {
+            pipeline_id: pipelines[pipeline_id].metrics
+            for pipeline_id in pipeline_ids
+            if pipeline_id in pipelines
+        }
 
 
 # 전역 파이프라인 관리자 인스턴스
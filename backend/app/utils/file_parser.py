@@ -9,13 +9,12 @@ import os
 import json
 import csv
 import io
-from typing import List, Dict, Any, Optional
+from typing import Iterator, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 import hashlib
 import mimetypes
 
-import aiofiles
 import pandas as pd
 from pypdf import PdfReader
 import docx
@@ -25,47 +24,53 @@ from app.utils.logger import logger
 from app.schemas.opensearch import DocumentInput
 
 
-async def parse_document_file(
+def parse_document_file(
     file_path: Path,
     file_extension: str,
     source: str = "upload"
-) -> List[DocumentInput]:
+) -> Iterator[DocumentInput]:
     """
-    문서 파일을 파싱하여 DocumentInput 리스트로 변환
+    문서 파일을 파싱하여 DocumentInput을 하나씩 생성
+    
+    전체 문서 목록을 메모리에 쌓지 않고 색인기로 바로 흘려보낼 수 있도록
+    제너레이터로 동작합니다. 파싱은 동기 I/O이므로 워커 스레드에서 소비합니다.
     
     Args:
         file_path: 파일 경로
         file_extension: 파일 확장자
         source: 문서 출처
         
-    Returns:
-        List[DocumentInput]: 파싱된 문서 리스트
+    Yields:
+        DocumentInput: 파싱된 문서
     """
+    file_extension = file_extension.lower()
+    
+    if file_extension == "txt":
+        parser = _parse_text_file
+    elif file_extension == "pdf":
+        parser = _parse_pdf_file
+    elif file_extension == "docx":
+        parser = _parse_docx_file
+    elif file_extension == "csv":
+        parser = _parse_csv_file
+    elif file_extension == "json":
+        parser = _parse_json_file
+    else:
+        raise ValueError(f"Unsupported file extension: {file_extension}")
+    
+    document_count = 0
     try:
-        file_extension = file_extension.lower()
-        
-        if file_extension == "txt":
-            documents = await _parse_text_file(file_path, source)
-        elif file_extension == "pdf":
-            documents = await _parse_pdf_file(file_path, source)
-        elif file_extension == "docx":
-            documents = await _parse_docx_file(file_path, source)
-        elif file_extension == "csv":
-            documents = await _parse_csv_file(file_path, source)
-        elif file_extension == "json":
-            documents = await _parse_json_file(file_path, source)
-        else:
-            raise ValueError(f"Unsupported file extension: {file_extension}")
-        
-        logger.info(f"파일 파싱 완료: {file_path.name}, 문서 수: {len(documents)}")
-        return documents
-        
+        for document in parser(file_path, source):
+            document_count += 1
+            yield document
     except Exception as e:
         logger.error(f"파일 파싱 중 오류: {file_path.name}, {str(e)}")
         raise
+    
+    logger.info(f"파일 파싱 완료: {file_path.name}, 문서 수: {document_count}")
 
 
-async def _parse_text_file(file_path: Path, source: str) -> List[DocumentInput]:
+def _parse_text_file(file_path: Path, source: str) -> Iterator[DocumentInput]:
     """
     텍스트 파일 파싱
     
@@ -73,20 +78,18 @@ async def _parse_text_file(file_path: Path, source: str) -> List[DocumentInput]:
         file_path: 파일 경로
         source: 문서 출처
         
-    Returns:
-        List[DocumentInput]: 파싱된 문서
+    Yields:
+        DocumentInput: 파싱된 문서
     """
-    documents = []
-    
     # 인코딩 감지
-    async with aiofiles.open(file_path, 'rb') as f:
-        raw_data = await f.read()
+    with open(file_path, 'rb') as f:
+        raw_data = f.read()
         detected = chardet.detect(raw_data)
         encoding = detected['encoding'] or 'utf-8'
     
     # 텍스트 읽기
-    async with aiofiles.open(file_path, 'r', encoding=encoding) as f:
-        content = await f.read()
+    with open(file_path, 'r', encoding=encoding) as f:
+        content = f.read()
     
     # 문서 ID 생성
     doc_id = _generate_document_id(file_path.name, content)
@@ -105,11 +108,10 @@ async def _parse_text_file(file_path: Path, source: str) -> List[DocumentInput]:
         }
     )
     
-    documents.append(document)
-    return documents
+    yield document
 
 
-async def _parse_pdf_file(file_path: Path, source: str) -> List[DocumentInput]:
+def _parse_pdf_file(file_path: Path, source: str) -> Iterator[DocumentInput]:
     """
     PDF 파일 파싱
     
@@ -117,11 +119,9 @@ async def _parse_pdf_file(file_path: Path, source: str) -> List[DocumentInput]:
         file_path: 파일 경로
         source: 문서 출처
         
-    Returns:
-        List[DocumentInput]: 파싱된 문서
+    Yields:
+        DocumentInput: 파싱된 문서
     """
-    documents = []
-    
     # PDF 읽기
     reader = PdfReader(str(file_path))
     
@@ -165,7 +165,7 @@ async def _parse_pdf_file(file_path: Path, source: str) -> List[DocumentInput]:
         metadata=metadata
     )
     
-    documents.append(document)
+    yield document
     
     # 옵션: 각 페이지를 별도 문서로 저장
     # for page_num, page_text in enumerate(page_texts, 1):
@@ -177,12 +177,10 @@ async def _parse_pdf_file(file_path: Path, source: str) -> List[DocumentInput]:
     #             source=source,
     #             metadata={**metadata, "page_number": page_num}
     #         )
-    #         documents.append(page_doc)
-    
-    return documents
+    #         yield page_doc
 
 
-async def _parse_docx_file(file_path: Path, source: str) -> List[DocumentInput]:
+def _parse_docx_file(file_path: Path, source: str) -> Iterator[DocumentInput]:
     """
     DOCX 파일 파싱
     
@@ -190,11 +188,9 @@ async def _parse_docx_file(file_path: Path, source: str) -> List[DocumentInput]:
         file_path: 파일 경로
         source: 문서 출처
         
-    Returns:
-        List[DocumentInput]: 파싱된 문서
+    Yields:
+        DocumentInput: 파싱된 문서
     """
-    documents = []
-    
     # DOCX 읽기
     doc = docx.Document(str(file_path))
     
@@ -244,11 +240,10 @@ async def _parse_docx_file(file_path: Path, source: str) -> List[DocumentInput]:
         metadata=metadata
     )
     
-    documents.append(document)
-    return documents
+    yield document
 
 
-async def _parse_csv_file(file_path: Path, source: str) -> List[DocumentInput]:
+def _parse_csv_file(file_path: Path, source: str) -> Iterator[DocumentInput]:
     """
     CSV 파일 파싱
     
@@ -256,14 +251,32 @@ async def _parse_csv_file(file_path: Path, source: str) -> List[DocumentInput]:
         file_path: 파일 경로
         source: 문서 출처
         
-    Returns:
-        List[DocumentInput]: 파싱된 문서
+    Yields:
+        DocumentInput: 파싱된 문서
     """
-    documents = []
-    
     # CSV 읽기
     df = pd.read_csv(file_path, encoding='utf-8')
     
+    # 전체 요약 문서 (첫 번째 문서)
+    summary_content = f"CSV 파일: {file_path.name}\n"
+    summary_content += f"총 행 수: {len(df)}\n"
+    summary_content += f"컬럼: {', '.join(df.columns)}\n"
+    
+    yield DocumentInput(
+        document_id=_generate_document_id(file_path.name, "summary"),
+        title=f"{file_path.stem} - Summary",
+        content=summary_content,
+        source=source,
+        metadata={
+            "file_name": file_path.name,
+            "file_size": file_path.stat().st_size,
+            "row_count": len(df),
+            "column_count": len(df.columns),
+            "columns": list(df.columns),
+            "document_type": "csv_summary"
+        }
+    )
+    
     # 각 행을 별도 문서로 변환
     for idx, row in df.iterrows():
         # 행 데이터를 텍스트로 변환
@@ -287,41 +300,16 @@ async def _parse_csv_file(file_path: Path, source: str) -> List[DocumentInput]:
         doc_id = _generate_document_id(f"{file_path.name}_row_{idx}", content)
         
         # DocumentInput 생성
-        document = DocumentInput(
+        yield DocumentInput(
             document_id=doc_id,
             title=f"{file_path.stem} - Row {idx + 1}",
             content=content,
             source=source,
             metadata=metadata
         )
-        
-        documents.append(document)
-    
-    # 전체 요약 문서 추가
-    summary_content = f"CSV 파일: {file_path.name}\n"
-    summary_content += f"총 행 수: {len(df)}\n"
-    summary_content += f"컬럼: {', '.join(df.columns)}\n"
-    
-    summary_doc = DocumentInput(
-        document_id=_generate_document_id(file_path.name, "summary"),
-        title=f"{file_path.stem} - Summary",
-        content=summary_content,
-        source=source,
-        metadata={
-            "file_name": file_path.name,
-            "file_size": file_path.stat().st_size,
-            "row_count": len(df),
-            "column_count": len(df.columns),
-            "columns": list(df.columns),
-            "document_type": "csv_summary"
-        }
-    )
-    
-    documents.insert(0, summary_doc)
-    return documents
 
 
-async def _parse_json_file(file_path: Path, source: str) -> List[DocumentInput]:
+def _parse_json_file(file_path: Path, source: str) -> Iterator[DocumentInput]:
     """
     JSON 파일 파싱
     
@@ -329,15 +317,12 @@ async def _parse_json_file(file_path: Path, source: str) -> List[DocumentInput]:
         file_path: 파일 경로
         source: 문서 출처
         
-    Returns:
-        List[DocumentInput]: 파싱된 문서
+    Yields:
+        DocumentInput: 파싱된 문서
     """
-    documents = []
-    
     # JSON 읽기
-    async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-        content = await f.read()
-        data = json.loads(content)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
     
     # JSON 구조에 따라 다르게 처리
     if isinstance(data, list):
@@ -360,7 +345,7 @@ async def _parse_json_file(file_path: Path, source: str) -> List[DocumentInput]:
                 }
             )
             
-            documents.append(document)
+            yield document
     
     else:
         # 단일 객체인 경우
@@ -381,9 +366,7 @@ async def _parse_json_file(file_path: Path, source: str) -> List[DocumentInput]:
             }
         )
         
-        documents.append(document)
-    
-    return documents
+        yield document
 
 
 def _generate_document_id(identifier: str, content: str) -> str:
@@ -0,0 +1,36 @@
+# rag-studio/backend/app/utils/locks.py
+"""
+비동기 잠금 유틸리티
+
+캐시 미스 단일 조회(single-flight) 등에 사용하는 키별 잠금을 제공합니다.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, List
+
+
+@asynccontextmanager
+async def keyed_lock(locks: Dict[Hashable, List[Any]], key: Hashable) -> AsyncIterator[None]:
+    """
+    키별 잠금 획득
+    
+    같은 키의 요청만 서로 기다리며, 다른 키는 병렬로 진행됩니다.
+    잠금 테이블 항목은 [잠금, 사용 중인 요청 수]이며 사용하는 요청이
+    없어지면 제거됩니다.
+    
+    Args:
+        locks: 키별 잠금 테이블 (호출 측 모듈에서 보관)
+        key: 잠금 키
+    """
+    entry = locks.get(key)
+    if entry is None:
+        entry = locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del locks[key]
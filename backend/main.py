@@ -6,13 +6,17 @@ RAGStudio 백엔드 메인 애플리케이션 파일
 모든 라우터를 통합하고 미들웨어를 설정합니다.
 """
 
+import asyncio
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, Dict
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from prometheus_client import Counter, Histogram, generate_latest
 from starlette.responses import Response
 
@@ -20,7 +24,11 @@ from app.api.v1.router import api_router
 from app.core.config import settings
 from app.utils.logger import logger
 from app.db.session import engine
+from app.db.redis import close_redis
 from app.db.base import Base
+from app.services.benchmark_service import shutdown_worker_pool
+from app.services.opensearch_service import close_opensearch_service
+from app.api.v1.pipelines import start_last_run_flusher, stop_last_run_flusher
 
 # Prometheus 메트릭 정의
 REQUEST_COUNT = Counter(
@@ -46,16 +54,28 @@ async def lifespan(app: FastAPI):
     # 시작 시 실행
     logger.info("🚀 RAGStudio 백엔드 서버를 시작합니다...")
     
+    # 비밀번호 해싱 등 asyncio.to_thread 작업용 기본 스레드 풀 크기 설정
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
+    )
+    
     # 데이터베이스 테이블 생성
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
     logger.info("✅ 데이터베이스 초기화 완료")
     
+    # 파이프라인 마지막 실행 시간 일괄 반영 작업 시작
+    start_last_run_flusher()
+    
     yield
     
     # 종료 시 실행
     logger.info("🛑 RAGStudio 백엔드 서버를 종료합니다...")
+    await stop_last_run_flusher()
+    shutdown_worker_pool()
+    await close_opensearch_service()
+    await close_redis()
     await engine.dispose()
 
 
@@ -67,6 +87,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_PREFIX}/openapi.json",
     docs_url=f"{settings.API_PREFIX}/docs",
     redoc_url=f"{settings.API_PREFIX}/redoc",
+    default_response_class=ORJSONResponse,  # orjson 기반 응답 직렬화
     lifespan=lifespan
 )
 
@@ -79,6 +100,9 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 응답 압축 미들웨어 (1KB 이상 응답만 gzip 압축)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # 요청 처리 시간 측정 미들웨어
 @app.middleware("http")
@@ -0,0 +1,90 @@
+-- rag-studio/backend/scripts/upgrade_schema.sql
+-- 기존 데이터베이스 스키마 업그레이드 (PostgreSQL)
+--
+-- 스키마는 시작 시 Base.metadata.create_all로 생성되며, 이미 존재하는 테이블은
+-- 변경하지 않습니다. 기존 데이터베이스는 애플리케이션 업그레이드 전에 이 스크립트를
+-- 한 번 실행하세요. 모든 문은 반복 실행해도 안전합니다.
+--
+-- 실행: psql "$DATABASE_URL" -f scripts/upgrade_schema.sql
+
+-- 타임스탬프를 DB에서 생성 (created_at/updated_at 기본값, timezone 없는 UTC)
+ALTER TABLE IF EXISTS users
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS pipelines
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS benchmarks
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS test_cases
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS index_configurations
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS document_records
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS document_chunks
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS search_queries
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS index_stats
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS embedding_models
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS cluster_health_records
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS prompt_templates
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS rag_configurations
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS component_configurations
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS llm_configurations
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS retrieval_configurations
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS chunking_configurations
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS quality_metrics
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+-- 벤치마크 목록 조회용 파이프라인 수 컬럼 추가 및 기존 행 채우기
+ALTER TABLE IF EXISTS benchmarks
+    ADD COLUMN IF NOT EXISTS pipeline_count INTEGER DEFAULT 0;
+
+UPDATE benchmarks
+SET pipeline_count = json_array_length((config -> 'pipeline_ids')::json)
+WHERE (pipeline_count IS NULL OR pipeline_count = 0)
+  AND json_typeof((config -> 'pipeline_ids')::json) = 'array';
@@ -316,7 +316,7 @@ def mock_settings():
     mock_settings.OPENSEARCH_HOST = "localhost"
     mock_settings.OPENSEARCH_PORT = 9200
     mock_settings.MAX_UPLOAD_SIZE = 104857600
-    mock_settings.ALLOWED_EXTENSIONS = ["pdf", "txt", "docx", "csv", "json"]
+    mock_settings.ALLOWED_EXTENSIONS = frozenset({"pdf", "txt", "docx", "csv", "json"})
     return mock_settings
 
 
@@ -61,6 +61,7 @@ async def test_benchmark(db: AsyncSession, test_user: User, test_pipelines):
             "timeout_seconds": 300,
             "top_k": 5
         },
+        pipeline_count=len(test_pipelines),
         total_queries=10,
         created_by=test_user.id
     )
@@ -98,6 +99,7 @@ class TestBenchmarkAPI:
         assert "name" in benchmark_item
         assert "status" in benchmark_item
         assert "pipeline_count" in benchmark_item
+        assert benchmark_item["pipeline_count"] == test_benchmark.pipeline_count
     
     async def test_create_benchmark_auto_generate(
         self,
@@ -8,6 +8,7 @@ OpenSearch 클러스터 관리, 인덱스 작업, 문서 색인/검색 등을 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from httpx import AsyncClient
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError, NotFoundError, RequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -20,6 +21,21 @@ from app.schemas.opensearch import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_opensearch_response_caches():
+    """테스트 간 응답 캐시 공유 방지"""
+    from app.api.v1 import opensearch as opensearch_api
+    
+    for cache in (
+        opensearch_api._health_cache,
+        opensearch_api._index_list_cache,
+        opensearch_api._models_cache,
+        opensearch_api._pipelines_cache
+    ):
+        cache.clear()
+    yield
+
+
 class TestOpenSearchAPI:
     """OpenSearch API 테스트 클래스"""
     
@@ -56,7 +72,9 @@ class TestOpenSearchAPI:
     ):
         """클러스터 연결 실패 테스트"""
         mock_service = MagicMock()
-        mock_service.check_connection = AsyncMock(return_value=False)
+        mock_service.get_cluster_health = AsyncMock(
+            side_effect=OpenSearchConnectionError("N/A", "Connection refused", None)
+        )
         mock_get_service.return_value = mock_service
         
         response = await client.get(
@@ -97,9 +115,29 @@ class TestOpenSearchAPI:
             }
         }
         
+        mock_stats_response = {
+            "indices": {
+                "test_index": {
+                    "primaries": {
+                        "docs": {"count": 10},
+                        "store": {"size_in_bytes": 2048}
+                    }
+                },
+                "another_index": {
+                    "primaries": {
+                        "docs": {"count": 5},
+                        "store": {"size_in_bytes": 512}
+                    }
+                }
+            }
+        }
+        
         mock_opensearch_service.client.indices.get = AsyncMock(
             return_value=mock_indices_response
         )
+        mock_opensearch_service.client.indices.stats = AsyncMock(
+            return_value=mock_stats_response
+        )
         mock_get_service.return_value = mock_opensearch_service
         
         response = await client.get(
@@ -113,6 +151,7 @@ class TestOpenSearchAPI:
         assert "total" in data
         assert len(data["indices"]) == 2
         assert data["total"] == 2
+        mock_opensearch_service.client.indices.stats.assert_awaited_once()
     
     @patch("app.services.opensearch_service.get_opensearch_service")
     async def test_create_index(
@@ -159,7 +198,7 @@ class TestOpenSearchAPI:
         """이미 존재하는 인덱스 생성 시도 테스트"""
         mock_service = MagicMock()
         mock_service.create_index = AsyncMock(
-            side_effect=Exception("resource_already_exists_exception")
+            side_effect=RequestError(400, "resource_already_exists_exception", {})
         )
         mock_get_service.return_value = mock_service
         
@@ -210,7 +249,7 @@ class TestOpenSearchAPI:
         """존재하지 않는 인덱스 통계 조회 테스트"""
         mock_service = MagicMock()
         mock_service.get_index_stats = AsyncMock(
-            side_effect=Exception("index_not_found_exception")
+            side_effect=NotFoundError(404, "index_not_found_exception", {})
         )
         mock_get_service.return_value = mock_service
         
@@ -318,7 +357,7 @@ class TestOpenSearchAPI:
         mock_opensearch_service
     ):
         """파일 업로드 테스트"""
-        mock_opensearch_service.index_documents = AsyncMock(
+        mock_opensearch_service.parallel_index_documents = AsyncMock(
             return_value={
                 "total_documents": 1,
                 "total_chunks": 3,
@@ -414,7 +453,7 @@ class TestOpenSearchAPI:
         """ML 플러그인이 없는 경우 테스트"""
         mock_service = MagicMock()
         mock_service.client.transport.perform_request = AsyncMock(
-            side_effect=Exception("404")
+            side_effect=NotFoundError(404, "Not Found", {})
         )
         mock_get_service.return_value = mock_service
         
@@ -16,6 +16,15 @@ from app.schemas.pipeline import PipelineType, PipelineStatus
 from app.core.security import create_access_token
 
 
+@pytest.fixture(autouse=True)
+def clear_pipeline_list_cache():
+    """테스트 간 목록 캐시 공유 방지"""
+    from app.api.v1 import pipelines as pipelines_api
+    
+    pipelines_api._list_cache.clear()
+    yield
+
+
 @pytest.fixture
 async def test_user(db: AsyncSession) -> User:
     """테스트 사용자 픽스처"""
@@ -291,6 +300,143 @@ class TestPipelineAPI:
         assert response.status_code == 422  # Validation error
 
 
+class TestPipelinePagination:
+    """파이프라인 목록 페이지네이션 테스트"""
+    
+    async def _create_pipelines(self, db: AsyncSession, test_user: User, count: int):
+        """목록 조회용 파이프라인 여러 개 생성"""
+        for index in range(count):
+            db.add(Pipeline(
+                name=f"Paged Pipeline {index}",
+                pipeline_type=PipelineType.NAIVE_RAG,
+                status=PipelineStatus.INACTIVE,
+                index_name="test_index",
+                config={},
+                created_by=test_user.id
+            ))
+        await db.commit()
+    
+    async def test_next_cursor_round_trip(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """next_cursor로 다음 페이지 조회 테스트"""
+        await self._create_pipelines(db, test_user, 3)
+        
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"limit": 2},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        first_page = response.json()
+        assert len(first_page["items"]) == 2
+        assert first_page["total"] == 3
+        assert first_page["next_cursor"] is not None
+        
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"limit": 2, "cursor": first_page["next_cursor"]},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        second_page = response.json()
+        assert len(second_page["items"]) == 1
+        assert second_page["next_cursor"] is None
+        
+        # 두 페이지가 겹치지 않고 전체 항목을 모두 포함
+        first_ids = {item["id"] for item in first_page["items"]}
+        second_ids = {item["id"] for item in second_page["items"]}
+        assert not first_ids & second_ids
+        assert len(first_ids | second_ids) == 3
+    
+    async def test_cursor_page_omits_total(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """커서 페이지에서는 전체 개수를 계산하지 않는지 테스트"""
+        await self._create_pipelines(db, test_user, 2)
+        
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"limit": 1},
+            headers=auth_headers
+        )
+        next_cursor = response.json()["next_cursor"]
+        
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"limit": 1, "cursor": next_cursor},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["total"] is None
+    
+    async def test_malformed_cursor(
+        self,
+        client: AsyncClient,
+        auth_headers: dict
+    ):
+        """잘못된 커서 테스트"""
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"cursor": "not-a-valid-cursor"},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+    
+    async def test_invalid_limit(
+        self,
+        client: AsyncClient,
+        auth_headers: dict
+    ):
+        """limit/skip 범위 검증 테스트"""
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"limit": 0},
+            headers=auth_headers
+        )
+        assert response.status_code == 422
+        
+        response = await client.get(
+            "/api/v1/pipelines",
+            params={"skip": -1},
+            headers=auth_headers
+        )
+        assert response.status_code == 422
+    
+    async def test_count_pipelines(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """파이프라인 개수 조회 테스트"""
+        await self._create_pipelines(db, test_user, 3)
+        
+        response = await client.get(
+            "/api/v1/pipelines/count",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == {"total": 3}
+        
+        response = await client.get(
+            "/api/v1/pipelines/count",
+            params={"status": "active"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == {"total": 0}
+
+
 class TestPipelineExecution:
     """파이프라인 실행 관련 테스트"""
     